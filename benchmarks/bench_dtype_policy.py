@@ -0,0 +1,77 @@
+"""
+Per-stage memory and Parquet footprint of a synthetic panel run under the
+legacy (pandas default) and compact dtype policies.
+
+    python -m benchmarks.bench_dtype_policy --tickers 200 --bars 2520
+"""
+import argparse
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.bench_validation import synthetic_silver
+from src.backtest.equities_backtest import EquitiesBacktester
+from src.features.panel_features import build_panel_features
+from src.pipeline.dtype_policy import POLICIES
+from src.signals.equities_signals import EquitiesSignalEngine
+
+
+def stage_frames(df: pd.DataFrame, policy, out_dir: Path) -> dict:
+    """
+    Run Silver -> Features -> Signals -> Gold in memory, narrowing and
+    round-tripping each stage through Parquet like the pipeline does.
+    """
+    sizes = {}
+
+    def store(stage, frame):
+        frame = policy.apply(frame)
+        path = out_dir / f"{policy.name}_{stage}.parquet"
+        frame.to_parquet(path, index=False, **policy.parquet_options(frame))
+        sizes[stage] = (
+            frame.memory_usage(deep=True).sum() / 1024 ** 2,
+            path.stat().st_size / 1024 ** 2,
+        )
+        return pd.read_parquet(path)
+
+    silver = store("silver", df)
+    features = store("features", build_panel_features(silver))
+
+    engine = EquitiesSignalEngine(None, dtype_policy=policy.name)
+    signals = store("signals", engine.generate_signals(features))
+
+    backtester = EquitiesBacktester(None, dtype_policy=policy.name)
+    gold = pd.concat(
+        backtester.simulate(frame.sort_values("Date").reset_index(drop=True))
+        for _, frame in signals.groupby("Ticker", observed=True)
+    )
+    store("gold", gold)
+
+    return sizes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=200)
+    parser.add_argument("--bars", type=int, default=2520)
+    args = parser.parse_args()
+
+    df = synthetic_silver(args.tickers, args.bars)
+    print(f"[BENCH] {args.tickers} tickers x {args.bars} bars = {len(df):,} rows")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = stage_frames(df, POLICIES["legacy"], Path(tmp))
+        compact = stage_frames(df, POLICIES["compact"], Path(tmp))
+
+    print(f"[BENCH] {'stage':<10}{'memory MiB (legacy -> compact)':>36}{'Parquet MiB (legacy -> compact)':>38}")
+    for stage in legacy:
+        (lm, lp), (cm, cp) = legacy[stage], compact[stage]
+        print(
+            f"[BENCH] {stage:<10}"
+            f"{lm:12.1f} -> {cm:8.1f} ({cm / lm:5.0%})      "
+            f"{lp:12.1f} -> {cp:8.1f} ({cp / lp:5.0%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
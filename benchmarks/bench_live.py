@@ -0,0 +1,88 @@
+"""
+Live mode latency: replay synthetic bars through LiveSignalEngine from an
+in-process queue or a local TCP socket and report receipt-to-signal
+latency percentiles. Runs fully offline in a scratch directory.
+
+    python -m benchmarks.bench_live --tickers 50 --years 2
+    python -m benchmarks.bench_live --tickers 50 --years 2 --socket
+"""
+import argparse
+import contextlib
+import io
+import multiprocessing
+import os
+import socket
+import tempfile
+from pathlib import Path
+
+from benchmarks.synthetic import synthetic_ohlcv
+from src.catalog.artifact_catalog import ArtifactCatalog
+from src.event_bus.event_dispatcher import EventDispatcher
+from src.ingestion.base_ingestor import BronzeWriter
+from src.ingestion.watermark_store import WatermarkStore
+from src.live.bar_feed import FEED_COLUMNS, ReplayFeed, SocketBarFeed, send_replay
+from src.live.live_engine import LiveSignalEngine
+
+
+def gateway(bars, ports):
+    """
+    Replay server in its own process, as an exchange gateway would be,
+    so it does not compete with the engine for the GIL.
+    """
+    server = socket.create_server(("127.0.0.1", 0))
+    ports.put(server.getsockname()[1])
+    send_replay(server, bars)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=50)
+    parser.add_argument("--years", type=float, default=2)
+    parser.add_argument("--freq", default="1d")
+    parser.add_argument("--checkpoint-bars", type=int, default=10_000)
+    parser.add_argument("--durability", default="batch", help="event log durability mode")
+    parser.add_argument("--socket", action="store_true", help="stream over localhost TCP")
+    args = parser.parse_args()
+
+    bars = synthetic_ohlcv(args.tickers, args.years, args.freq)[FEED_COLUMNS]
+    bars = bars.sort_values(["Date", "Ticker"], kind="stable").reset_index(drop=True)
+    print(f"[BENCH] {args.tickers} tickers x {args.years}y @ {args.freq} = {len(bars):,} bars")
+
+    cwd = Path.cwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        ArtifactCatalog.DB_PATH = workdir / "metadata" / "catalog.db"
+        EventDispatcher.EVENT_LOG = workdir / "metadata" / "event_log.jsonl"
+        BronzeWriter.RUN_LOG = workdir / "metadata" / "run_log.jsonl"
+        EventDispatcher.configure(durability=args.durability, verbose=False)
+        os.chdir(workdir)
+        try:
+            (workdir / "metadata").mkdir()
+            feed = ReplayFeed(bars)
+            if args.socket:
+                ports = multiprocessing.Queue()
+                multiprocessing.Process(target=gateway, args=(bars, ports), daemon=True).start()
+                feed = SocketBarFeed("127.0.0.1", ports.get())
+
+            engine = LiveSignalEngine(
+                checkpoint_bars=args.checkpoint_bars,
+                bar_freq=args.freq,
+                watermarks=WatermarkStore(workdir / "metadata" / "watermarks.json"),
+            )
+            with contextlib.redirect_stdout(io.StringIO()):
+                report = engine.run(feed)
+        finally:
+            EventDispatcher.close()
+            os.chdir(cwd)
+
+    latency = report["latency"]
+    print(f"[BENCH] {report['bars']:,} bars in {report['seconds']:.2f}s = {report['bars_per_s']:,} bars/s, "
+          f"{report['checkpoints']} checkpoints, {report['rejected']} rejected")
+    print("[BENCH] latency " + "  ".join(
+        f"{k[:-3]} {latency[k]:8.1f}us" for k in ("mean_us", "p50_us", "p90_us", "p99_us", "p999_us", "max_us")
+    ))
+    print(f"[BENCH] slowest ticker {latency['worst_ticker']} p99 {latency['worst_ticker_p99_us']:.1f}us")
+
+
+if __name__ == "__main__":
+    main()
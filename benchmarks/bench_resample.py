@@ -0,0 +1,98 @@
+"""
+Intraday resampling: build 5m / 1h / 1d bars from synthetic minute
+Silver with the streaming IntradayResampler vs a whole-frame pandas
+groupby().resample() per frequency, plus peak Python memory of each.
+Runs fully offline in a scratch directory.
+
+    python -m benchmarks.bench_resample --tickers 20 --years 1
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import synthetic_ohlcv
+from src.catalog.artifact_catalog import ArtifactCatalog
+from src.event_bus.event_dispatcher import EventDispatcher
+from src.silver.bar_resampler import IntradayResampler
+
+AGGREGATIONS = {
+    "Open": "first", "High": "max", "Low": "min",
+    "Close": "last", "Adj Close": "last", "Volume": "sum",
+}
+PANDAS_RULES = {"5m": "5min", "1h": "60min", "1d": "1D"}
+
+
+def pandas_resample(silver_path: Path, freqs: list) -> dict:
+    df = pd.read_parquet(silver_path).set_index("Date")
+    out = {}
+    for freq in freqs:
+        offset = None if freq == "1d" else "30min"
+        bars = df.groupby("Ticker").resample(PANDAS_RULES[freq], offset=offset).agg(AGGREGATIONS)
+        out[freq] = bars.dropna().reset_index()
+    return out
+
+
+def measured(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024 ** 2
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=20)
+    parser.add_argument("--years", type=float, default=1)
+    parser.add_argument("--chunk-size", type=int, default=500_000)
+    parser.add_argument("--freqs", default="5m,1h,1d")
+    args = parser.parse_args()
+    freqs = args.freqs.split(",")
+
+    cwd = Path.cwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        ArtifactCatalog.DB_PATH = workdir / "metadata" / "catalog.db"
+        EventDispatcher.EVENT_LOG = workdir / "metadata" / "event_log.jsonl"
+        EventDispatcher.configure(verbose=False)
+        os.chdir(workdir)
+        try:
+            (workdir / "metadata").mkdir()
+            # Ticker-major like Silver, written in row groups of chunk size
+            minutes = synthetic_ohlcv(args.tickers, args.years, "1m")
+            silver_path = workdir / "minutes.parquet"
+            minutes.to_parquet(silver_path, index=False, row_group_size=args.chunk_size)
+            print(f"[BENCH] {args.tickers} tickers x {args.years}y @ 1m = {len(minutes):,} rows")
+            del minutes
+
+            resampler = IntradayResampler(silver_path, "T", freqs=freqs, chunk_size=args.chunk_size)
+            outputs, stream_s, stream_mb = measured(resampler.write_streaming)
+            reference, pandas_s, pandas_mb = measured(pandas_resample, silver_path, freqs)
+
+            for freq in freqs:
+                ours = pd.read_parquet(outputs[freq][0]).sort_values(["Ticker", "Date"])
+                theirs = reference[freq].sort_values(["Ticker", "Date"])
+                same = len(ours) == len(theirs) and np.allclose(
+                    ours[list(AGGREGATIONS)].to_numpy(dtype=float),
+                    theirs[list(AGGREGATIONS)].to_numpy(dtype=float),
+                    rtol=1e-6,
+                )
+                print(f"[BENCH] {freq:>3}: {outputs[freq][1]:,} bars, matches pandas: {same}")
+        finally:
+            EventDispatcher.close()
+            os.chdir(cwd)
+
+    print(f"[BENCH] streaming resampler {stream_s:7.2f}s  peak {stream_mb:8.1f} MiB")
+    print(f"[BENCH] pandas resample     {pandas_s:7.2f}s  peak {pandas_mb:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Streaming sentiment ingestion throughput on a synthetic headline feed,
+replayed from a JSONL file or pushed over a local TCP socket.
+
+    python -m benchmarks.bench_sentiment --headlines 500000
+    python -m benchmarks.bench_sentiment --headlines 500000 --socket
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import socket
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.catalog.artifact_catalog import ArtifactCatalog
+from src.event_bus.event_dispatcher import EventDispatcher
+from src.ingestion.base_ingestor import BronzeWriter
+from src.ingestion.sentiment_ingestor import (
+    DEFAULT_LEXICON,
+    FileHeadlineFeed,
+    SentimentIngestor,
+    SocketHeadlineFeed,
+)
+from src.ingestion.watermark_store import WatermarkStore
+
+
+FILLER = (
+    "shares company quarter market investors analysts report says after amid "
+    "stock revenue guidance ceo deal sector futures trading outlook year"
+).split()
+
+
+def synthetic_headlines(n: int, seed: int = 7) -> list:
+    """
+    JSONL headlines of 6-14 words, about a fifth of them lexicon words.
+    """
+    rng = np.random.default_rng(seed)
+    vocab = np.array(FILLER * 4 + list(DEFAULT_LEXICON) + ["not", "no"])
+    lengths = rng.integers(6, 15, size=n)
+    words = vocab[rng.integers(0, len(vocab), size=lengths.sum())]
+    tickers = rng.choice([f"T{i:04d}" for i in range(500)], size=n)
+    stamps = pd.date_range("2024-01-02 09:30", periods=n, freq="10ms").strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+    lines, start = [], 0
+    for i, length in enumerate(lengths):
+        headline = " ".join(words[start:start + length]).capitalize()
+        start += length
+        lines.append(json.dumps({"timestamp": stamps[i], "ticker": tickers[i], "headline": headline}))
+    return lines
+
+
+def serve(payload: bytes) -> int:
+    """
+    One-shot TCP server on localhost sending payload; returns the port.
+    """
+    server = socket.create_server(("127.0.0.1", 0))
+    port = server.getsockname()[1]
+
+    def send():
+        conn, _ = server.accept()
+        with conn:
+            conn.sendall(payload)
+        server.close()
+
+    threading.Thread(target=send, daemon=True).start()
+    return port
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--headlines", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--roll-rows", type=int, default=250_000)
+    parser.add_argument("--socket", action="store_true", help="stream over localhost TCP")
+    args = parser.parse_args()
+
+    lines = synthetic_headlines(args.headlines)
+    payload = ("\n".join(lines) + "\n").encode()
+    print(f"[BENCH] {args.headlines:,} headlines, {len(payload) / 1024 ** 2:.1f} MiB")
+
+    cwd = Path.cwd()
+    EventDispatcher.configure(verbose=False)
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        ArtifactCatalog.DB_PATH = workdir / "metadata" / "catalog.db"
+        EventDispatcher.EVENT_LOG = workdir / "metadata" / "event_log.jsonl"
+        BronzeWriter.RUN_LOG = workdir / "metadata" / "run_log.jsonl"
+        os.chdir(workdir)
+        try:
+            (workdir / "metadata").mkdir()
+            if args.socket:
+                feed = SocketHeadlineFeed("127.0.0.1", serve(payload))
+            else:
+                feed_path = workdir / "headlines.jsonl"
+                feed_path.write_bytes(payload)
+                feed = FileHeadlineFeed(feed_path)
+
+            ingestor = SentimentIngestor(
+                feed,
+                partition="bench",
+                batch_size=args.batch_size,
+                roll_rows=args.roll_rows,
+                watermarks=WatermarkStore(workdir / "metadata" / "watermarks.json"),
+            )
+            with contextlib.redirect_stdout(io.StringIO()):
+                summary = ingestor.run()
+        finally:
+            EventDispatcher.close()
+            os.chdir(cwd)
+
+    print(
+        f"[BENCH] {summary['headlines']:,} headlines in {summary['seconds']:.2f}s = "
+        f"{summary['headlines_per_s']:,} headlines/s over {len(summary['files'])} file(s)"
+    )
+    print(f"[BENCH] queue high water: {summary['queue_high_water']}")
+
+
+if __name__ == "__main__":
+    main()
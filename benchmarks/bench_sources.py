@@ -0,0 +1,144 @@
+"""
+HTTP source layer against a local stub server that imitates the Yahoo
+chart API, Stooq CSV and fredgraph CSV endpoints, with injected latency
+and transient 503s. Runs fully offline.
+
+    python -m benchmarks.bench_sources --tickers 50 --fail-rate 0.2
+
+Reports cold fetches (network + retries), warm fetches (TTL cache hits),
+stale fetches (304 revalidation) and pooled keep-alive vs a new
+connection per request.
+"""
+import argparse
+import hashlib
+import json
+import random
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+import requests
+
+from src.sources import providers
+from src.sources.http_session import RetryPolicy
+
+
+def chart_payload(ticker: str, n_bars: int = 252) -> bytes:
+    rng = np.random.default_rng(int(hashlib.sha256(ticker.encode()).hexdigest()[:8], 16))
+    close = 100 * np.cumprod(1 + rng.normal(0.0003, 0.015, n_bars))
+    stamps = pd.bdate_range("2024-01-02", periods=n_bars) + pd.Timedelta(hours=14, minutes=30)
+    quote = {
+        "open": close.tolist(), "high": (close * 1.01).tolist(), "low": (close * 0.99).tolist(),
+        "close": close.tolist(), "volume": rng.integers(1_000, 1_000_000, n_bars).tolist(),
+    }
+    return json.dumps({"chart": {"error": None, "result": [{
+        "meta": {"exchangeTimezoneName": "America/New_York"},
+        "timestamp": (stamps.asi8 // 10 ** 9).tolist(),
+        "indicators": {"quote": [quote], "adjclose": [{"adjclose": (close * 0.98).tolist()}]},
+    }]}}).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    # Headers and body go out as separate writes; without TCP_NODELAY a
+    # kept-alive connection stalls on delayed ACKs
+    disable_nagle_algorithm = True
+    latency = 0.0
+    fail_rate = 0.0
+    random = random.Random(7)
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, body: bytes = b"", headers: dict = None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        if self.random.random() < self.fail_rate:
+            return self._send(503, headers={"Retry-After": "0"})
+
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        if url.path.startswith("/v8/finance/chart/"):
+            body = chart_payload(url.path.rsplit("/", 1)[-1])
+        elif url.path == "/q/d/l/":
+            body = b"Date,Open,High,Low,Close,Volume\n2024-01-02,1,1,1,1,100\n"
+        elif url.path == "/graph/fredgraph.csv":
+            body = f"observation_date,{query['id']}\n2024-01-01,5.33\n2024-01-02,.\n".encode()
+        else:
+            return self._send(404)
+
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        if self.headers.get("If-None-Match") == etag:
+            return self._send(304, headers={"ETag": etag})
+        self._send(200, body, {"ETag": etag, "Content-Type": "application/octet-stream"})
+
+
+def timed(fn, tickers):
+    start = time.perf_counter()
+    for ticker in tickers:
+        fn(ticker)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=5)
+    parser.add_argument("--fail-rate", type=float, default=0.2)
+    args = parser.parse_args()
+
+    StubHandler.latency = args.latency_ms / 1000
+    StubHandler.fail_rate = args.fail_rate
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    tickers = [f"T{i:04d}" for i in range(args.tickers)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        providers.configure(
+            rate_limiters={},
+            ttl=3600,
+            cache_dir=tmp,
+            base_urls={name: base_url for name in providers.SOURCE_TYPES},
+            retry=RetryPolicy(max_retries=8, backoff=0.01, seed=7),
+        )
+        yahoo = providers.get_source("yahoo")
+
+        cold = timed(yahoo.fetch, tickers)
+        warm = timed(yahoo.fetch, tickers)
+        yahoo.session.ttl = 0.001  # every entry is now stale
+        time.sleep(0.01)
+        stale = timed(yahoo.fetch, tickers)
+        stats = dict(yahoo.session.stats)
+
+        fred = providers.get_source("fred").fetch("DFF")
+        stooq = providers.get_source("stooq").fetch("AAPL")
+
+    StubHandler.fail_rate = 0.0
+    pooled_session = requests.Session()
+    pooled = timed(lambda t: pooled_session.get(f"{base_url}/v8/finance/chart/{t}"), tickers)
+    fresh = timed(lambda t: requests.get(f"{base_url}/v8/finance/chart/{t}", headers={"Connection": "close"}), tickers)
+    server.shutdown()
+
+    n = len(tickers)
+    print(f"[BENCH] {n} tickers, {args.latency_ms:g} ms latency, {args.fail_rate:.0%} transient 503s")
+    print(f"[BENCH] cold   {cold:7.3f}s  ({stats['retries']} retries)")
+    print(f"[BENCH] warm   {warm:7.3f}s  ({stats['cache_hits']} cache hits, no requests)")
+    print(f"[BENCH] stale  {stale:7.3f}s  ({stats['revalidated']} revalidated with 304)")
+    print(f"[BENCH] keep-alive pool {pooled:7.3f}s vs new connection per request {fresh:7.3f}s")
+    print(f"[BENCH] FRED rows {len(fred)} ({int(fred['DFF'].isna().sum())} missing), Stooq rows {len(stooq)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Silver validation benchmark: pandera EquitiesSchema vs the compiled
+FastValidator on a synthetic multi-ticker panel, plus peak memory of each.
+
+    python -m benchmarks.bench_validation --tickers 500 --bars 2520
+"""
+import argparse
+import time
+import tracemalloc
+
+from benchmarks.synthetic import synthetic_ohlcv
+from src.pipeline.bar_frequency import TRADING_DAYS
+from src.validation.equities_schema import EquitiesSchema, EquitiesValidator
+
+
+def measured(fn, *args, **kwargs):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 ** 2
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=200)
+    parser.add_argument("--bars", type=int, default=2520)
+    parser.add_argument("--chunk-size", type=int, default=250_000)
+    args = parser.parse_args()
+
+    df = synthetic_ohlcv(args.tickers, args.bars / TRADING_DAYS)
+    print(f"[BENCH] {args.tickers} tickers x {args.bars} bars = {len(df):,} rows")
+
+    pandera_s, pandera_mb = measured(EquitiesSchema.validate, df)
+    fast_s, fast_mb = measured(EquitiesValidator.validate, df)
+    chunk_s, chunk_mb = measured(EquitiesValidator.validate, df, chunk_size=args.chunk_size)
+
+    print(f"[BENCH] pandera:        {pandera_s:8.3f}s  peak {pandera_mb:8.1f} MiB")
+    print(f"[BENCH] fast:           {fast_s:8.3f}s  peak {fast_mb:8.1f} MiB  ({pandera_s / fast_s:.1f}x)")
+    print(f"[BENCH] fast (chunked): {chunk_s:8.3f}s  peak {chunk_mb:8.1f} MiB  ({pandera_s / chunk_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
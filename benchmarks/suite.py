@@ -0,0 +1,250 @@
+"""
+End-to-end stage benchmarks on synthetic data, with a JSON baseline and a
+regression gate. Runs fully offline in a scratch directory.
+The committed benchmarks/baseline.json covers the small and medium scales.
+
+    python -m benchmarks.suite --scales small,medium --save
+    python -m benchmarks.suite --scales small,medium          # exits 1 on regression
+    python -m benchmarks.suite --tickers 50 --years 1 --freq 5m
+
+Each stage is timed (best of --repeat) and then run once more under
+tracemalloc for its peak Python-heap allocation. Results are keyed by
+"<scale>/<freq>/<stage>"; a stage regresses when its time or peak memory
+exceeds the baseline by more than --threshold. Without --save, a
+missing baseline or a stage absent from it fails the gate too.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.synthetic import synthetic_macro, synthetic_ohlcv
+from src.backtest.equities_backtest import EquitiesBacktester
+from src.backtest.portfolio_backtest import PortfolioBacktester
+from src.catalog.artifact_catalog import ArtifactCatalog
+from src.event_bus.event_dispatcher import EventDispatcher
+from src.features.equities_features import EquitiesFeatureFactory
+from src.features.macro_enrichment import MacroEnricher
+from src.signals.equities_signals import EquitiesSignalEngine
+from src.silver.equities_silver import EquitiesSilverProcessor
+from src.silver.macro_silver import MacroSilverProcessor
+
+
+SCALES = {
+    "small": {"tickers": 10, "years": 2},
+    "medium": {"tickers": 100, "years": 5},
+    "large": {"tickers": 500, "years": 10},
+}
+BASELINE = Path("benchmarks") / "baseline.json"
+
+# Timings this close to the baseline are noise, whatever the ratio
+MIN_SECONDS = 0.02
+MIN_MB = 1.0
+
+
+def measure(fn, repeat: int):
+    """
+    (result, best seconds, peak MiB) of fn(), its output silenced.
+    """
+    times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = fn()
+            times.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return result, min(times), peak / 1024 ** 2
+
+
+class StageSuite:
+    """
+    One synthetic scale through Bronze -> Silver -> Features -> Signals ->
+    Gold, every stage timed on the real pipeline classes.
+    """
+
+    def __init__(self, tickers: int, years: float, freq: str = "1d", repeat: int = 3, events: int = 5_000):
+        self.tickers = tickers
+        self.years = years
+        self.freq = freq
+        self.repeat = repeat
+        self.events = events
+        self.results = {}
+
+    def stage(self, name: str, fn, rows: int = None):
+        result, seconds, peak_mb = measure(fn, self.repeat)
+        rows = rows if rows is not None else len(result) if hasattr(result, "__len__") else 0
+        self.results[name] = {
+            "seconds": round(seconds, 5),
+            "rows": rows,
+            "rows_per_s": round(rows / seconds) if seconds > 0 else None,
+            "peak_mb": round(peak_mb, 2),
+        }
+        print(
+            f"[BENCH] {name:<18}{seconds:9.3f}s  {self.results[name]['rows_per_s'] or 0:>12,} rows/s"
+            f"  peak {peak_mb:8.1f} MiB"
+        )
+        return result
+
+    def run(self, workdir: Path) -> dict:
+        bronze = workdir / "bronze" / "equities" / "raw_data.parquet"
+        macro_bronze = workdir / "bronze" / "macro" / "raw_data.parquet"
+        bronze.parent.mkdir(parents=True)
+        macro_bronze.parent.mkdir(parents=True)
+
+        prices = synthetic_ohlcv(self.tickers, self.years, self.freq)
+        macro_raw = synthetic_macro(self.years)
+        prices.to_parquet(bronze, index=False)
+        macro_raw.to_parquet(macro_bronze, index=False)
+        print(f"[BENCH] {self.tickers} tickers x {self.years}y @ {self.freq} = {len(prices):,} bars")
+
+        # ---- Silver ----
+        silver = EquitiesSilverProcessor(bronze, partition="bench")
+        df = self.stage("silver_load", silver.load)
+        df = self.stage("silver_validate", lambda: silver.validate(df))
+        silver_path = self.stage(
+            "silver_write",
+            lambda: silver.write(silver.dtype_policy.apply(df)),
+            rows=len(df),
+        )
+
+        macro = MacroSilverProcessor(macro_bronze, partition="DFF")
+        macro_path = self.stage("silver_macro", macro.run, rows=len(macro_raw))
+
+        # ---- Features ----
+        enricher = MacroEnricher({"DFF": macro_path})
+        end = prices["Date"].max()
+        table = self.stage("macro_enrichment", lambda: enricher.calendar(end=end))
+        as_of_path = enricher.write(table)
+
+        factory = EquitiesFeatureFactory(
+            silver_path,
+            panel=True,
+            partition="bench",
+            macro_path=as_of_path,
+            risk_free_col="DFF",
+        )
+        feature_path = self.stage("features", factory.run, rows=len(df))
+
+        # ---- Signals ----
+        engine = EquitiesSignalEngine(feature_path, partition="bench")
+        signal_path = self.stage("signals", engine.run, rows=len(df))
+
+        # ---- Gold ----
+        signals = pd.read_parquet(signal_path)
+        backtester = EquitiesBacktester(None)
+
+        def backtest_all():
+            for _, frame in signals.groupby("Ticker", observed=True):
+                backtester.metrics(backtester.simulate(frame.reset_index(drop=True)))
+            return signals
+
+        self.stage("backtest", backtest_all)
+        self.stage("portfolio", PortfolioBacktester(signal_path).run, rows=len(signals))
+
+        # ---- Event emission ----
+        def emit_all():
+            for i in range(self.events):
+                EventDispatcher.emit(event_type="BENCH_EVENT", payload={"i": i})
+            EventDispatcher.flush()
+            return range(self.events)
+
+        self.stage("events", emit_all)
+
+        return self.results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Keys whose seconds or peak_mb grew by more than threshold, and keys
+    the baseline has no entry for (an unmeasured stage is not a pass).
+    """
+    regressions = []
+    for key, current in results.items():
+        base = baseline.get(key)
+        if base is None:
+            regressions.append(f"{key}: not in the baseline; run with --save to add it")
+            continue
+        for metric, floor in (("seconds", MIN_SECONDS), ("peak_mb", MIN_MB)):
+            if current[metric] > base[metric] * (1 + threshold) and current[metric] - base[metric] > floor:
+                regressions.append(
+                    f"{key} {metric}: {base[metric]} -> {current[metric]} "
+                    f"(+{current[metric] / base[metric] - 1:.0%})"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scales", default="small", help=f"comma-separated: {', '.join(SCALES)}")
+    parser.add_argument("--tickers", type=int, help="custom scale (with --years)")
+    parser.add_argument("--years", type=float, default=1)
+    parser.add_argument("--freq", default="1d")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--events", type=int, default=5_000)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args()
+
+    scales = {name: SCALES[name] for name in args.scales.split(",") if name}
+    if args.tickers:
+        scales = {f"custom_{args.tickers}x{args.years:g}y": {"tickers": args.tickers, "years": args.years}}
+
+    baseline_path = args.baseline.resolve()
+    results = {}
+    cwd = Path.cwd()
+
+    db_path, event_log = ArtifactCatalog.DB_PATH, EventDispatcher.EVENT_LOG
+
+    EventDispatcher.configure(verbose=False)
+    for name, scale in scales.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            workdir = Path(tmp)
+            # Every data/ and metadata/ write lands in the scratch directory
+            ArtifactCatalog.DB_PATH = workdir / "metadata" / "catalog.db"
+            EventDispatcher.EVENT_LOG = workdir / "metadata" / "event_log.jsonl"
+            os.chdir(workdir)
+            try:
+                print(f"[BENCH] ---- {name} ----")
+                suite = StageSuite(scale["tickers"], scale["years"], args.freq, args.repeat, args.events)
+                for stage, metrics in suite.run(workdir).items():
+                    results[f"{name}/{args.freq}/{stage}"] = metrics
+            finally:
+                EventDispatcher.close()
+                ArtifactCatalog.DB_PATH, EventDispatcher.EVENT_LOG = db_path, event_log
+                os.chdir(cwd)
+
+    if args.save:
+        baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+        baseline.update(results)
+        baseline_path.write_text(json.dumps(baseline, indent=2, sort_keys=True))
+        print(f"[BENCH] Baseline saved to {baseline_path}")
+        return
+
+    if not baseline_path.exists():
+        print(f"[BENCH] No baseline at {baseline_path}; run with --save to create one")
+        sys.exit(1)
+
+    regressions = compare(results, json.loads(baseline_path.read_text()), args.threshold)
+    for line in regressions:
+        print(f"[BENCH] REGRESSION {line}")
+    if regressions:
+        sys.exit(1)
+    print(f"[BENCH] No regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Deterministic synthetic market data for offline benchmarks.
+
+Same arguments and seed, same frames: prices are per-ticker geometric
+random walks laid out as Bronze would deliver them, macro is a daily
+FRED-style DFF series over the same span.
+"""
+import numpy as np
+import pandas as pd
+
+from src.pipeline.bar_frequency import BAR_MINUTES, SESSION_OPEN, TRADING_DAYS, bars_per_day
+
+
+def bar_timestamps(years: float, freq: str = "1d", start: str = "2000-01-03") -> pd.DatetimeIndex:
+    days = pd.bdate_range(start, periods=max(1, int(round(years * TRADING_DAYS))))
+    if BAR_MINUTES[freq] is None:
+        return days
+
+    offsets = SESSION_OPEN + pd.to_timedelta(
+        np.arange(bars_per_day(freq)) * BAR_MINUTES[freq], unit="min"
+    )
+    return pd.DatetimeIndex((days.values[:, None] + offsets.values[None, :]).ravel())
+
+
+def synthetic_ohlcv(
+    n_tickers: int,
+    years: float,
+    freq: str = "1d",
+    seed: int = 7,
+) -> pd.DataFrame:
+    """
+    Long (Date, Ticker) OHLCV panel with the Bronze equities columns.
+    Per-bar volatility scales with the bar length, so every frequency
+    has the same daily volatility.
+    """
+    rng = np.random.default_rng(seed)
+    timestamps = bar_timestamps(years, freq)
+    n_bars = len(timestamps)
+    bar_vol = 0.015 / np.sqrt(bars_per_day(freq))
+
+    returns = rng.normal(0.0003 / bars_per_day(freq), bar_vol, size=(n_tickers, n_bars))
+    close = 100 * np.cumprod(1 + returns, axis=1)
+    open_ = np.concatenate([close[:, :1], close[:, :-1]], axis=1)
+    spread = np.abs(rng.normal(0, bar_vol / 2, size=close.shape)) * close
+
+    return pd.DataFrame({
+        "Date": np.tile(timestamps.values, n_tickers),
+        "Open": open_.ravel(),
+        "High": (np.maximum(open_, close) + spread).ravel(),
+        "Low": (np.minimum(open_, close) - spread).ravel(),
+        "Close": close.ravel(),
+        "Adj Close": close.ravel(),
+        "Volume": rng.integers(1_000, 10_000_000, size=close.size),
+        "Ticker": np.repeat([f"T{i:04d}" for i in range(n_tickers)], n_bars),
+    })
+
+
+def synthetic_macro(years: float, seed: int = 7, start: str = "2000-01-03") -> pd.DataFrame:
+    """
+    Daily effective fed funds rate (percent, never negative) covering
+    the same span as synthetic_ohlcv.
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start, periods=int(round(years * 365)) + 7, freq="D")
+    rate = np.clip(2.0 + np.cumsum(rng.normal(0, 0.02, size=len(dates))), 0.0, None)
+
+    return pd.DataFrame({"date": dates, "DFF": rate})
@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+
+from src.pipeline.bar_frequency import TRADING_DAYS
+
+
+BOOTSTRAP_METRICS = ["CAGR", "Sharpe", "MaxDrawdown"]
+
+
+def stationary_bootstrap_indices(
+    n_days: int,
+    n_paths: int,
+    mean_block: float,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    (paths x days) resampling indices of the stationary bootstrap
+    (Politis & Romano, 1994): blocks start at uniform random days, have
+    geometric lengths with mean `mean_block` and wrap around the end of
+    the sample. Built without a Python loop over days: each cell looks
+    up the start of its block with a running maximum.
+    """
+    starts = rng.integers(0, n_days, size=(n_paths, n_days))
+    new_block = rng.random((n_paths, n_days)) < 1 / mean_block
+    new_block[:, 0] = True
+
+    days = np.arange(n_days)
+    block_begin = np.maximum.accumulate(np.where(new_block, days, 0), axis=1)
+    offset = days - block_begin
+
+    return (np.take_along_axis(starts, block_begin, axis=1) + offset) % n_days
+
+
+def path_metrics(returns: np.ndarray, periods_per_year: int = TRADING_DAYS) -> dict:
+    """
+    CAGR, Sharpe and MaxDrawdown of every row of a (paths x days) return
+    matrix, with the same definitions as EquitiesBacktester.metrics.
+    """
+    n_days = returns.shape[1]
+    equity = np.cumprod(1 + returns, axis=1)
+    rolling_max = np.maximum.accumulate(equity, axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = returns.mean(axis=1) / returns.std(axis=1, ddof=1) * np.sqrt(periods_per_year)
+
+    return {
+        "CAGR": equity[:, -1] ** (periods_per_year / n_days) - 1,
+        "Sharpe": sharpe,
+        "MaxDrawdown": ((equity - rolling_max) / rolling_max).min(axis=1),
+    }
+
+
+class BootstrapResampler:
+    """
+    Sampling distributions of backtest metrics from a stationary block
+    bootstrap of daily net returns.
+
+    Paths are generated and scored as (paths x days) matrices, in chunks
+    of at most max_cells cells, so memory stays bounded however many
+    paths or days are requested. Block resampling keeps the volatility
+    clustering and autocorrelation within blocks that an i.i.d. bootstrap
+    would destroy.
+    """
+
+    def __init__(
+        self,
+        n_paths: int = 5_000,
+        mean_block: float = 20,
+        confidence: float = 0.95,
+        seed: int = 7,
+        max_cells: int = 2 ** 22,
+        periods_per_year: int = TRADING_DAYS,
+    ):
+        """
+        max_cells bounds one chunk's matrices (2**22 float64 cells = 32 MiB
+        per matrix); cache-sized chunks are also faster than one huge one.
+        """
+        self.n_paths = n_paths
+        self.mean_block = mean_block
+        self.confidence = confidence
+        self.seed = seed
+        self.max_cells = max_cells
+        self.periods_per_year = periods_per_year
+
+    def resample(self, net_return, periods_per_year: int = None) -> pd.DataFrame:
+        """
+        One row of metrics per bootstrap path. periods_per_year overrides
+        the resampler's annualization for this call only.
+        """
+        periods = periods_per_year or self.periods_per_year
+        returns = np.asarray(net_return, dtype=float)
+        returns = returns[~np.isnan(returns)]
+        n_days = len(returns)
+        if n_days < 2:
+            raise ValueError("Bootstrap needs at least two returns")
+
+        chunk = max(1, self.max_cells // n_days)
+        rng = np.random.default_rng(self.seed)
+        parts = []
+
+        for start in range(0, self.n_paths, chunk):
+            n = min(chunk, self.n_paths - start)
+            idx = stationary_bootstrap_indices(n_days, n, self.mean_block, rng)
+            parts.append(pd.DataFrame(path_metrics(returns[idx], periods)))
+
+        return pd.concat(parts, ignore_index=True)
+
+    def intervals(self, paths: pd.DataFrame, point: dict = None) -> pd.DataFrame:
+        """
+        Percentile confidence interval, mean, std and median per metric,
+        next to the point estimate when given.
+        """
+        alpha = (1 - self.confidence) / 2
+        rows = []
+        for metric in BOOTSTRAP_METRICS:
+            values = paths[metric].dropna()
+            rows.append({
+                "metric": metric,
+                "point": (point or {}).get(metric, np.nan),
+                "mean": values.mean(),
+                "std": values.std(),
+                "lower": values.quantile(alpha),
+                "median": values.median(),
+                "upper": values.quantile(1 - alpha),
+                "confidence": self.confidence,
+                "paths": len(values),
+            })
+        return pd.DataFrame(rows)
+
+    def drawdown_distribution(self, paths: pd.DataFrame) -> dict:
+        """
+        Max-drawdown quantiles across paths, e.g. {"p05": -0.31, ...}.
+        """
+        levels = [0.01, 0.05, 0.25, 0.5, 0.75, 0.95]
+        quantiles = paths["MaxDrawdown"].quantile(levels)
+        return {f"p{int(q * 100):02d}": float(v) for q, v in quantiles.items()}
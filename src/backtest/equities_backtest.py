@@ -3,7 +3,13 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime
 
+from src.backtest.bootstrap import BootstrapResampler
+from src.catalog.artifact_catalog import ArtifactCatalog
 from src.event_bus.event_dispatcher import EventDispatcher
+from src.pipeline.bar_frequency import check_frequency, infer_frequency, periods_per_year
+from src.pipeline.dtype_policy import footprint, get_policy
+from src.signals.rule_dsl import BUY, to_codes
+from src.pipeline.perf import collect, instrumented
 
 
 class EquitiesBacktester:
@@ -12,30 +18,47 @@ class EquitiesBacktester:
         signal_path: Path,
         initial_capital: float = 1_000_000,
         txn_cost_bps: float = 10,  # 10 basis points
+        partition: str = None,
+        dtype_policy: str = "compact",
+        bootstrap_paths: int = 0,
+        bootstrap_block: float = 20,
+        bar_freq: str = None,
     ):
+        """
+        bootstrap_paths > 0 adds stationary block bootstrap confidence
+        intervals and drawdown distributions (mean block length
+        bootstrap_block bars) to the gold output.
+        bar_freq sets the annualization of CAGR and Sharpe (bars per
+        year); by default it is inferred from the bar spacing.
+        """
         self.signal_path = signal_path
+        self.partition = partition
         self.initial_capital = initial_capital
         self.txn_cost = txn_cost_bps / 10_000
+        self.dtype_policy = get_policy(dtype_policy)
+        self.bar_freq = check_frequency(bar_freq) if bar_freq else None
+        self.resampler = None
+        if bootstrap_paths:
+            self.resampler = BootstrapResampler(n_paths=bootstrap_paths, mean_block=bootstrap_block)
 
+    @instrumented("load", reads="signal_path")
     def load(self) -> pd.DataFrame:
         df = pd.read_parquet(self.signal_path)
         df = df.sort_values("Date").reset_index(drop=True)
         return df
 
+    @instrumented("simulate")
     def simulate(self, df: pd.DataFrame):
         df = df.copy()
 
         # Position logic: long-only
-        df["position"] = 0
-        df.loc[df["signal"] == "BUY", "position"] = 1
-        df.loc[df["signal"] == "SELL", "position"] = 0
-        df["position"] = df["position"].ffill().fillna(0)
+        df["position"] = (to_codes(df["signal"]) == BUY).astype(int)
 
         # Trades occur when position changes
         df["trade"] = df["position"].diff().fillna(0).abs()
 
         # Daily returns from Adj Close
-        df["market_return"] = df["Adj Close"].pct_change().fillna(0)
+        df["market_return"] = df["Adj Close"].astype(float).pct_change().fillna(0)
 
         # Strategy returns
         df["strategy_return"] = df["position"].shift(1).fillna(0) * df["market_return"]
@@ -53,14 +76,21 @@ class EquitiesBacktester:
 
         return df
 
-    def metrics(self, df: pd.DataFrame) -> dict:
+    def frequency(self, df: pd.DataFrame) -> str:
+        return self.bar_freq or infer_frequency(df["Date"])
+
+    def metrics(self, df: pd.DataFrame, periods: int = None) -> dict:
+        """
+        periods: bars per year (default: from the bar frequency).
+        """
+        periods = periods or periods_per_year(self.frequency(df))
         total_return = df["equity"].iloc[-1] / self.initial_capital - 1
 
-        cagr = (1 + total_return) ** (252 / len(df)) - 1
+        cagr = (1 + total_return) ** (periods / len(df)) - 1
 
         sharpe = (
             df["net_return"].mean() / df["net_return"].std()
-        ) * np.sqrt(252)
+        ) * np.sqrt(periods)
 
         rolling_max = df["equity"].cummax()
         drawdown = (df["equity"] - rolling_max) / rolling_max
@@ -72,31 +102,87 @@ class EquitiesBacktester:
             "MaxDrawdown": max_dd,
         }
 
-    def write(self, df: pd.DataFrame, metrics: dict) -> Path:
+    @instrumented("bootstrap")
+    def bootstrap(self, df: pd.DataFrame, metrics: dict, periods: int = None) -> tuple:
+        """
+        (per-path metrics, confidence intervals) of the net returns,
+        annualized with periods bars per year.
+        """
+        paths = self.resampler.resample(df["net_return"], periods)
+        return paths, self.resampler.intervals(paths, point=metrics)
+
+    @instrumented("write", writes=True)
+    def write(self, df: pd.DataFrame, metrics: dict, bootstrap: tuple = None) -> Path:
         date_str = datetime.utcnow().date().isoformat()
-        gold_path = Path("data") / "gold" / "equities" / date_str
+        gold_path = Path("data") / "gold" / "equities"
+        if self.partition:
+            gold_path = gold_path / self.partition
+        gold_path = gold_path / date_str
         gold_path.mkdir(parents=True, exist_ok=True)
 
         trades_file = gold_path / "trades.parquet"
         equity_file = gold_path / "equity_curve.parquet"
 
-        df.to_parquet(trades_file, index=False)
+        df.to_parquet(trades_file, index=False, **self.dtype_policy.parquet_options(df))
         pd.DataFrame([metrics]).to_parquet(equity_file, index=False)
 
+        if bootstrap is not None:
+            for name, frame in zip(("bootstrap_paths", "bootstrap_intervals"), bootstrap):
+                out_file = gold_path / f"{name}.parquet"
+                frame.to_parquet(out_file, index=False)
+                ArtifactCatalog().register(
+                    layer="gold",
+                    domain="equities",
+                    path=out_file,
+                    partition=self.partition,
+                    data_date=date_str,
+                    row_count=len(frame),
+                )
+
+        # Registered last, so the run directory stays the partition's latest
+        ArtifactCatalog().register(
+            layer="gold",
+            domain="equities",
+            path=gold_path,
+            partition=self.partition,
+            data_date=date_str,
+            row_count=len(df),
+        )
+
         return gold_path
 
     def run(self) -> Path:
         df = self.load()
         df_bt = self.simulate(df)
-        metrics = self.metrics(df_bt)
-        gold_path = self.write(df_bt, metrics)
+        bar_freq = self.frequency(df)
+        periods = periods_per_year(bar_freq)
+        metrics = self.metrics(df_bt, periods)
+        bootstrap = None
+        if self.resampler:
+            bootstrap = self.bootstrap(df_bt, metrics, periods)
+        df_bt = self.dtype_policy.apply(df_bt)
+        gold_path = self.write(df_bt, metrics, bootstrap)
+
+        payload = {
+            "domain": "equities",
+            "partition": self.partition,
+            "gold_path": str(gold_path),
+            "metrics": metrics,
+            "bar_freq": bar_freq,
+        }
+        if bootstrap is not None:
+            paths, intervals = bootstrap
+            payload["confidence_intervals"] = {
+                row.metric: [row.lower, row.upper] for row in intervals.itertuples()
+            }
+            payload["drawdown_distribution"] = self.resampler.drawdown_distribution(paths)
 
         EventDispatcher.emit(
             event_type="BACKTEST_COMPLETE",
             payload={
-                "domain": "equities",
-                "gold_path": str(gold_path),
-                "metrics": metrics,
+                **payload,
+                "footprint": footprint("gold", gold_path, df_bt),
+                "perf": collect(),
             },
         )
 
@@ -0,0 +1,216 @@
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.catalog.artifact_catalog import ArtifactCatalog
+from src.event_bus.event_dispatcher import EventDispatcher
+from src.features.incremental_features import read_features
+from src.pipeline.bar_frequency import TRADING_DAYS, check_frequency, infer_frequency, periods_per_year
+from src.signals.equities_signals import strategy_rules
+from src.signals.rule_dsl import BUY, RuleSet
+
+
+SWEEP_COLUMNS = ["Date", "Ticker", "Adj Close", "sharpe_60d", "cagr_60d", "vol_regime"]
+
+
+def threshold_rules(pairs, template: dict = None) -> RuleSet:
+    """
+    One RuleSet strategy per (buy_sharpe, sell_sharpe) pair, in pair
+    order, all built from the same strategy template as the signal
+    engine's rules. Shared sub-expressions are evaluated once.
+    """
+    return RuleSet({
+        "strategies": {
+            str(i): strategy_rules(template, buy_sharpe=buy, sell_sharpe=sell)
+            for i, (buy, sell) in enumerate(pairs)
+        }
+    })
+
+
+def signal_matrix(rules: RuleSet, df: pd.DataFrame) -> np.ndarray:
+    """
+    (T x K) int8 signal codes, one column per strategy of rules.
+    """
+    return np.column_stack(list(rules.evaluate(df).values()))
+
+
+def sweep_metrics(
+    close: np.ndarray,
+    signals: np.ndarray,
+    txn_cost: np.ndarray,
+    initial_capital: float,
+    periods_per_year: int = TRADING_DAYS,
+) -> dict:
+    """
+    Backtest K signal columns at once. close is a length-T series,
+    signals (T x K) int8 codes and txn_cost a length-K vector; positions,
+    returns and equity are (T x K) matrices with one column per parameter
+    set. Mirrors the accounting of EquitiesBacktester.
+    """
+    # Long-only position is held only on BUY bars
+    position = (signals == BUY).astype(np.float64)
+
+    trade = np.zeros_like(position)
+    trade[1:] = np.abs(np.diff(position, axis=0))
+
+    market_return = np.zeros(len(close))
+    market_return[1:] = close[1:] / close[:-1] - 1
+
+    strategy_return = np.zeros_like(position)
+    strategy_return[1:] = position[:-1] * market_return[1:, None]
+
+    net_return = strategy_return - trade * txn_cost[None, :]
+    equity = initial_capital * np.cumprod(1 + net_return, axis=0)
+
+    total_return = equity[-1] / initial_capital - 1
+    rolling_max = np.maximum.accumulate(equity, axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe_ratio = (
+            net_return.mean(axis=0) / net_return.std(axis=0, ddof=1)
+        ) * np.sqrt(periods_per_year)
+
+    return {
+        "CAGR": (1 + total_return) ** (periods_per_year / len(close)) - 1,
+        "Sharpe": sharpe_ratio,
+        "MaxDrawdown": ((equity - rolling_max) / rolling_max).min(axis=0),
+        "Trades": trade.sum(axis=0),
+    }
+
+
+class ParameterSweep:
+    """
+    Evaluate a grid of signal thresholds and cost levels in one batched
+    pass instead of one pipeline run per combination. Signals come from
+    the signal engine's strategy template compiled through RuleSet, one
+    strategy per threshold pair. Large grids are split into column chunks
+    and spread across a process pool.
+    """
+
+    def __init__(
+        self,
+        feature_path: Path,
+        buy_sharpe=(1.0,),
+        sell_sharpe=(0.0,),
+        txn_cost_bps=(10,),
+        initial_capital: float = 1_000_000,
+        chunk_size: int = 512,
+        max_workers: int = None,
+        bar_freq: str = None,
+        partition: str = None,
+        rules: dict = None,
+    ):
+        """
+        bar_freq: annualization of CAGR and Sharpe; inferred from the
+        dates by default. partition (the ticker by default) gives each
+        sweep its own gold directory. rules: a strategy template with
+        {buy_sharpe} / {sell_sharpe} placeholders, DEFAULT_STRATEGY by
+        default.
+        """
+        self.feature_path = feature_path
+        self.partition = partition
+        self.rules = rules
+        self.buy_sharpe = list(buy_sharpe)
+        self.sell_sharpe = list(sell_sharpe)
+        self.txn_cost_bps = list(txn_cost_bps)
+        self.initial_capital = initial_capital
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.bar_freq = check_frequency(bar_freq) if bar_freq else None
+
+    def load(self) -> pd.DataFrame:
+        df = read_features(self.feature_path, columns=SWEEP_COLUMNS)
+        tickers = df["Ticker"].unique()
+        if len(tickers) != 1:
+            raise ValueError(f"A parameter sweep runs on one ticker's features, got {len(tickers)}")
+        if self.partition is None:
+            self.partition = str(tickers[0])
+        return df.sort_values("Date").reset_index(drop=True)
+
+    def grid(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            list(itertools.product(self.buy_sharpe, self.sell_sharpe, self.txn_cost_bps)),
+            columns=["buy_sharpe", "sell_sharpe", "txn_cost_bps"],
+        )
+
+    def evaluate(self, df: pd.DataFrame, grid: pd.DataFrame) -> pd.DataFrame:
+        # Signals depend on the thresholds only, not the cost level
+        pair_codes, pairs = pd.MultiIndex.from_frame(grid[["buy_sharpe", "sell_sharpe"]]).factorize()
+        signals = signal_matrix(threshold_rules(pairs, self.rules), df)[:, pair_codes]
+
+        close = df["Adj Close"].to_numpy(dtype=float)
+        txn_cost = grid["txn_cost_bps"].to_numpy(dtype=float) / 10_000
+        periods = periods_per_year(self.bar_freq or infer_frequency(df["Date"]))
+
+        chunks = [
+            (signals[:, start:start + self.chunk_size], txn_cost[start:start + self.chunk_size])
+            for start in range(0, len(grid), self.chunk_size)
+        ]
+
+        if len(chunks) == 1:
+            results = [sweep_metrics(close, *chunks[0], self.initial_capital, periods)]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = [
+                    pool.submit(sweep_metrics, close, *chunk, self.initial_capital, periods)
+                    for chunk in chunks
+                ]
+                results = [f.result() for f in futures]
+
+        metrics = pd.DataFrame({
+            name: np.concatenate([r[name] for r in results])
+            for name in results[0]
+        })
+        return pd.concat([grid.reset_index(drop=True), metrics], axis=1)
+
+    def write(self, results: pd.DataFrame) -> Path:
+        date_str = datetime.utcnow().date().isoformat()
+        gold_path = Path("data") / "gold" / "equities"
+        if self.partition:
+            gold_path = gold_path / self.partition
+        gold_path = gold_path / date_str
+        gold_path.mkdir(parents=True, exist_ok=True)
+
+        out_file = gold_path / "parameter_sweep.parquet"
+        results.to_parquet(out_file, index=False)
+
+        ArtifactCatalog().register(
+            layer="gold",
+            domain="equities",
+            path=out_file,
+            partition=self.partition,
+            data_date=date_str,
+            row_count=len(results),
+        )
+
+        return out_file
+
+    def run(self) -> Path:
+        df = self.load()
+        results = self.evaluate(df, self.grid())
+        sweep_path = self.write(results)
+
+        # Sharpe is NaN for a flat return series, possibly for every combination
+        sharpe = results["Sharpe"].dropna()
+        best = results.loc[sharpe.idxmax()].to_dict() if not sharpe.empty else None
+
+        EventDispatcher.emit(
+            event_type="SWEEP_COMPLETE",
+            payload={
+                "domain": "equities",
+                "partition": self.partition,
+                "sweep_path": str(sweep_path),
+                "combinations": len(results),
+                "best": best,
+            },
+        )
+
+        if best is None:
+            print("[SWEEP] No combination has a finite Sharpe ratio")
+        else:
+            print("[SWEEP] Best parameters:", best)
+        return sweep_path
@@ -0,0 +1,232 @@
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.catalog.artifact_catalog import ArtifactCatalog
+from src.event_bus.event_dispatcher import EventDispatcher
+from src.pipeline.bar_frequency import check_frequency, infer_frequency, periods_per_year
+from src.signals.rule_dsl import BUY, to_codes
+from src.pipeline.perf import collect, instrumented
+
+
+PORTFOLIO_COLUMNS = ["Date", "Ticker", "Adj Close", "signal", "vol_60d"]
+
+
+class PortfolioBacktester:
+    """
+    Long-only portfolio backtest over N tickers.
+
+    Signals, prices and volatilities are aligned into (dates x tickers)
+    matrices and every step (weighting, rebalancing, turnover costs,
+    returns, attribution) runs as whole-matrix NumPy operations with no
+    Python loop over tickers.
+
+    weighting: "equal" or "inverse_vol" (1 / vol_60d) across BUY names.
+    rebalance_every: the portfolio is traded back to its target weights
+    every N bars; in between, weights drift with the assets' returns and
+    nothing is traded.
+    bar_freq: annualization of CAGR and Sharpe; inferred from the dates
+    by default.
+    partition: gold directory of the run, so portfolios over different
+    universes or settings do not overwrite each other.
+    """
+
+    WEIGHTINGS = ("equal", "inverse_vol")
+
+    def __init__(
+        self,
+        signal_path: Path,
+        weighting: str = "equal",
+        rebalance_every: int = 1,
+        initial_capital: float = 1_000_000,
+        txn_cost_bps: float = 10,
+        bar_freq: str = None,
+        partition: str = "portfolio",
+    ):
+        if weighting not in self.WEIGHTINGS:
+            raise ValueError(f"Unsupported weighting scheme: {weighting}")
+
+        self.signal_path = signal_path
+        self.weighting = weighting
+        self.rebalance_every = max(1, rebalance_every)
+        self.initial_capital = initial_capital
+        self.txn_cost = txn_cost_bps / 10_000
+        self.bar_freq = check_frequency(bar_freq) if bar_freq else None
+        self.partition = partition
+
+    @instrumented("load", reads="signal_path")
+    def load(self) -> pd.DataFrame:
+        return pd.read_parquet(self.signal_path, columns=PORTFOLIO_COLUMNS)
+
+    def to_matrices(self, df: pd.DataFrame) -> dict:
+        """
+        Align the long (Date, Ticker) frame into dense matrices.
+        Missing (date, ticker) cells are NaN prices and flat positions.
+        """
+        date_codes, dates = pd.factorize(df["Date"], sort=True)
+        ticker_codes, tickers = pd.factorize(df["Ticker"], sort=True)
+        shape = (len(dates), len(tickers))
+
+        close = np.full(shape, np.nan)
+        close[date_codes, ticker_codes] = df["Adj Close"].to_numpy(dtype=float)
+
+        vol = np.full(shape, np.nan)
+        vol[date_codes, ticker_codes] = df["vol_60d"].to_numpy(dtype=float)
+
+        long = np.zeros(shape, dtype=bool)
+        long[date_codes, ticker_codes] = to_codes(df["signal"]) == BUY
+
+        return {
+            "dates": dates,
+            "tickers": tickers,
+            "close": close,
+            "vol": vol,
+            "long": long,
+        }
+
+    def target_weights(self, long: np.ndarray, vol: np.ndarray) -> np.ndarray:
+        if self.weighting == "equal":
+            raw = long.astype(np.float64)
+        else:
+            with np.errstate(divide="ignore"):
+                inv_vol = np.where(vol > 0, 1.0 / vol, 0.0)
+            raw = np.where(long, np.nan_to_num(inv_vol), 0.0)
+
+        total = raw.sum(axis=1, keepdims=True)
+        return np.divide(raw, total, out=np.zeros_like(raw), where=total > 0)
+
+    @instrumented("simulate")
+    def simulate(self, matrices: dict) -> dict:
+        close = matrices["close"]
+        n_bars = close.shape[0]
+
+        # ---- Asset returns (missing prices contribute nothing) ----
+        asset_return = np.zeros_like(close)
+        with np.errstate(invalid="ignore"):
+            asset_return[1:] = close[1:] / close[:-1] - 1
+        asset_return = np.nan_to_num(asset_return, nan=0.0)
+
+        # ---- Rebalancing: targets at rebalance bars, drift in between ----
+        # End-of-bar weights: each position grows with its asset since the
+        # period's rebalance bar, uninvested capital stays in cash
+        targets = self.target_weights(matrices["long"], matrices["vol"])
+        rebalance_bar = (np.arange(n_bars) // self.rebalance_every) * self.rebalance_every
+        growth = np.cumprod(1 + asset_return, axis=0)
+        held = targets[rebalance_bar] * growth / growth[rebalance_bar]
+        cash = 1 - targets[rebalance_bar].sum(axis=1, keepdims=True)
+        weights = held / (held.sum(axis=1, keepdims=True) + cash)
+
+        # ---- Yesterday's weights earn today's return ----
+        contribution = np.zeros_like(close)
+        contribution[1:] = weights[:-1] * asset_return[1:]
+
+        # ---- Turnover-based transaction costs ----
+        # Only rebalance bars trade: from the drifted weights to the
+        # targets. The first bar has no previous weights and pays nothing,
+        # as diff().fillna(0) in the pandas backtest
+        drifted = (weights[:-1] + contribution[1:]) / (1 + contribution[1:].sum(axis=1, keepdims=True))
+        is_rebalance = (np.arange(1, n_bars) % self.rebalance_every == 0)[:, None]
+        weight_change = np.zeros_like(weights)
+        weight_change[1:] = np.where(is_rebalance, np.abs(weights[1:] - drifted), 0.0)
+        turnover = weight_change.sum(axis=1)
+        txn_cost = turnover * self.txn_cost
+
+        net_return = contribution.sum(axis=1) - txn_cost
+        equity = self.initial_capital * np.cumprod(1 + net_return)
+
+        return {
+            **matrices,
+            "weights": weights,
+            "contribution": contribution,
+            "weight_change": weight_change,
+            "turnover": turnover,
+            "txn_cost": txn_cost,
+            "net_return": net_return,
+            "equity": equity,
+        }
+
+    def metrics(self, result: dict) -> dict:
+        net_return = result["net_return"]
+        equity = result["equity"]
+
+        periods = periods_per_year(self.bar_freq or infer_frequency(result["dates"]))
+
+        total_return = equity[-1] / self.initial_capital - 1
+        cagr = (1 + total_return) ** (periods / len(equity)) - 1
+
+        sharpe = (net_return.mean() / net_return.std(ddof=1)) * np.sqrt(periods)
+
+        rolling_max = np.maximum.accumulate(equity)
+        max_dd = ((equity - rolling_max) / rolling_max).min()
+
+        return {
+            "CAGR": float(cagr),
+            "Sharpe": float(sharpe),
+            "MaxDrawdown": float(max_dd),
+            "AvgTurnover": float(result["turnover"].mean()),
+        }
+
+    def attribution(self, result: dict) -> pd.DataFrame:
+        """
+        Per-asset share of portfolio return and cost.
+        """
+        return pd.DataFrame({
+            "Ticker": result["tickers"],
+            "return_contribution": result["contribution"].sum(axis=0),
+            "cost_contribution": result["weight_change"].sum(axis=0) * self.txn_cost,
+            "avg_weight": result["weights"].mean(axis=0),
+            "days_held": (result["weights"] > 0).sum(axis=0),
+        })
+
+    @instrumented("write", writes=True)
+    def write(self, result: dict, metrics: dict, attribution: pd.DataFrame) -> Path:
+        date_str = datetime.utcnow().date().isoformat()
+        gold_path = Path("data") / "gold" / "equities" / self.partition / date_str
+        gold_path.mkdir(parents=True, exist_ok=True)
+
+        pd.DataFrame({
+            "Date": result["dates"],
+            "net_return": result["net_return"],
+            "turnover": result["turnover"],
+            "txn_cost": result["txn_cost"],
+            "equity": result["equity"],
+        }).to_parquet(gold_path / "portfolio_equity.parquet", index=False)
+
+        attribution.to_parquet(gold_path / "portfolio_attribution.parquet", index=False)
+        pd.DataFrame([metrics]).to_parquet(gold_path / "portfolio_metrics.parquet", index=False)
+
+        ArtifactCatalog().register(
+            layer="gold",
+            domain="equities",
+            path=gold_path / "portfolio_equity.parquet",
+            partition=self.partition,
+            data_date=date_str,
+            row_count=len(result["dates"]),
+        )
+
+        return gold_path
+
+    def run(self) -> Path:
+        df = self.load()
+        result = self.simulate(self.to_matrices(df))
+        metrics = self.metrics(result)
+        attribution = self.attribution(result)
+        gold_path = self.write(result, metrics, attribution)
+
+        EventDispatcher.emit(
+            event_type="PORTFOLIO_BACKTEST_COMPLETE",
+            payload={
+                "domain": "equities",
+                "partition": self.partition,
+                "gold_path": str(gold_path),
+                "tickers": len(result["tickers"]),
+                "weighting": self.weighting,
+                "metrics": metrics,
+                "perf": collect(),
+            },
+        )
+
+        print("[PORTFOLIO] Metrics:", metrics)
+        return gold_path
@@ -0,0 +1,350 @@
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.backtest.parameter_sweep import signal_matrix, sweep_metrics, threshold_rules
+from src.catalog.artifact_catalog import ArtifactCatalog
+from src.event_bus.event_dispatcher import EventDispatcher
+from src.features.incremental_features import read_features
+from src.features.panel_features import REGIME_LABELS
+from src.pipeline.bar_frequency import check_frequency, infer_frequency, periods_per_year
+
+
+WALK_FORWARD_COLUMNS = ["Date", "Ticker", "Adj Close", "sharpe_60d", "cagr_60d", "vol_60d"]
+MATRIX_FIELDS = {"close": "Adj Close", "sharpe": "sharpe_60d", "cagr": "cagr_60d", "vol": "vol_60d"}
+METRICS = ["CAGR", "Sharpe", "MaxDrawdown", "Trades"]
+
+# Fewer valid bars than this in a window and the (fold, ticker) is skipped
+MIN_TRAIN_BARS = 60
+MIN_TEST_BARS = 5
+
+
+def walk_forward_splits(
+    n_bars: int,
+    train_bars: int,
+    test_bars: int,
+    mode: str = "rolling",
+    step: int = None,
+    gap: int = 0,
+) -> list:
+    """
+    (train_start, train_end, test_start, test_end) bar ranges, end
+    exclusive. "rolling" slides a fixed-length train window; "expanding"
+    always trains from bar 0. gap bars between train and test keep the
+    last train labels from overlapping the first test bars.
+    """
+    if mode not in ("rolling", "expanding"):
+        raise ValueError(f"Unsupported walk-forward mode: {mode}")
+
+    step = step or test_bars
+    splits = []
+    test_start = train_bars + gap
+    while test_start + test_bars <= n_bars:
+        train_end = test_start - gap
+        train_start = 0 if mode == "expanding" else train_end - train_bars
+        splits.append((train_start, train_end, test_start, test_start + test_bars))
+        test_start += step
+    return splits
+
+
+# ---------------------------------------------------------------------------
+# Worker side: the price matrices live in shared memory, attached once per
+# process; a task only carries its fold bounds and ticker column.
+# ---------------------------------------------------------------------------
+
+_SHARED = {}
+
+
+def _attach(spec: dict):
+    for field, (name, shape) in spec.items():
+        block = shared_memory.SharedMemory(name=name)
+        _SHARED[field] = (block, np.ndarray(shape, dtype=np.float64, buffer=block.buf))
+
+
+def _window(field: str, column: int, start: int, end: int) -> np.ndarray:
+    return _SHARED[field][1][start:end, column]
+
+
+def _rule_frame(values: dict, edges: tuple) -> pd.DataFrame:
+    """
+    The feature columns the signal rules read, for one window, with
+    vol_regime classified by the fold's refit edges.
+    """
+    low_edge, high_edge = edges
+    regime = np.where(values["vol"] <= low_edge, 0, np.where(values["vol"] > high_edge, 2, 1))
+    return pd.DataFrame({
+        "sharpe_60d": values["sharpe"],
+        "cagr_60d": values["cagr"],
+        "vol_60d": values["vol"],
+        "vol_regime": pd.Categorical.from_codes(regime, categories=REGIME_LABELS, ordered=True),
+    })
+
+
+def score_fold(task: tuple) -> dict:
+    """
+    Refit regime edges and signal thresholds on one ticker's train window,
+    then score the chosen parameters out of sample on its test window.
+    """
+    fold, column, (train_start, train_end, test_start, test_end), grid, txn_cost, capital, periods = task
+
+    def series(start, end):
+        values = {f: _window(f, column, start, end) for f in MATRIX_FIELDS}
+        valid = np.all([~np.isnan(v) for v in values.values()], axis=0)
+        return {f: v[valid] for f, v in values.items()}
+
+    train = series(train_start, train_end)
+    test = series(test_start, test_end)
+    if len(train["close"]) < MIN_TRAIN_BARS or len(test["close"]) < MIN_TEST_BARS:
+        return None
+
+    # ---- Refit on train: regime edges, then the best threshold pair ----
+    edges = tuple(np.quantile(train["vol"], [1 / 3, 2 / 3]))
+    buy_grid, sell_grid, rules = grid
+
+    fitted = sweep_metrics(
+        train["close"], signal_matrix(rules, _rule_frame(train, edges)),
+        np.full(len(buy_grid), txn_cost), capital, periods,
+    )
+    best = int(np.argmax(np.nan_to_num(fitted["Sharpe"], nan=-np.inf)))
+
+    # ---- Score out of sample with the train-fitted edges and thresholds ----
+    scored = sweep_metrics(
+        test["close"], signal_matrix(rules, _rule_frame(test, edges))[:, best:best + 1],
+        np.array([txn_cost]), capital, periods,
+    )
+
+    return {
+        "fold": fold,
+        "column": column,
+        "low_edge": edges[0],
+        "high_edge": edges[1],
+        "buy_sharpe": buy_grid[best],
+        "sell_sharpe": sell_grid[best],
+        "train_Sharpe": fitted["Sharpe"][best],
+        "train_bars": len(train["close"]),
+        "test_bars": len(test["close"]),
+        **{f"test_{m}": scored[m][0] for m in METRICS},
+    }
+
+
+def _score_chunk(tasks: list) -> list:
+    return [score_fold(task) for task in tasks]
+
+
+class WalkForwardBacktester:
+    """
+    Out-of-sample evaluation of the signal rules.
+
+    The (Date x Ticker) history is cut into train/test folds. In every
+    fold each ticker's vol_regime edges (1/3 and 2/3 vol_60d quantiles)
+    and its BUY / SELL Sharpe thresholds are refit on the train window
+    only and scored on the following test window, so no test bar
+    influences the parameters it is scored with.
+
+    Folds x tickers run on a process pool. The price and feature matrices
+    are placed in shared memory once and workers map them directly
+    instead of receiving pickled copies.
+    """
+
+    def __init__(
+        self,
+        feature_paths,
+        train_bars: int = 504,
+        test_bars: int = 126,
+        mode: str = "rolling",
+        step: int = None,
+        gap: int = 0,
+        buy_sharpe=(0.5, 1.0, 1.5),
+        sell_sharpe=(-0.5, 0.0),
+        txn_cost_bps: float = 10,
+        initial_capital: float = 1_000_000,
+        max_workers: int = None,
+        chunk_size: int = 64,
+        bar_freq: str = None,
+        rules: dict = None,
+    ):
+        """
+        feature_paths: one Parquet path (per-ticker or panel) or incremental
+        feature store, or a list of them.
+        train_bars / test_bars / step / gap are counted in bars of the
+        features' frequency; bar_freq (inferred by default) annualizes
+        the fold metrics. rules: the strategy template, as in
+        ParameterSweep.
+        """
+        if isinstance(feature_paths, (str, Path)):
+            feature_paths = [feature_paths]
+        self.feature_paths = [Path(p) for p in feature_paths]
+        self.train_bars = train_bars
+        self.test_bars = test_bars
+        self.mode = mode
+        self.step = step
+        self.gap = gap
+        self.buy_sharpe = list(buy_sharpe)
+        self.sell_sharpe = list(sell_sharpe)
+        self.txn_cost = txn_cost_bps / 10_000
+        self.initial_capital = initial_capital
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.bar_freq = check_frequency(bar_freq) if bar_freq else None
+        self.rules = rules
+
+    def load(self) -> pd.DataFrame:
+        return pd.concat(
+            (read_features(p, columns=WALK_FORWARD_COLUMNS) for p in self.feature_paths),
+            ignore_index=True,
+        )
+
+    def to_matrices(self, df: pd.DataFrame) -> dict:
+        """
+        Dense float64 (Date x Ticker) matrices; missing cells are NaN.
+        """
+        date_codes, dates = pd.factorize(df["Date"], sort=True)
+        ticker_codes, tickers = pd.factorize(df["Ticker"], sort=True)
+
+        matrices = {"dates": dates, "tickers": tickers}
+        for field, column in MATRIX_FIELDS.items():
+            matrix = np.full((len(dates), len(tickers)), np.nan)
+            matrix[date_codes, ticker_codes] = df[column].to_numpy(dtype=float)
+            matrices[field] = matrix
+        return matrices
+
+    def grid(self) -> tuple:
+        """
+        (buy thresholds, sell thresholds, RuleSet with one strategy per pair).
+        """
+        pairs = list(itertools.product(self.buy_sharpe, self.sell_sharpe))
+        return (
+            np.array([b for b, _ in pairs], dtype=float),
+            np.array([s for _, s in pairs], dtype=float),
+            threshold_rules(pairs, self.rules),
+        )
+
+    def evaluate(self, matrices: dict) -> pd.DataFrame:
+        dates, tickers = matrices["dates"], matrices["tickers"]
+        splits = walk_forward_splits(
+            len(dates), self.train_bars, self.test_bars, self.mode, self.step, self.gap
+        )
+        if not splits:
+            raise ValueError(
+                f"History of {len(dates)} bars is too short for "
+                f"{self.train_bars} train + {self.test_bars} test bars"
+            )
+
+        grid = self.grid()
+        periods = periods_per_year(self.bar_freq or infer_frequency(dates))
+        tasks = [
+            (fold, column, split, grid, self.txn_cost, self.initial_capital, periods)
+            for fold, split in enumerate(splits)
+            for column in range(len(tickers))
+        ]
+        chunks = [tasks[i:i + self.chunk_size] for i in range(0, len(tasks), self.chunk_size)]
+
+        blocks = {}
+        try:
+            # ---- Publish the matrices once ----
+            spec = {}
+            for field in MATRIX_FIELDS:
+                matrix = matrices[field]
+                block = shared_memory.SharedMemory(create=True, size=max(matrix.nbytes, 1))
+                np.ndarray(matrix.shape, dtype=np.float64, buffer=block.buf)[:] = matrix
+                blocks[field] = block
+                spec[field] = (block.name, matrix.shape)
+
+            if len(chunks) == 1 or self.max_workers == 1:
+                _attach(spec)
+                results = [r for chunk in chunks for r in _score_chunk(chunk)]
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_attach,
+                    initargs=(spec,),
+                ) as pool:
+                    results = [r for rs in pool.map(_score_chunk, chunks) for r in rs]
+        finally:
+            for field in list(_SHARED):
+                block, view = _SHARED.pop(field)
+                del view  # the buffer cannot close while a view exports it
+                block.close()
+            for block in blocks.values():
+                block.close()
+                block.unlink()
+
+        folds = pd.DataFrame([r for r in results if r is not None])
+        if folds.empty:
+            raise ValueError("No (fold, ticker) pair had enough valid bars to score")
+
+        bounds = np.array(splits)
+        folds["Ticker"] = tickers[folds.pop("column").to_numpy()]
+        for i, name in enumerate(["train_start", "train_end", "test_start", "test_end"]):
+            # End bounds are exclusive bar indices; report the last bar's date
+            index = bounds[folds["fold"].to_numpy(), i] - (1 if name.endswith("end") else 0)
+            folds[name] = dates[index]
+
+        return folds
+
+    def aggregate(self, folds: pd.DataFrame) -> dict:
+        """
+        Out-of-sample metrics across every fold and ticker, per fold, and
+        the train-to-test Sharpe decay (a direct overfitting gauge).
+        """
+        test_cols = [f"test_{m}" for m in METRICS]
+        per_fold = folds.groupby("fold")[test_cols].mean()
+
+        return {
+            "folds": int(folds["fold"].nunique()),
+            "tickers": int(folds["Ticker"].nunique()),
+            "mean": folds[test_cols].mean().to_dict(),
+            "median": folds[test_cols].median().to_dict(),
+            "std": folds[test_cols].std().to_dict(),
+            "hit_rate": float((folds["test_Sharpe"] > 0).mean()),
+            "sharpe_decay": float((folds["train_Sharpe"] - folds["test_Sharpe"]).mean()),
+            "per_fold": {int(k): v for k, v in per_fold.to_dict(orient="index").items()},
+        }
+
+    def write(self, folds: pd.DataFrame) -> Path:
+        date_str = datetime.utcnow().date().isoformat()
+        gold_path = Path("data") / "gold" / "equities" / date_str
+        gold_path.mkdir(parents=True, exist_ok=True)
+
+        out_file = gold_path / "walk_forward.parquet"
+        folds.to_parquet(out_file, index=False)
+
+        ArtifactCatalog().register(
+            layer="gold",
+            domain="equities",
+            path=out_file,
+            partition="walk_forward",
+            data_date=date_str,
+            row_count=len(folds),
+        )
+
+        return out_file
+
+    def run(self) -> Path:
+        folds = self.evaluate(self.to_matrices(self.load()))
+        summary = self.aggregate(folds)
+        walk_forward_path = self.write(folds)
+
+        EventDispatcher.emit(
+            event_type="WALK_FORWARD_COMPLETE",
+            payload={
+                "domain": "equities",
+                "walk_forward_path": str(walk_forward_path),
+                "mode": self.mode,
+                "train_bars": self.train_bars,
+                "test_bars": self.test_bars,
+                **summary,
+            },
+        )
+
+        print(
+            f"[WALK-FORWARD] {summary['folds']} folds x {summary['tickers']} tickers: "
+            f"mean OOS Sharpe {summary['mean']['test_Sharpe']:.2f}, "
+            f"decay {summary['sharpe_decay']:.2f}"
+        )
+        return walk_forward_path
@@ -0,0 +1,279 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path, PureWindowsPath
+
+
+# Lifecycle events whose payload points at a written artifact
+EVENT_ARTIFACTS = {
+    "DATA_VALIDATED": ("silver", "silver_path"),
+    "FEATURES_READY": ("features", "feature_path"),
+    "MACRO_ENRICHMENT_READY": ("features", "macro_path"),
+    "SIGNALS_READY": ("signals", "signal_path"),
+    "BACKTEST_COMPLETE": ("gold", "gold_path"),
+    "PORTFOLIO_BACKTEST_COMPLETE": ("gold", "gold_path"),
+    "SWEEP_COMPLETE": ("gold", "sweep_path"),
+}
+
+
+def _normalize(path) -> str:
+    # Older run log entries were written on Windows
+    path = str(path)
+    if "\\" in path:
+        path = PureWindowsPath(path).as_posix()
+    return Path(path).as_posix()
+
+
+class ArtifactCatalog:
+    """
+    SQLite index of every artifact the pipeline writes.
+
+    Each write()/write_raw() registers one row keyed by
+    layer/domain/partition/date/run_id. Lookups ("latest Silver file for
+    AAPL", "all Bronze deltas in a date range", "every file under this
+    directory") are B-tree index scans instead of rglob + stat walks over
+    the data directory. The catalog can be rebuilt from the run and event
+    logs at any time.
+    """
+
+    DB_PATH = Path("metadata") / "catalog.db"
+
+    _lock = threading.Lock()
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS artifacts (
+            path        TEXT PRIMARY KEY,
+            layer       TEXT NOT NULL,
+            domain      TEXT NOT NULL,
+            partition   TEXT NOT NULL DEFAULT '',
+            data_date   TEXT NOT NULL,
+            run_id      TEXT,
+            row_count   INTEGER,
+            created_at  TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_artifacts_lookup
+            ON artifacts (layer, domain, partition, data_date, created_at);
+    """
+
+    def __init__(self, db_path: Path = None):
+        self.db_path = Path(db_path or ArtifactCatalog.DB_PATH)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(self.SCHEMA)
+        return conn
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _row(layer, domain, path, partition, data_date, run_id, row_count, created_at):
+        created_at = created_at or datetime.utcnow().isoformat()
+        return (
+            _normalize(path),
+            layer,
+            domain,
+            partition or "",
+            data_date or created_at[:10],
+            run_id,
+            row_count,
+            created_at,
+        )
+
+    def register(
+        self,
+        layer: str,
+        domain: str,
+        path: Path,
+        partition: str = None,
+        data_date: str = None,
+        run_id: str = None,
+        row_count: int = None,
+        created_at: str = None,
+    ):
+        """
+        Record an artifact. Re-registering a path (same-day overwrite)
+        replaces its row.
+        """
+        row = self._row(layer, domain, path, partition, data_date, run_id, row_count, created_at)
+
+        with ArtifactCatalog._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        row,
+                    )
+            finally:
+                conn.close()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def _query(self, sql: str, params: tuple) -> list:
+        # A missing catalog is an empty one; reads never create it
+        if not self.db_path.exists():
+            return []
+        conn = self._connect()
+        try:
+            return [dict(r) for r in conn.execute(sql, params)]
+        finally:
+            conn.close()
+
+    def latest(self, layer: str, domain: str, partition: str = None):
+        """
+        Newest artifact for a layer/domain/partition, or None.
+        """
+        rows = self._query(
+            """
+            SELECT * FROM artifacts
+            WHERE layer = ? AND domain = ? AND partition = ?
+            ORDER BY data_date DESC, created_at DESC
+            LIMIT 1
+            """,
+            (layer, domain, partition or ""),
+        )
+        return rows[0] if rows else None
+
+    def latest_path(self, layer: str, domain: str, partition: str = None):
+        row = self.latest(layer, domain, partition)
+        return Path(row["path"]) if row else None
+
+    def range(
+        self,
+        layer: str,
+        domain: str,
+        partition: str = None,
+        start: str = None,
+        end: str = None,
+    ) -> list:
+        """
+        Artifacts with start <= data_date <= end (ISO dates, inclusive),
+        oldest first.
+        """
+        return self._query(
+            """
+            SELECT * FROM artifacts
+            WHERE layer = ? AND domain = ? AND partition = ?
+              AND data_date BETWEEN ? AND ?
+            ORDER BY data_date, created_at
+            """,
+            (layer, domain, partition or "", start or "", end or "9999-12-31"),
+        )
+
+    def under(self, layer: str, directory: Path) -> list:
+        """
+        Registered artifact paths beneath a directory, oldest first.
+        """
+        prefix = _normalize(directory).rstrip("/") + "/"
+        rows = self._query(
+            """
+            SELECT path FROM artifacts
+            WHERE path >= ? AND path < ? AND layer = ?
+            ORDER BY created_at
+            """,
+            (prefix, prefix[:-1] + "0", layer),
+        )
+        return [Path(r["path"]) for r in rows]
+
+    # ------------------------------------------------------------------
+    # Rebuild
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _run_files(entry: dict) -> list:
+        """
+        (path, data_date, row_count) of each Bronze file a run log entry
+        wrote. Intraday runs log their partition directory and list the
+        per-session files; entries written before the list existed are
+        resolved from the run's directories on disk.
+        """
+        if entry.get("files"):
+            return [(f["path"], f.get("data_date"), f.get("record_count")) for f in entry["files"]]
+
+        storage_path = Path(_normalize(entry["storage_path"]))
+        if storage_path.is_dir() and entry.get("run_id"):
+            return [
+                (path, path.parent.parent.name, None)
+                for path in sorted(storage_path.glob(f"*/{entry['run_id']}/raw_data*"))
+            ]
+        return [(storage_path, entry.get("data_date"), entry.get("record_count"))]
+
+    def rebuild(self, run_log: Path = None, event_log: Path = None) -> int:
+        """
+        Recreate the catalog from the run log (Bronze) and the event log
+        (every downstream layer). Returns the number of artifacts indexed.
+        """
+        from src.event_bus.event_dispatcher import EventDispatcher
+        from src.ingestion.base_ingestor import BronzeWriter
+
+        run_log = Path(run_log or BronzeWriter.RUN_LOG)
+        event_log = Path(event_log or EventDispatcher.EVENT_LOG)
+        rows = []
+
+        if run_log.exists():
+            with open(run_log) as f:
+                for line in f:
+                    entry = json.loads(line)
+                    if entry.get("status") != "SUCCESS" or not entry.get("storage_path"):
+                        continue
+                    for path, data_date, row_count in self._run_files(entry):
+                        rows.append(self._row(
+                            "bronze",
+                            entry["domain"],
+                            path,
+                            entry.get("partition"),
+                            data_date,
+                            entry.get("run_id"),
+                            row_count,
+                            entry.get("ingestion_timestamp"),
+                        ))
+
+        if event_log.exists():
+            EventDispatcher.flush()
+            with open(event_log) as f:
+                for line in f:
+                    event = json.loads(line)
+                    if event["event_type"] not in EVENT_ARTIFACTS:
+                        continue
+                    payload = event["payload"]
+                    layer, path_key = EVENT_ARTIFACTS[event["event_type"]]
+                    # Cache hits point into data/cache, not a new artifact
+                    if payload.get("cache_hit") or not payload.get(path_key):
+                        continue
+                    rows.append(self._row(
+                        layer,
+                        payload.get("domain", "equities"),
+                        payload[path_key],
+                        payload.get("partition"),
+                        None,
+                        payload.get("run_id"),
+                        payload.get("row_count"),
+                        event["timestamp"],
+                    ))
+
+        with ArtifactCatalog._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute("DELETE FROM artifacts")
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                count = conn.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0]
+            finally:
+                conn.close()
+
+        print(f"[CATALOG] Rebuilt with {count} artifacts")
+        return count
+
+
+if __name__ == "__main__":
+    ArtifactCatalog().rebuild()
@@ -1,10 +1,106 @@
 from datetime import datetime
 from pathlib import Path
+import atexit
 import json
+import multiprocessing
+import os
+import queue
+import threading
+import time
 
 
 class EventDispatcher:
+    """
+    Process-wide event bus.
+
+    Every event is appended to the JSONL event log (same line format as
+    always) and delivered to in-process subscribers. The log file stays
+    open and writes are buffered according to the durability mode:
+
+    - "fsync":    flush and fsync after every event
+    - "event":    flush after every event (default)
+    - "batch":    flush every `batch_size` events or `flush_interval` seconds,
+                  on a timer when the bus goes quiet
+    - "shutdown": flush only on flush()/close() or interpreter exit
+
+    With async_dispatch=True handlers run on a background thread instead
+    of inside emit().
+
+    A child process (e.g. a process pool worker) appends its own events
+    to the same log through its own handle, each as it is emitted: pool
+    workers end with os._exit(), which skips atexit. A forked child drops
+    the buffer it inherited, which is the parent's to write.
+    """
+
     EVENT_LOG = Path("metadata") / "event_log.jsonl"
+    DURABILITY_MODES = ("fsync", "event", "batch", "shutdown")
+
+    durability = "event"
+    batch_size = 500
+    flush_interval = 1.0
+    verbose = True
+
+    # Events may be emitted from worker threads; keep lines whole.
+    _lock = threading.RLock()
+    _buffer = []
+    _handle = None
+    _handle_path = None
+    _last_flush = time.monotonic()
+    _timer = None
+    _child = multiprocessing.parent_process() is not None
+
+    _subscribers = {}
+    _queue = None
+    _worker = None
+
+    # ------------------------------------------------------------------
+    # Configuration & subscriptions
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def configure(
+        cls,
+        durability: str = None,
+        batch_size: int = None,
+        flush_interval: float = None,
+        async_dispatch: bool = None,
+        verbose: bool = None,
+    ):
+        if durability is not None:
+            if durability not in cls.DURABILITY_MODES:
+                raise ValueError(f"Unsupported durability mode: {durability}")
+            cls.flush()
+            cls.durability = durability
+        if batch_size is not None:
+            cls.batch_size = max(1, batch_size)
+        if flush_interval is not None:
+            cls.flush_interval = flush_interval
+        if verbose is not None:
+            cls.verbose = verbose
+        if async_dispatch is True:
+            cls._start_worker()
+        elif async_dispatch is False:
+            cls._stop_worker()
+
+    @classmethod
+    def subscribe(cls, event_type: str, handler):
+        """
+        Register handler(event) for an event type, or "*" for all events.
+        """
+        with cls._lock:
+            cls._subscribers.setdefault(event_type, []).append(handler)
+        return handler
+
+    @classmethod
+    def unsubscribe(cls, event_type: str, handler):
+        with cls._lock:
+            handlers = cls._subscribers.get(event_type, [])
+            if handler in handlers:
+                handlers.remove(handler)
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
 
     @staticmethod
     def emit(event_type: str, payload: dict):
@@ -14,7 +110,177 @@ class EventDispatcher:
             "payload": payload,
         }
 
-        with open(EventDispatcher.EVENT_LOG, "a") as f:
-            f.write(json.dumps(event) + "\n")
+        EventDispatcher._record(event)
+
+        if EventDispatcher.verbose:
+            print(f"[EVENT] {event_type}")
+
+        EventDispatcher._dispatch(event)
+        return event
+
+    publish = emit
+
+    @classmethod
+    def _record(cls, event: dict):
+        line = json.dumps(event) + "\n"
+
+        with cls._lock:
+            cls._buffer.append(line)
+
+            if cls._child or cls.durability in ("fsync", "event"):
+                cls._flush_locked(fsync=cls.durability == "fsync")
+            elif cls.durability == "batch":
+                if (
+                    len(cls._buffer) >= cls.batch_size
+                    or time.monotonic() - cls._last_flush >= cls.flush_interval
+                ):
+                    cls._flush_locked()
+                elif cls._timer is None:
+                    cls._schedule_flush()
+
+    @classmethod
+    def _dispatch(cls, event: dict):
+        with cls._lock:
+            handlers = (
+                cls._subscribers.get(event["event_type"], [])
+                + cls._subscribers.get("*", [])
+            )
+
+        if not handlers:
+            return
+
+        if cls._queue is not None:
+            for handler in handlers:
+                cls._queue.put((handler, event))
+        else:
+            for handler in handlers:
+                cls._call(handler, event)
+
+    @staticmethod
+    def _call(handler, event: dict):
+        # A failing subscriber must never break the stage that emitted
+        try:
+            handler(event)
+        except Exception as e:
+            print(f"[EVENT] Handler {getattr(handler, '__name__', handler)} failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Durability
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def flush(cls, fsync: bool = False):
+        with cls._lock:
+            cls._flush_locked(fsync=fsync)
+
+    @classmethod
+    def _schedule_flush(cls):
+        # A quiet bus still writes its buffer within flush_interval
+        cls._timer = threading.Timer(cls.flush_interval, cls._timed_flush)
+        cls._timer.daemon = True
+        cls._timer.start()
+
+    @classmethod
+    def _timed_flush(cls):
+        with cls._lock:
+            cls._timer = None
+            cls._flush_locked()
+
+    @classmethod
+    def _flush_locked(cls, fsync: bool = False):
+        cls._last_flush = time.monotonic()
+        if not cls._buffer:
+            return
+
+        log_path = Path(cls.EVENT_LOG)
+        if cls._handle is None or cls._handle_path != log_path:
+            if cls._handle is not None:
+                cls._handle.close()
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            cls._handle = open(log_path, "a")
+            cls._handle_path = log_path
+
+        cls._handle.write("".join(cls._buffer))
+        cls._buffer.clear()
+        cls._handle.flush()
+        if fsync:
+            os.fsync(cls._handle.fileno())
+
+    @classmethod
+    def drain(cls):
+        """
+        Block until every queued async handler has run.
+        """
+        if cls._queue is not None:
+            cls._queue.join()
+
+    @classmethod
+    def close(cls):
+        cls._stop_worker()
+        with cls._lock:
+            if cls._timer is not None:
+                cls._timer.cancel()
+                cls._timer = None
+            cls._flush_locked(fsync=cls.durability != "event")
+            if cls._handle is not None:
+                cls._handle.close()
+                cls._handle = None
+                cls._handle_path = None
+
+    @classmethod
+    def _after_fork(cls):
+        """
+        Runs in a forked child. Locks, threads and the file handle belong
+        to the parent; the child starts over with its own.
+        """
+        cls._lock = threading.RLock()
+        cls._buffer = []
+        cls._handle = None
+        cls._handle_path = None
+        cls._timer = None
+        cls._queue = None
+        cls._worker = None
+        cls._last_flush = time.monotonic()
+        cls._child = True
+
+    # ------------------------------------------------------------------
+    # Background dispatch
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def _start_worker(cls):
+        if cls._worker is not None:
+            return
+        cls._queue = queue.Queue()
+        cls._worker = threading.Thread(
+            target=cls._run_worker,
+            args=(cls._queue,),
+            name="event-dispatch",
+            daemon=True,
+        )
+        cls._worker.start()
+
+    @classmethod
+    def _stop_worker(cls):
+        if cls._worker is None:
+            return
+        cls._queue.put(None)
+        cls._worker.join()
+        cls._queue = None
+        cls._worker = None
+
+    @classmethod
+    def _run_worker(cls, work_queue: queue.Queue):
+        while True:
+            item = work_queue.get()
+            if item is None:
+                work_queue.task_done()
+                return
+            handler, event = item
+            cls._call(handler, event)
+            work_queue.task_done()
+
 
-        print(f"[EVENT] {event_type}")
+atexit.register(EventDispatcher.close)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=EventDispatcher._after_fork)
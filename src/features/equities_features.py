@@ -3,21 +3,69 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime
 
+from src.catalog.artifact_catalog import ArtifactCatalog
 from src.event_bus.event_dispatcher import EventDispatcher
+from src.features.macro_enrichment import broadcast, daily_risk_free
+from src.features.panel_features import REGIME_LABELS, build_panel_features
+from src.features.quantile_sketch import regime_codes_1d
+from src.pipeline.bar_frequency import check_frequency, infer_frequency, periods_per_year
+from src.pipeline.dtype_policy import footprint, get_policy
+from src.pipeline.perf import collect, instrumented
 
 
 class EquitiesFeatureFactory:
-    def __init__(self, silver_path: Path):
+    def __init__(
+        self,
+        silver_path: Path,
+        panel: bool = False,
+        partition: str = None,
+        macro_path: Path = None,
+        risk_free_col: str = None,
+        dtype_policy: str = "compact",
+        bar_freq: str = None,
+    ):
+        """
+        panel=True treats the Silver input as a multi-ticker (Date, Ticker)
+        panel and computes every ticker's features in one vectorized pass.
+        partition (e.g. a ticker) gives per-ticker runs their own output
+        directory.
+        macro_path points at a MacroEnricher as-of table whose indicators
+        are broadcast onto every row by Date; risk_free_col (e.g. "DFF")
+        then makes sharpe_60d an excess return over that rate.
+        Features are computed in float64 whatever the Silver dtypes and
+        narrowed by dtype_policy before they are written.
+        bar_freq ("1d", "1h", "5m", "1m", ...) sets the annualization of
+        cagr_60d and sharpe_60d; by default it is inferred from the bar
+        spacing. Rolling windows are counted in bars at any frequency.
+        """
         self.silver_path = silver_path
+        self.panel = panel
+        self.partition = partition
+        self.macro_path = macro_path
+        self.risk_free_col = risk_free_col
+        self.dtype_policy = get_policy(dtype_policy)
+        self.bar_freq = check_frequency(bar_freq) if bar_freq else None
 
+    def frequency(self, df: pd.DataFrame) -> str:
+        return self.bar_freq or infer_frequency(df["Date"])
+
+    @instrumented("load", reads="silver_path")
     def load(self) -> pd.DataFrame:
         df = pd.read_parquet(self.silver_path)
-        df = df.sort_values("Date").reset_index(drop=True)
+        sort_cols = ["Ticker", "Date"] if self.panel else "Date"
+        df = df.sort_values(sort_cols).reset_index(drop=True)
+
+        if self.macro_path:
+            df = broadcast(df, pd.read_parquet(self.macro_path))
         return df
 
+    @instrumented("build_features")
     def build_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        close = df["Adj Close"].astype(float)
+        periods = periods_per_year(self.frequency(df))
+
         # ---- Returns ----
-        df["return_1d"] = df["Adj Close"].pct_change()
+        df["return_1d"] = close.pct_change()
 
         # ---- Volatility ----
         df["vol_20d"] = df["return_1d"].rolling(20).std()
@@ -25,45 +73,82 @@ class EquitiesFeatureFactory:
 
         # ---- CAGR (rolling) ----
         df["cagr_60d"] = (
-            (df["Adj Close"] / df["Adj Close"].shift(60)) ** (252 / 60) - 1
+            (close / close.shift(60)) ** (periods / 60) - 1
         )
 
-        # ---- Sharpe (rolling, rf = 0) ----
+        # ---- Sharpe (rolling, excess over risk_free_col or rf = 0) ----
+        excess = df["return_1d"]
+        if self.risk_free_col:
+            excess = excess - daily_risk_free(df[self.risk_free_col], periods)
         df["sharpe_60d"] = (
-            df["return_1d"].rolling(60).mean()
-            / df["return_1d"].rolling(60).std()
-        ) * np.sqrt(252)
-
-        # ---- Volatility Regime ----
-        df["vol_regime"] = pd.qcut(
-            df["vol_60d"],
-            q=3,
-            labels=["LOW", "MEDIUM", "HIGH"],
+            excess.rolling(60).mean()
+            / excess.rolling(60).std()
+        ) * np.sqrt(periods)
+
+        # ---- Volatility Regime (point-in-time, no look-ahead) ----
+        df["vol_regime"] = pd.Categorical.from_codes(
+            regime_codes_1d(df["vol_60d"].to_numpy(dtype=float)),
+            categories=REGIME_LABELS,
+            ordered=True,
         )
 
         return df.dropna().reset_index(drop=True)
 
+    @instrumented("build_features")
+    def build_panel_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Same features as build_features, computed per ticker for a
+        multi-ticker panel without windows bleeding across tickers.
+        """
+        return build_panel_features(
+            df,
+            risk_free_col=self.risk_free_col,
+            periods_per_year=periods_per_year(self.frequency(df)),
+        )
+
+    @instrumented("write", writes=True)
     def write(self, df: pd.DataFrame) -> Path:
         date_str = datetime.utcnow().date().isoformat()
-        feature_path = Path("data") / "features" / "equities" / date_str
+        feature_path = Path("data") / "features" / "equities"
+        if self.partition:
+            feature_path = feature_path / self.partition
+        feature_path = feature_path / date_str
         feature_path.mkdir(parents=True, exist_ok=True)
 
         out_file = feature_path / "features.parquet"
-        df.to_parquet(out_file, index=False)
+        df.to_parquet(out_file, index=False, **self.dtype_policy.parquet_options(df))
+
+        ArtifactCatalog().register(
+            layer="features",
+            domain="equities",
+            path=out_file,
+            partition=self.partition,
+            data_date=date_str,
+            row_count=len(df),
+        )
 
         return out_file
 
     def run(self) -> Path:
         df = self.load()
-        df_feat = self.build_features(df)
+        bar_freq = self.frequency(df)
+        if self.panel:
+            df_feat = self.build_panel_features(df)
+        else:
+            df_feat = self.build_features(df)
+        df_feat = self.dtype_policy.apply(df_feat)
         feature_path = self.write(df_feat)
 
         EventDispatcher.emit(
             event_type="FEATURES_READY",
             payload={
                 "domain": "equities",
+                "partition": self.partition,
                 "feature_path": str(feature_path),
                 "row_count": len(df_feat),
+                "bar_freq": bar_freq,
+                "footprint": footprint("features", feature_path, df_feat),
+                "perf": collect(),
             },
         )
 
@@ -0,0 +1,381 @@
+import json
+import math
+import uuid
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.catalog.artifact_catalog import ArtifactCatalog
+from src.event_bus.event_dispatcher import EventDispatcher
+from src.features.macro_enrichment import broadcast, daily_risk_free
+from src.features.panel_features import (
+    FEATURE_COLUMNS,
+    REGIME_LABELS,
+    build_panel_features,
+)
+from src.features.quantile_sketch import StreamingRegime
+from src.pipeline.bar_frequency import TRADING_DAYS, check_frequency, infer_frequency, periods_per_year
+from src.pipeline.dtype_policy import get_policy
+
+
+PRICE_HISTORY = 61  # current bar + the bar 60 sessions back for cagr_60d
+
+
+def read_features(path: Path, columns: list = None) -> pd.DataFrame:
+    """
+    A feature file, or an IncrementalFeatureEngine store read as one
+    frame: parts in write order, a (Ticker, Date) row re-processed by a
+    later run replacing the earlier one.
+    """
+    path = Path(path)
+    if not path.is_dir():
+        return pd.read_parquet(path, columns=columns)
+
+    parts = sorted(path.glob("part-*.parquet"))
+    if not parts:
+        raise FileNotFoundError(f"No feature parts in {path}")
+    df = pd.concat([pd.read_parquet(p, columns=columns) for p in parts], ignore_index=True)
+    return df.drop_duplicates(["Ticker", "Date"], keep="last").reset_index(drop=True)
+
+
+class RollingWindow:
+    """
+    Fixed-size window over a return stream with running sum and sum of
+    squares, so mean/std are O(1) per appended value.
+    """
+
+    def __init__(self, size: int, values=()):
+        self.size = size
+        self.values = deque(maxlen=size)
+        self.total = 0.0
+        self.total_sq = 0.0
+        for v in values:
+            self.push(v)
+
+    def push(self, value: float):
+        if len(self.values) == self.size:
+            old = self.values[0]
+            self.total -= old
+            self.total_sq -= old * old
+        self.values.append(value)
+        self.total += value
+        self.total_sq += value * value
+
+        # A NaN (e.g. a missing rate) poisons running sums; re-sum so the
+        # window recovers once it has rolled out, like pandas rolling()
+        if math.isnan(self.total):
+            self.total = sum(self.values)
+            self.total_sq = sum(v * v for v in self.values)
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.size
+
+    def mean(self) -> float:
+        return self.total / self.size if self.full else math.nan
+
+    def std(self) -> float:
+        if not self.full:
+            return math.nan
+        var = (self.total_sq - self.total * self.total / self.size) / (self.size - 1)
+        return math.sqrt(max(var, 0.0))
+
+
+class TickerFeatureState:
+    """
+    Everything needed to extend one ticker's features by one bar:
+    the last 61 prices (returns are derived from them), the per-bar
+    risk-free rates of the last 60 returns, the rolling windows and the
+    vol_regime quantile sketch. periods_per_year (bars per year of the
+    ticker's bar frequency) annualizes cagr_60d and sharpe_60d.
+    """
+
+    def __init__(
+        self,
+        prices=(),
+        last_date: str = None,
+        regime_state: dict = None,
+        risk_free=(),
+        periods_per_year: int = TRADING_DAYS,
+    ):
+        self.prices = deque(prices, maxlen=PRICE_HISTORY)
+        self.periods_per_year = periods_per_year
+        self.last_date = last_date
+        self.regime = StreamingRegime(regime_state)
+
+        # Rebuilding sums from the stored prices on load bounds float drift
+        p = list(self.prices)
+        returns = [p[i] / p[i - 1] - 1 for i in range(1, len(p))]
+        # One rate per stored return; older states without rates use rf = 0
+        rates = list(risk_free)[-len(returns):] if returns else []
+        self.risk_free = deque(
+            [0.0] * (len(returns) - len(rates)) + rates,
+            maxlen=PRICE_HISTORY - 1,
+        )
+        excess = [r - rf for r, rf in zip(returns, self.risk_free)]
+        self.window_20 = RollingWindow(20, returns[-20:])
+        self.window_60 = RollingWindow(60, returns[-60:])
+        self.window_excess = RollingWindow(60, excess[-60:])
+
+    def update(self, date, price: float, risk_free: float = 0.0) -> dict:
+        """
+        Consume one bar and return its feature values (NaN while warming up).
+        risk_free is the bar's per-bar rate for the excess-return Sharpe.
+        """
+        ret = math.nan
+        if self.prices:
+            ret = price / self.prices[-1] - 1
+            self.window_20.push(ret)
+            self.window_60.push(ret)
+            self.risk_free.append(risk_free)
+            self.window_excess.push(ret - risk_free)
+
+        self.prices.append(price)
+        self.last_date = pd.Timestamp(date).isoformat()
+
+        vol_60d = self.window_60.std()
+        cagr_60d = math.nan
+        if len(self.prices) == PRICE_HISTORY:
+            cagr_60d = (price / self.prices[0]) ** (self.periods_per_year / 60) - 1
+
+        sharpe_60d = math.nan
+        excess_std = self.window_excess.std()
+        if excess_std > 0:
+            sharpe_60d = self.window_excess.mean() / excess_std * math.sqrt(self.periods_per_year)
+
+        return {
+            "return_1d": ret,
+            "vol_20d": self.window_20.std(),
+            "vol_60d": vol_60d,
+            "cagr_60d": cagr_60d,
+            "sharpe_60d": sharpe_60d,
+            "vol_regime": self.classify(vol_60d),
+        }
+
+    def classify(self, vol_60d: float):
+        code = self.regime.update(vol_60d)
+        return REGIME_LABELS[code] if code >= 0 else None
+
+    def to_dict(self) -> dict:
+        return {
+            "prices": list(self.prices),
+            "last_date": self.last_date,
+            "regime": self.regime.state(),
+            "risk_free": list(self.risk_free),
+            "periods_per_year": self.periods_per_year,
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "TickerFeatureState":
+        return cls(
+            prices=state["prices"],
+            last_date=state["last_date"],
+            regime_state=state["regime"],
+            risk_free=state.get("risk_free", ()),
+            # States saved before intraday support are daily
+            periods_per_year=state.get("periods_per_year", TRADING_DAYS),
+        )
+
+
+class IncrementalFeatureEngine:
+    """
+    Daily feature updates in O(new bars x tickers).
+
+    A ticker seen for the first time is bootstrapped with one vectorized
+    full-history pass; afterwards only Silver rows from the stored state's
+    newest bar on are processed. That bar is processed again because it
+    may have been revised (a session still open when it was ingested):
+    the state saved before it is restored first. Each run appends a
+    Parquet part to the feature store, which downstream stages read with
+    read_features(). Because vol_regime is point-in-time, the output
+    matches a full recompute.
+    """
+
+    STORE = Path("data") / "features" / "equities" / "incremental"
+
+    def __init__(
+        self,
+        silver_path: Path,
+        store_path: Path = None,
+        macro_path: Path = None,
+        risk_free_col: str = None,
+        bar_freq: str = None,
+        partition: str = None,
+        dtype_policy: str = "compact",
+    ):
+        """
+        macro_path / risk_free_col / bar_freq / dtype_policy: as in
+        EquitiesFeatureFactory. A few new bars say little about their
+        spacing, so known tickers keep the annualization stored in their
+        state. partition (e.g. a ticker) gives the store its own
+        directory under STORE.
+        """
+        self.silver_path = silver_path
+        self.partition = partition
+        default_store = IncrementalFeatureEngine.STORE / partition if partition else IncrementalFeatureEngine.STORE
+        self.store_path = Path(store_path or default_store)
+        self.macro_path = macro_path
+        self.risk_free_col = risk_free_col
+        self.bar_freq = check_frequency(bar_freq) if bar_freq else None
+        self.dtype_policy = get_policy(dtype_policy)
+        # Leading underscore keeps the state file out of Parquet dataset reads
+        self.state_file = self.store_path / "_state.json"
+        self.states = {}
+        # Per ticker, the state before its newest bar
+        self.previous = {}
+
+    def load_state(self):
+        if self.state_file.exists():
+            with open(self.state_file) as f:
+                raw = json.load(f)
+            # Roll back to before the newest bar so it is processed again
+            self.states = {
+                ticker: TickerFeatureState.from_dict(state.get("previous") or state)
+                for ticker, state in raw.items()
+            }
+            self.previous = {
+                ticker: state["previous"]
+                for ticker, state in raw.items()
+                if state.get("previous")
+            }
+
+    def save_state(self):
+        self.store_path.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.state_file.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(
+                {t: {**s.to_dict(), "previous": self.previous.get(t)} for t, s in self.states.items()},
+                f,
+            )
+        tmp_file.replace(self.state_file)
+
+    def load(self) -> pd.DataFrame:
+        """
+        Silver rows not yet reflected in the (rolled back) feature state.
+        """
+        df = pd.read_parquet(self.silver_path)
+        df = df.sort_values(["Ticker", "Date"]).reset_index(drop=True)
+
+        last_seen = {t: s.last_date for t, s in self.states.items()}
+        cutoff = pd.to_datetime(df["Ticker"].map(last_seen))
+        df = df[cutoff.isna() | (df["Date"] > cutoff)].reset_index(drop=True)
+
+        if self.macro_path:
+            df = broadcast(df, pd.read_parquet(self.macro_path))
+        return df
+
+    def _risk_free(self, df: pd.DataFrame, periods: int) -> np.ndarray:
+        if not self.risk_free_col:
+            return np.zeros(len(df))
+        return daily_risk_free(df[self.risk_free_col], periods)
+
+    def bootstrap(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Full vectorized pass for new tickers, then seed their state from
+        the tail of each history.
+        """
+        periods = periods_per_year(self.bar_freq or infer_frequency(df["Date"]))
+        features, sketch, tickers = build_panel_features(
+            df, return_sketch=True, risk_free_col=self.risk_free_col, periods_per_year=periods
+        )
+        produced = set(features["Ticker"])
+
+        for stream, ticker in enumerate(tickers):
+            # Too short to produce any feature row: retry with more history
+            if ticker not in produced:
+                continue
+
+            history = df[df["Ticker"] == ticker]
+            self.states[ticker] = TickerFeatureState(
+                prices=history["Adj Close"].to_numpy(dtype=float)[-PRICE_HISTORY:],
+                last_date=pd.Timestamp(history["Date"].max()).isoformat(),
+                regime_state=sketch.state(stream),
+                # Rates of the stored returns (the first bar has no return)
+                risk_free=self._risk_free(history, periods)[1:][-(PRICE_HISTORY - 1):],
+                periods_per_year=periods,
+            )
+
+        return features
+
+    def update(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Extend known tickers bar by bar; returns the complete feature rows.
+        """
+        rows = []
+        for ticker, new_rows in df.groupby("Ticker", sort=False, observed=True):
+            state = self.states[ticker]
+            values = []
+            for i, (date, price, rf) in enumerate(zip(
+                new_rows["Date"], new_rows["Adj Close"],
+                self._risk_free(new_rows, state.periods_per_year),
+            )):
+                if i == len(new_rows) - 1:
+                    self.previous[ticker] = state.to_dict()
+                values.append(state.update(date, price, rf))
+            rows.append(new_rows.assign(**pd.DataFrame(values, index=new_rows.index)))
+
+        if not rows:
+            return pd.DataFrame()
+
+        out = pd.concat(rows)
+        out["vol_regime"] = pd.Categorical(
+            out["vol_regime"], categories=REGIME_LABELS, ordered=True
+        )
+        return out.dropna(subset=FEATURE_COLUMNS + ["vol_regime"]).reset_index(drop=True)
+
+    def write(self, df: pd.DataFrame) -> Path:
+        self.store_path.mkdir(parents=True, exist_ok=True)
+        now = datetime.utcnow()
+        date_str = now.date().isoformat()
+        # Names sort in write order, which read_features relies on
+        out_file = self.store_path / f"part-{now:%Y%m%dT%H%M%S%f}-{uuid.uuid4().hex[:8]}.parquet"
+        df.to_parquet(out_file, index=False, **self.dtype_policy.parquet_options(df))
+
+        ArtifactCatalog().register(
+            layer="features",
+            domain="equities",
+            path=out_file,
+            partition=self.partition or "incremental",
+            data_date=date_str,
+            row_count=len(df),
+        )
+        return out_file
+
+    def run(self) -> Path:
+        self.load_state()
+        df = self.load()
+
+        known = df["Ticker"].isin(self.states.keys())
+        # A new ticker's newest bar goes through update() like a known
+        # ticker's, so the state before it is kept for the next run
+        newest = df.index.isin(df[~known].groupby("Ticker", observed=True).tail(1).index)
+        bootstrapped = self.bootstrap(df[~known & ~newest]) if (~known & ~newest).any() else None
+
+        rest = df[known | newest]
+        rest = rest[rest["Ticker"].isin(self.states.keys())]
+        parts = [bootstrapped, self.update(rest) if len(rest) else None]
+        parts = [p for p in parts if p is not None and len(p)]
+
+        new_rows = 0
+        if parts:
+            df_feat = self.dtype_policy.apply(pd.concat(parts, ignore_index=True))
+            self.write(df_feat)
+            new_rows = len(df_feat)
+
+        self.save_state()
+
+        EventDispatcher.emit(
+            event_type="FEATURES_READY",
+            payload={
+                "domain": "equities",
+                "partition": self.partition,
+                "feature_path": str(self.store_path),
+                "row_count": new_rows,
+                "incremental": True,
+            },
+        )
+
+        return self.store_path
@@ -0,0 +1,152 @@
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from datetime import datetime
+
+from src.catalog.artifact_catalog import ArtifactCatalog
+from src.event_bus.event_dispatcher import EventDispatcher
+from src.pipeline.bar_frequency import TRADING_DAYS
+from src.pipeline.perf import collect, instrumented
+
+
+# Business days between an observation's date and the day it is known.
+# FRED publishes the effective fed funds rate for day t on day t + 1.
+PUBLICATION_LAG = {"DFF": 1}
+DEFAULT_LAG = 1
+
+
+def daily_risk_free(annual_pct, periods_per_year: int = TRADING_DAYS) -> np.ndarray:
+    """
+    Annualized percent rate (e.g. DFF = 5.33) to a per-bar return;
+    periods_per_year is the bar count of a year (252 for daily bars).
+    """
+    return np.asarray(annual_pct, dtype=float) / 100 / periods_per_year
+
+
+def broadcast(df: pd.DataFrame, table: pd.DataFrame) -> pd.DataFrame:
+    """
+    Attach every column of a per-date as-of table (sorted Date index) to
+    df. Each row takes the last table row at or before its Date, so the
+    table may be a business-day calendar coarser than df's dates.
+    """
+    dates = df["Date"].to_numpy(dtype="datetime64[ns]")
+    row = np.searchsorted(table.index.to_numpy(dtype="datetime64[ns]"), dates, side="right") - 1
+
+    for column in table.columns:
+        values = table[column].to_numpy(dtype=float)
+        df[column] = np.where(row >= 0, values[np.maximum(row, 0)], np.nan)
+
+    return df
+
+
+class MacroEnricher:
+    """
+    Point-in-time as-of join of macro series onto a (Date, Ticker) frame.
+
+    Each observation becomes usable only after its publication lag. The
+    latest usable value of every indicator is resolved once per distinct
+    Date with a sorted searchsorted lookup, and the resulting per-date
+    table is broadcast to all rows, so the cost is O(dates x indicators)
+    plus one gather, independent of the number of tickers.
+
+    run() precomputes the table on a business-day calendar once per
+    pipeline run; feature stages then only broadcast it.
+    """
+
+    def __init__(self, macro_paths: dict, publication_lag: dict = None):
+        """
+        macro_paths: {indicator: Silver macro Parquet path}
+        publication_lag: {indicator: business days}, defaults to
+        PUBLICATION_LAG and then DEFAULT_LAG.
+        """
+        self.macro_paths = macro_paths
+        self.publication_lag = {**PUBLICATION_LAG, **(publication_lag or {})}
+
+    def load(self) -> dict:
+        """
+        {indicator: (available_at, values)} sorted by availability.
+        """
+        series = {}
+        for indicator, path in self.macro_paths.items():
+            df = pd.read_parquet(Path(path))
+            value_col = indicator if indicator in df.columns else df.columns.drop("date")[0]
+            df = df.sort_values("date")
+
+            lag = self.publication_lag.get(indicator, DEFAULT_LAG)
+            observed = df["date"].to_numpy(dtype="datetime64[D]")
+            available = np.busday_offset(observed, lag, roll="forward")
+
+            series[indicator] = (
+                available.astype("datetime64[ns]"),
+                df[value_col].to_numpy(dtype=float),
+            )
+        return series
+
+    def as_of(self, dates) -> pd.DataFrame:
+        """
+        Latest published value of every indicator at each date
+        (index: sorted unique dates, one column per indicator).
+        """
+        calendar = np.unique(np.asarray(dates, dtype="datetime64[ns]"))
+        table = pd.DataFrame(index=pd.DatetimeIndex(calendar, name="Date"))
+
+        for indicator, (available, values) in self.load().items():
+            idx = np.searchsorted(available, calendar, side="right") - 1
+            table[indicator] = np.where(idx >= 0, values[np.maximum(idx, 0)], np.nan)
+
+        return table
+
+    @instrumented("as_of")
+    def calendar(self, start=None, end=None) -> pd.DataFrame:
+        """
+        As-of table over every business day from the first observation
+        (or start) to end (default: today).
+        """
+        if start is None:
+            start = min(available[0] for available, _ in self.load().values())
+        end = end or datetime.utcnow().date()
+        return self.as_of(pd.bdate_range(start, end).to_numpy())
+
+    def enrich(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add one column per indicator to df, aligned on df["Date"].
+        """
+        return broadcast(df, self.as_of(df["Date"]))
+
+    @instrumented("write", writes=True)
+    def write(self, table: pd.DataFrame) -> Path:
+        date_str = datetime.utcnow().date().isoformat()
+        out_dir = Path("data") / "features" / "macro" / date_str
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        out_file = out_dir / "as_of.parquet"
+        table.to_parquet(out_file)
+
+        ArtifactCatalog().register(
+            layer="features",
+            domain="macro",
+            path=out_file,
+            partition="as_of",
+            data_date=date_str,
+            row_count=len(table),
+        )
+
+        return out_file
+
+    def run(self) -> Path:
+        table = self.calendar()
+        macro_path = self.write(table)
+
+        EventDispatcher.emit(
+            event_type="MACRO_ENRICHMENT_READY",
+            payload={
+                "domain": "macro",
+                "partition": "as_of",
+                "macro_path": str(macro_path),
+                "indicators": list(table.columns),
+                "row_count": len(table),
+                "perf": collect(),
+            },
+        )
+
+        return macro_path
@@ -0,0 +1,177 @@
+import pandas as pd
+import numpy as np
+
+from src.features.macro_enrichment import daily_risk_free
+from src.features.quantile_sketch import regime_codes_2d
+from src.pipeline.bar_frequency import TRADING_DAYS
+
+
+REGIME_LABELS = ["LOW", "MEDIUM", "HIGH"]
+FEATURE_COLUMNS = ["return_1d", "vol_20d", "vol_60d", "cagr_60d", "sharpe_60d"]
+
+
+# ---------------------------------------------------------------------------
+# 2-D kernels: every column is one ticker's bar sequence, time runs down
+# axis 0. NaN marks missing bars (leading history or ragged padding).
+# ---------------------------------------------------------------------------
+
+def pct_change_2d(prices: np.ndarray) -> np.ndarray:
+    returns = np.full(prices.shape, np.nan)
+    returns[1:] = prices[1:] / prices[:-1] - 1
+    return returns
+
+
+def shift_ratio_2d(prices: np.ndarray, periods: int) -> np.ndarray:
+    ratio = np.full(prices.shape, np.nan)
+    if prices.shape[0] > periods:
+        ratio[periods:] = prices[periods:] / prices[:-periods]
+    return ratio
+
+
+def rolling_mean_std_2d(values: np.ndarray, window: int):
+    """
+    Rolling mean and sample std (ddof=1) along axis 0 using running
+    sums. A window containing any NaN yields NaN, like pandas
+    rolling(window) with the default min_periods.
+    """
+    mean = np.full(values.shape, np.nan)
+    std = np.full(values.shape, np.nan)
+    if values.shape[0] < window:
+        return mean, std
+
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+
+    zeros = np.zeros((1, values.shape[1]))
+    csum = np.concatenate([zeros, np.cumsum(filled, axis=0)])
+    csq = np.concatenate([zeros, np.cumsum(filled * filled, axis=0)])
+    ccount = np.concatenate([zeros, np.cumsum(valid, axis=0)])
+
+    wsum = csum[window:] - csum[:-window]
+    wsq = csq[window:] - csq[:-window]
+    full = (ccount[window:] - ccount[:-window]) == window
+
+    wmean = wsum / window
+    wvar = np.maximum((wsq - wsum * wmean) / (window - 1), 0.0)
+
+    mean[window - 1:] = np.where(full, wmean, np.nan)
+    std[window - 1:] = np.where(full, np.sqrt(wvar), np.nan)
+    return mean, std
+
+
+def compute_feature_matrices(
+    prices: np.ndarray,
+    risk_free: np.ndarray = None,
+    periods_per_year: int = TRADING_DAYS,
+) -> dict:
+    """
+    All equities features for a (bars x tickers) price matrix in one pass.
+    vol_regime is point-in-time (streaming quantile sketch per column);
+    the final sketch is returned under "regime_sketch".
+    risk_free (same shape, per-bar rate) makes sharpe_60d an excess-return
+    Sharpe; without it rf = 0. Windows are counted in bars; cagr_60d and
+    sharpe_60d are annualized with periods_per_year bars per year.
+    """
+    returns = pct_change_2d(prices)
+    _, vol_20d = rolling_mean_std_2d(returns, 20)
+    mean_60d, vol_60d = rolling_mean_std_2d(returns, 60)
+
+    excess_mean, excess_std = mean_60d, vol_60d
+    if risk_free is not None:
+        excess_mean, excess_std = rolling_mean_std_2d(returns - risk_free, 60)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cagr_60d = shift_ratio_2d(prices, 60) ** (periods_per_year / 60) - 1
+        sharpe_60d = excess_mean / excess_std * np.sqrt(periods_per_year)
+
+    regime_codes, regime_sketch = regime_codes_2d(vol_60d)
+
+    return {
+        "return_1d": returns,
+        "vol_20d": vol_20d,
+        "vol_60d": vol_60d,
+        "cagr_60d": cagr_60d,
+        "sharpe_60d": sharpe_60d,
+        "vol_regime": regime_codes,
+        "regime_sketch": regime_sketch,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Panel entry points
+# ---------------------------------------------------------------------------
+
+def build_panel_features(
+    df: pd.DataFrame,
+    return_sketch: bool = False,
+    risk_free_col: str = None,
+    periods_per_year: int = TRADING_DAYS,
+):
+    """
+    Features for a long (Date, Ticker) panel in a single vectorized pass.
+
+    Each ticker's bars are laid out as one column of a ragged matrix
+    indexed by bar position (not calendar date), so rolling windows and
+    shifts never cross tickers and match a per-ticker
+    EquitiesFeatureFactory.build_features run exactly.
+
+    With return_sketch=True also returns the final VolRegimeSketch and
+    the ticker order of its streams. risk_free_col names an annualized
+    percent rate column (e.g. an as-of joined DFF) for an excess-return
+    sharpe_60d. periods_per_year is the annualization factor of the
+    panel's bar frequency.
+    """
+    df = df.sort_values(["Ticker", "Date"]).reset_index(drop=True)
+
+    codes, tickers = pd.factorize(df["Ticker"], sort=True)
+    counts = np.bincount(codes)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    pos = np.arange(len(df)) - starts[codes]
+
+    prices = np.full((counts.max() if len(df) else 0, len(counts)), np.nan)
+    prices[pos, codes] = df["Adj Close"].to_numpy(dtype=float)
+
+    risk_free = None
+    if risk_free_col:
+        risk_free = np.full(prices.shape, np.nan)
+        risk_free[pos, codes] = daily_risk_free(df[risk_free_col], periods_per_year)
+
+    matrices = compute_feature_matrices(prices, risk_free, periods_per_year)
+
+    for name in FEATURE_COLUMNS:
+        df[name] = matrices[name][pos, codes]
+
+    df["vol_regime"] = pd.Categorical.from_codes(
+        matrices["vol_regime"][pos, codes],
+        categories=REGIME_LABELS,
+        ordered=True,
+    )
+
+    df = df.dropna().reset_index(drop=True)
+    if return_sketch:
+        return df, matrices["regime_sketch"], list(tickers)
+    return df
+
+
+def build_wide_features(prices: pd.DataFrame, periods_per_year: int = TRADING_DAYS) -> dict:
+    """
+    Features for a wide price matrix (Date index x Ticker columns).
+    Returns {feature name: DataFrame of the same shape}; vol_regime is
+    returned as string labels with NaN where undefined.
+    """
+    matrices = compute_feature_matrices(prices.to_numpy(dtype=float), periods_per_year=periods_per_year)
+
+    out = {
+        name: pd.DataFrame(matrices[name], index=prices.index, columns=prices.columns)
+        for name in FEATURE_COLUMNS
+    }
+
+    # Code -1 indexes the trailing NaN label
+    labels = np.array(REGIME_LABELS + [np.nan], dtype=object)
+    out["vol_regime"] = pd.DataFrame(
+        labels[matrices["vol_regime"]],
+        index=prices.index,
+        columns=prices.columns,
+    )
+
+    return out
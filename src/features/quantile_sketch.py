@@ -0,0 +1,303 @@
+import math
+
+import numpy as np
+
+
+class P2QuantileBank:
+    """
+    P² streaming quantile estimators (Jain & Chlamtac, 1985) for many
+    independent streams at once, e.g. one per ticker.
+
+    Each stream keeps five markers in constant memory; one update call
+    advances every stream by one observation with vectorized NumPy ops.
+    NaN observations are skipped for that stream.
+    """
+
+    def __init__(self, n_streams: int, p: float):
+        self.p = p
+        self.heights = np.zeros((n_streams, 5))
+        self.positions = np.tile(np.arange(1.0, 6.0), (n_streams, 1))
+        self.desired = np.tile(
+            np.array([1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5.0]), (n_streams, 1)
+        )
+        self.count = np.zeros(n_streams, dtype=np.int64)
+        self._increments = np.array([0, p / 2, p, (1 + p) / 2, 1.0])
+
+    def update(self, values: np.ndarray):
+        values = np.asarray(values, dtype=float)
+        seen = ~np.isnan(values)
+
+        # ---- Warm-up: the first five observations are stored verbatim ----
+        warming = seen & (self.count < 5)
+        if warming.any():
+            rows = np.flatnonzero(warming)
+            self.heights[rows, self.count[rows]] = values[rows]
+            self.count[rows] += 1
+
+            ready = rows[self.count[rows] == 5]
+            self.heights[ready] = np.sort(self.heights[ready], axis=1)
+
+        active = np.flatnonzero(seen & ~warming & (self.count >= 5))
+        if active.size == 0:
+            return
+
+        x = values[active]
+        q = self.heights[active]
+        n = self.positions[active]
+        self.count[active] += 1
+
+        # ---- Locate the cell and extend the extreme markers ----
+        q[:, 0] = np.minimum(q[:, 0], x)
+        q[:, 4] = np.maximum(q[:, 4], x)
+        cell = np.clip((x[:, None] >= q[:, 1:4]).sum(axis=1), 0, 3)
+
+        n += np.arange(5)[None, :] > cell[:, None]
+        desired = self.desired[active] + self._increments
+
+        # ---- Adjust the three middle markers ----
+        for i in (1, 2, 3):
+            d = desired[:, i] - n[:, i]
+            move = (
+                ((d >= 1) & (n[:, i + 1] - n[:, i] > 1))
+                | ((d <= -1) & (n[:, i - 1] - n[:, i] < -1))
+            )
+            if not move.any():
+                continue
+
+            s = np.sign(d[move])
+            qi, qm, qp = q[move, i], q[move, i - 1], q[move, i + 1]
+            ni, nm, np_ = n[move, i], n[move, i - 1], n[move, i + 1]
+
+            parabolic = qi + s / (np_ - nm) * (
+                (ni - nm + s) * (qp - qi) / (np_ - ni)
+                + (np_ - ni - s) * (qi - qm) / (ni - nm)
+            )
+
+            neighbour = np.where(s > 0, qp, qm)
+            n_neighbour = np.where(s > 0, np_, nm)
+            linear = qi + s * (neighbour - qi) / (n_neighbour - ni)
+
+            q[move, i] = np.where((qm < parabolic) & (parabolic < qp), parabolic, linear)
+            n[move, i] = ni + s
+
+        self.heights[active] = q
+        self.positions[active] = n
+        self.desired[active] = desired
+
+    def quantile(self) -> np.ndarray:
+        """
+        Current estimate per stream; exact while fewer than five
+        observations have been seen, NaN for an empty stream.
+        """
+        estimate = self.heights[:, 2].copy()
+        estimate[self.count == 0] = np.nan
+
+        for c in (1, 2, 3, 4):
+            rows = np.flatnonzero(self.count == c)
+            if rows.size:
+                estimate[rows] = np.quantile(self.heights[rows, :c], self.p, axis=1)
+
+        return estimate
+
+    def state(self, stream: int) -> list:
+        return [
+            self.heights[stream].tolist(),
+            self.positions[stream].tolist(),
+            self.desired[stream].tolist(),
+            int(self.count[stream]),
+        ]
+
+    @classmethod
+    def from_states(cls, states: list, p: float) -> "P2QuantileBank":
+        bank = cls(len(states), p)
+        for i, (heights, positions, desired, count) in enumerate(states):
+            bank.heights[i] = heights
+            bank.positions[i] = positions
+            bank.desired[i] = desired
+            bank.count[i] = count
+        return bank
+
+
+class P2Quantile:
+    """
+    Scalar P² estimator for a single stream. Uses the same arithmetic
+    and state layout as P2QuantileBank, so a stream bootstrapped by the
+    vectorized bank continues bit-for-bit here, at a fraction of the
+    per-observation overhead.
+    """
+
+    def __init__(self, p: float, state: list = None):
+        self.p = p
+        self._increments = [0, p / 2, p, (1 + p) / 2, 1.0]
+
+        if state is None:
+            state = [[0.0] * 5, [1.0, 2.0, 3.0, 4.0, 5.0],
+                     [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5.0], 0]
+
+        heights, positions, desired, count = state
+        self.heights = [float(v) for v in heights]
+        self.positions = [float(v) for v in positions]
+        self.desired = [float(v) for v in desired]
+        self.count = int(count)
+
+    def update(self, x: float):
+        # Plain float: NumPy bools would OR instead of add in the cell count
+        x = float(x)
+        if math.isnan(x):
+            return
+
+        q, n = self.heights, self.positions
+
+        if self.count < 5:
+            q[self.count] = x
+            self.count += 1
+            if self.count == 5:
+                q.sort()
+            return
+
+        self.count += 1
+
+        q[0] = min(q[0], x)
+        q[4] = max(q[4], x)
+        cell = (x >= q[1]) + (x >= q[2]) + (x >= q[3])
+
+        for j in range(cell + 1, 5):
+            n[j] += 1
+        for j in range(5):
+            self.desired[j] += self._increments[j]
+
+        for i in (1, 2, 3):
+            d = self.desired[i] - n[i]
+            if not (
+                (d >= 1 and n[i + 1] - n[i] > 1)
+                or (d <= -1 and n[i - 1] - n[i] < -1)
+            ):
+                continue
+
+            s = 1.0 if d > 0 else -1.0
+            qi, qm, qp = q[i], q[i - 1], q[i + 1]
+            ni, nm, np_ = n[i], n[i - 1], n[i + 1]
+
+            parabolic = qi + s / (np_ - nm) * (
+                (ni - nm + s) * (qp - qi) / (np_ - ni)
+                + (np_ - ni - s) * (qi - qm) / (ni - nm)
+            )
+
+            if qm < parabolic < qp:
+                q[i] = parabolic
+            elif s > 0:
+                q[i] = qi + s * (qp - qi) / (np_ - ni)
+            else:
+                q[i] = qi + s * (qm - qi) / (nm - ni)
+            n[i] = ni + s
+
+    def quantile(self) -> float:
+        if self.count == 0:
+            return math.nan
+        if self.count < 5:
+            return float(np.quantile(self.heights[:self.count], self.p))
+        return self.heights[2]
+
+    def state(self) -> list:
+        return [list(self.heights), list(self.positions), list(self.desired), self.count]
+
+
+class StreamingRegime:
+    """
+    Scalar counterpart of VolRegimeSketch for one ticker, used for
+    single-ticker and bar-by-bar feature updates.
+    """
+
+    def __init__(self, state: dict = None):
+        state = state or {}
+        self.lower = P2Quantile(1 / 3, state.get("lower"))
+        self.upper = P2Quantile(2 / 3, state.get("upper"))
+
+    def update(self, value: float) -> int:
+        """
+        Consume one value; returns code 0/1/2, or -1 for NaN.
+        """
+        if math.isnan(value):
+            return -1
+
+        self.lower.update(value)
+        self.upper.update(value)
+
+        if value <= self.lower.quantile():
+            return 0
+        if value <= self.upper.quantile():
+            return 1
+        return 2
+
+    def state(self) -> dict:
+        return {"lower": self.lower.state(), "upper": self.upper.state()}
+
+
+def regime_codes_1d(values: np.ndarray) -> np.ndarray:
+    """
+    Point-in-time regime codes for one stream (scalar sketch).
+    """
+    regime = StreamingRegime()
+    return np.array([regime.update(v) for v in values], dtype=np.int8)
+
+
+class VolRegimeSketch:
+    """
+    Point-in-time LOW/MEDIUM/HIGH volatility regime per stream.
+
+    Each bar is labelled against the expanding 1/3 and 2/3 quantiles of
+    the values seen up to and including that bar, so no future data is
+    used and memory stays constant per ticker.
+    """
+
+    def __init__(self, n_streams: int):
+        self.lower = P2QuantileBank(n_streams, 1 / 3)
+        self.upper = P2QuantileBank(n_streams, 2 / 3)
+
+    def update(self, values: np.ndarray) -> np.ndarray:
+        """
+        Consume one value per stream; returns int8 codes 0/1/2, -1 for NaN.
+        """
+        values = np.asarray(values, dtype=float)
+        self.lower.update(values)
+        self.upper.update(values)
+
+        low_edge = self.lower.quantile()
+        high_edge = self.upper.quantile()
+
+        codes = np.full(values.shape, -1, dtype=np.int8)
+        valid = ~np.isnan(values)
+        codes[valid] = 2
+        codes[valid & (values <= high_edge)] = 1
+        codes[valid & (values <= low_edge)] = 0
+        return codes
+
+    def state(self, stream: int) -> dict:
+        return {
+            "lower": self.lower.state(stream),
+            "upper": self.upper.state(stream),
+        }
+
+    @classmethod
+    def from_states(cls, states: list) -> "VolRegimeSketch":
+        sketch = cls(0)
+        sketch.lower = P2QuantileBank.from_states([s["lower"] for s in states], 1 / 3)
+        sketch.upper = P2QuantileBank.from_states([s["upper"] for s in states], 2 / 3)
+        return sketch
+
+
+def regime_codes_2d(values: np.ndarray):
+    """
+    Point-in-time regime codes for a (bars x streams) matrix, walking
+    time once with all streams updated together. Returns the codes and
+    the final sketch so callers can persist per-stream state.
+    """
+    sketch = VolRegimeSketch(values.shape[1])
+    codes = np.full(values.shape, -1, dtype=np.int8)
+
+    for t in range(values.shape[0]):
+        if np.isnan(values[t]).all():
+            continue
+        codes[t] = sketch.update(values[t])
+
+    return codes, sketch
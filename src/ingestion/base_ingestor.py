@@ -2,38 +2,131 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 import uuid
 import json
+import threading
 from pathlib import Path
 
+import pandas as pd
+
+from src.catalog.artifact_catalog import ArtifactCatalog
 from src.event_bus.event_dispatcher import EventDispatcher
+from src.ingestion.watermark_store import WatermarkStore
+from src.pipeline.perf import collect, instrumented
+
+
+class BronzeWriter:
+    """
+    Bronze bookkeeping shared by every writer of raw data: immutable
+    deltas (write_raw), the run log and DATA_INGESTED events (log_run)
+    and per-partition watermarks. Pull-based sources subclass
+    BaseIngestor; push-based feeds (see src/live) use a BronzeWriter
+    directly.
+    """
+
+    RUN_LOG = Path("metadata") / "run_log.jsonl"
 
+    # Writers may run concurrently (parallel DAG stages); run log
+    # appends must not interleave.
+    _log_lock = threading.Lock()
 
-class BaseIngestor(ABC):
-    def __init__(self, domain: str, source: str):
+    # Column holding the bar/observation timestamp, used for watermarks
+    WATERMARK_COLUMN = None
+
+    def __init__(
+        self,
+        domain: str,
+        source: str,
+        partition: str = None,
+        incremental: bool = True,
+        watermarks: WatermarkStore = None,
+        bronze_format: str = "parquet",
+    ):
         self.domain = domain
         self.source = source
+        self.partition = partition
+        self.incremental = incremental
+        self.watermarks = watermarks or WatermarkStore()
+        self.bronze_format = bronze_format
         self.run_id = str(uuid.uuid4())
         self.ingestion_timestamp = datetime.utcnow().isoformat()
 
-    @abstractmethod
-    def fetch(self):
+    def watermark(self):
         """
-        Fetch raw data from an external source.
-        Must be implemented by all concrete ingestors.
+        Timestamp of the newest bar already in Bronze, or None when a
+        full download is required (first run or incremental disabled).
         """
-        pass
+        if not self.incremental or self.WATERMARK_COLUMN is None:
+            return None
+        watermark = self.watermarks.get(self.domain, self.partition)
+        return pd.Timestamp(watermark) if watermark else None
+
+    def after_watermark(self, df: pd.DataFrame, watermark) -> pd.DataFrame:
+        """
+        Keep only rows strictly newer than the watermark. Providers often
+        return the boundary bar again; it is already stored.
+        """
+        if watermark is None or df.empty:
+            return df
+        ts = pd.to_datetime(df[self.WATERMARK_COLUMN], errors="coerce")
+        return df[ts > watermark]
+
+    def advance_watermark(self, df: pd.DataFrame):
+        if self.WATERMARK_COLUMN is None or df.empty:
+            return
+        newest = pd.to_datetime(df[self.WATERMARK_COLUMN], errors="coerce").max()
+        if pd.notna(newest):
+            self.watermarks.set(self.domain, self.partition, newest.isoformat())
 
-    def write_raw(self, data, file_ext: str = "csv") -> Path:
+    @staticmethod
+    def mixed_as_text(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        df with every object column that mixes types (numbers and text,
+        say) stored as the text received, which Parquet can hold. Nulls
+        stay null.
+        """
+        mixed = [
+            col for col in df.columns[df.dtypes == object]
+            if pd.api.types.infer_dtype(df[col], skipna=True) not in ("string", "empty")
+        ]
+        if not mixed:
+            return df
+        df = df.copy()
+        for col in mixed:
+            df[col] = df[col].map(lambda v: None if v is None or v is pd.NaT or v != v else str(v))
+        return df
+
+    def bronze_root(self) -> Path:
+        """
+        Directory holding every Bronze delta for this domain/partition.
+        """
+        base_path = Path("data") / "bronze" / self.domain
+        if self.partition:
+            base_path = base_path / self.partition
+        return base_path
+
+    @instrumented("write", writes=True)
+    def write_raw(self, data, file_ext: str = "csv", part: int = None, data_date: str = None) -> Path:
         """
         Write raw data to the Bronze layer.
         Raw data is immutable and stored exactly as received.
+        Each run writes its own delta under <date>/<run_id>/, so re-runs
+        append new files instead of overwriting earlier ones.
+        Parquet keeps the values and dtypes exactly as the source returned
+        them, so Silver can read them without any text parsing.
+        Streaming ingestors roll several files into one run directory;
+        `part` numbers them raw_data.00000.<ext>, raw_data.00001.<ext>, ...
+        `data_date` replaces the ingestion date in the path, e.g. to file
+        intraday bars under their trading day.
         """
-        date_str = datetime.utcnow().date().isoformat()
-        base_path = Path("data") / "bronze" / self.domain / date_str
+        date_str = data_date or datetime.utcnow().date().isoformat()
+        base_path = self.bronze_root() / date_str / self.run_id
         base_path.mkdir(parents=True, exist_ok=True)
 
-        file_path = base_path / f"raw_data.{file_ext}"
+        file_name = f"raw_data.{file_ext}" if part is None else f"raw_data.{part:05d}.{file_ext}"
+        file_path = base_path / file_name
 
-        if file_ext == "csv":
+        if file_ext == "parquet":
+            data.to_parquet(file_path, index=False)
+        elif file_ext == "csv":
             data.to_csv(file_path, index=False)
         elif file_ext == "json":
             with open(file_path, "w") as f:
@@ -41,6 +134,16 @@ class BaseIngestor(ABC):
         else:
             raise ValueError(f"Unsupported file type: {file_ext}")
 
+        ArtifactCatalog().register(
+            layer="bronze",
+            domain=self.domain,
+            path=file_path,
+            partition=self.partition,
+            data_date=date_str,
+            run_id=self.run_id,
+            row_count=len(data),
+        )
+
         return file_path
 
     def log_run(
@@ -50,15 +153,22 @@ class BaseIngestor(ABC):
         record_count: int,
         status: str,
         error_message: str = None,
+        extra: dict = None,
+        files: list = None,
     ):
         """
         Append a single ingestion record to the run log.
-        Emit an event if ingestion succeeded.
+        Emit an event if ingestion succeeded; `extra` is merged into its
+        payload.
+        `files` lists the deltas of a run whose storage_path is a
+        directory, as {"path", "data_date", "record_count"} dicts, so the
+        catalog can be rebuilt file by file.
         """
         log_entry = {
             "run_id": self.run_id,
             "domain": self.domain,
             "source": self.source,
+            "partition": self.partition,
             "data_date": data_date,
             "ingestion_timestamp": self.ingestion_timestamp,
             "storage_path": str(storage_path),
@@ -66,10 +176,12 @@ class BaseIngestor(ABC):
             "status": status,
             "error_message": error_message,
         }
+        if files:
+            log_entry["files"] = [{**f, "path": str(f["path"])} for f in files]
 
-        log_file = Path("metadata") / "run_log.jsonl"
-        with open(log_file, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        with BronzeWriter._log_lock:
+            with open(BronzeWriter.RUN_LOG, "a") as f:
+                f.write(json.dumps(log_entry) + "\n")
 
         # Emit event only on successful ingestion
         if status == "SUCCESS":
@@ -78,7 +190,20 @@ class BaseIngestor(ABC):
                 payload={
                     "run_id": self.run_id,
                     "domain": self.domain,
+                    "partition": self.partition,
                     "storage_path": str(storage_path),
                     "record_count": record_count,
+                    "perf": collect(),
+                    **(extra or {}),
                 },
             )
+
+
+class BaseIngestor(BronzeWriter, ABC):
+    @abstractmethod
+    def fetch(self):
+        """
+        Fetch raw data from an external source.
+        Must be implemented by all concrete ingestors.
+        """
+        pass
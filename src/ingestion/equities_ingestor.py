@@ -1,48 +1,109 @@
-import yfinance as yf
 import pandas as pd
 from datetime import datetime
 
 from src.ingestion.base_ingestor import BaseIngestor
+from src.pipeline.bar_frequency import check_frequency, partition_name
+from src.pipeline.perf import instrumented
+from src.sources.providers import get_source
 
 
-class EquitiesIngestor(BaseIngestor):
-    def __init__(self, ticker: str):
-        super().__init__(domain="equities", source="yfinance")
-        self.ticker = ticker
+def fetch_yahoo(ticker: str, start=None, interval: str = "1d") -> pd.DataFrame:
+    # Full refresh pulls one year (intraday: all Yahoo keeps); incremental
+    # runs only ask for new bars
+    return get_source("yahoo").fetch(ticker, start, interval)
 
-    def fetch(self) -> pd.DataFrame:
-        """
-        Fetch equities data with a resilient fallback strategy.
-        Primary: Yahoo Finance
-        Fallback: Stooq
-        """
 
-        try:
-            df = yf.download(
-                self.ticker,
-                period="1y",
-                interval="1d",
-                auto_adjust=True,
-                progress=False,
-                threads=False,
-            )
+def fetch_stooq(ticker: str, start=None, interval: str = "1d") -> pd.DataFrame:
+    return get_source("stooq").fetch(ticker, start, interval)
 
-            if df is None or df.empty:
-                raise ValueError("Yahoo returned empty dataframe")
 
-            df = df.reset_index()
+# Ordered fallback chain: (source name, fetch function).
+# Fetch functions take (ticker, start, interval); start=None means a full
+# download. A source without the interval raises and the next one is tried.
+# The defaults go through the shared HTTP source layer (src/sources), which
+# pools connections, retries with backoff, rate-limits and caches responses.
+DEFAULT_PRICE_SOURCES = [
+    ("yahoo", fetch_yahoo),
+    ("stooq", fetch_stooq),
+]
 
-        except Exception as yahoo_error:
-            print(f"[WARN] Yahoo failed for {self.ticker}: {yahoo_error}")
-            print("[FALLBACK] Using Stooq data source")
 
-            import pandas_datareader.data as web
+class EquitiesIngestor(BaseIngestor):
+    WATERMARK_COLUMN = "Date"
+
+    def __init__(
+        self,
+        ticker: str,
+        price_sources: list = None,
+        rate_limiters: dict = None,
+        incremental: bool = True,
+        watermarks=None,
+        bronze_format: str = "parquet",
+        interval: str = "1d",
+    ):
+        """
+        interval: bar frequency ("1d", "1h", "30m", "15m", "5m", "1m").
+        Intraday bars get their own partition (e.g. AAPL_1m) and Bronze
+        deltas are split by trading day, data/bronze/equities/AAPL_1m/
+        <day>/<run_id>/, so no single file holds more than one session.
+        """
+        super().__init__(
+            domain="equities",
+            source="yfinance",
+            partition=partition_name(ticker, interval),
+            incremental=incremental,
+            watermarks=watermarks,
+            bronze_format=bronze_format,
+        )
+        self.ticker = ticker
+        self.interval = check_frequency(interval)
+        self.price_sources = price_sources or DEFAULT_PRICE_SOURCES
+        self.rate_limiters = rate_limiters or {}
 
-            df = web.DataReader(
-                self.ticker,
-                data_source="stooq",
-                start="2023-01-01",
-            ).reset_index()
+    @instrumented("fetch")
+    def fetch(self, since=None) -> pd.DataFrame:
+        """
+        Fetch equities data with a resilient fallback strategy.
+        Sources are tried in order (default: Yahoo Finance, then Stooq);
+        each call waits on that source's rate limiter if one is configured.
+        When `since` is given only bars from the watermark's day on are
+        requested: that session may still have been open when its bar(s)
+        were stored, so it is fetched again.
+        An empty result is a valid delta when `since` is given (nothing
+        new yet); on a full download it counts as a source failure.
+        """
+        start = None
+        if since is not None and self.interval == "1d":
+            start = since.date().isoformat()
+        elif since is not None:
+            start = since.normalize().isoformat()
+
+        df = None
+        last_error = None
+
+        for i, (name, fetch_fn) in enumerate(self.price_sources):
+            if i > 0:
+                print(f"[FALLBACK] Using {name} data source for {self.ticker}")
+
+            limiter = self.rate_limiters.get(name)
+            if limiter is not None:
+                limiter.acquire()
+
+            try:
+                result = fetch_fn(self.ticker, start, self.interval)
+                if result.empty and since is None:
+                    raise ValueError("returned no bars")
+                df = result
+                break
+            except Exception as source_error:
+                print(f"[WARN] {name} failed for {self.ticker}: {source_error}")
+                last_error = source_error
+
+        if df is None:
+            raise RuntimeError(
+                f"[INGESTION FAILED] All sources failed for {self.ticker}: "
+                f"{last_error}"
+            )
 
         # ---- Hard contract checks ----
         if "Date" not in df.columns:
@@ -53,19 +114,68 @@ class EquitiesIngestor(BaseIngestor):
         df["Ticker"] = self.ticker
         return df
 
+    def after_watermark(self, df: pd.DataFrame, watermark) -> pd.DataFrame:
+        """
+        Keep the watermark bar itself: it may have been stored while its
+        session was still open, and Silver's keep-last de-duplication
+        replaces it with the revision.
+        """
+        if watermark is None or df.empty:
+            return df
+        ts = pd.to_datetime(df[self.WATERMARK_COLUMN], errors="coerce")
+        return df[ts >= watermark]
+
+    def write_sessions(self, df: pd.DataFrame) -> list:
+        """
+        One Bronze delta per trading day of intraday bars, oldest first;
+        returns their run log file records.
+        """
+        day = pd.to_datetime(df["Date"]).dt.normalize()
+        return [
+            {
+                "path": self.write_raw(bars, file_ext=self.bronze_format, data_date=session.date().isoformat()),
+                "data_date": session.date().isoformat(),
+                "record_count": len(bars),
+            }
+            for session, bars in df.groupby(day, sort=True)
+        ]
+
     def run(self):
         try:
-            df = self.fetch()
-            storage_path = self.write_raw(df, file_ext="csv")
+            since = self.watermark()
+            df = self.after_watermark(self.fetch(since), since)
+
+            if df.empty:
+                self.log_run(
+                    data_date=datetime.utcnow().date().isoformat(),
+                    storage_path="N/A",
+                    record_count=0,
+                    status="NO_NEW_DATA",
+                )
+                print(f"[SKIP] No new bars for {self.ticker} after {since}")
+                return None
+
+            files = None
+            if self.interval == "1d":
+                storage_path = self.write_raw(df, file_ext=self.bronze_format)
+                extra = None
+            else:
+                files = self.write_sessions(df)
+                storage_path = self.bronze_root()
+                extra = {"interval": self.interval, "sessions": [f["data_date"] for f in files]}
 
             self.log_run(
                 data_date=datetime.utcnow().date().isoformat(),
                 storage_path=storage_path,
                 record_count=len(df),
                 status="SUCCESS",
+                extra=extra,
+                files=files,
             )
+            self.advance_watermark(df)
 
             print(f"[SUCCESS] Ingested {len(df)} rows for {self.ticker}")
+            return storage_path
 
         except Exception as e:
             self.log_run(
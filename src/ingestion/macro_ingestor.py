@@ -1,26 +1,59 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 import pandas as pd
-from fredapi import Fred
 
 from src.ingestion.base_ingestor import BaseIngestor
+from src.pipeline.perf import instrumented
+from src.sources.providers import get_source
 
 
 class MacroIngestor(BaseIngestor):
-    def __init__(self, indicator: str):
-        super().__init__(domain="macro", source="FRED")
+    WATERMARK_COLUMN = "date"
+
+    def __init__(
+        self,
+        indicator: str,
+        incremental: bool = True,
+        watermarks=None,
+        bronze_format: str = "parquet",
+    ):
+        super().__init__(
+            domain="macro",
+            source="FRED",
+            partition=indicator,
+            incremental=incremental,
+            watermarks=watermarks,
+            bronze_format=bronze_format,
+        )
         self.indicator = indicator
-        self.fred = Fred()  # no API key required for public series
+        self.fred = get_source("fred")  # public CSV endpoint, no API key
+
+    @instrumented("fetch")
+    def fetch(self, since=None) -> pd.DataFrame:
+        """
+        Fetch the indicator series; with `since`, only newer observations.
+        """
+        observation_start = None
+        if since is not None:
+            observation_start = (since + timedelta(days=1)).date().isoformat()
 
-    def fetch(self) -> pd.DataFrame:
-        series = self.fred.get_series(self.indicator)
-        df = series.reset_index()
-        df.columns = ["date", self.indicator]
-        return df
+        return self.fred.fetch(self.indicator, start=observation_start)
 
     def run(self):
         try:
-            df = self.fetch()
-            storage_path = self.write_raw(df, file_ext="csv")
+            since = self.watermark()
+            df = self.after_watermark(self.fetch(since), since)
+
+            if df.empty:
+                self.log_run(
+                    data_date=datetime.utcnow().date().isoformat(),
+                    storage_path="N/A",
+                    record_count=0,
+                    status="NO_NEW_DATA",
+                )
+                print(f"[SKIP] No new observations for {self.indicator}")
+                return None
+
+            storage_path = self.write_raw(df, file_ext=self.bronze_format)
 
             self.log_run(
                 data_date=datetime.utcnow().date().isoformat(),
@@ -28,8 +61,10 @@ class MacroIngestor(BaseIngestor):
                 record_count=len(df),
                 status="SUCCESS",
             )
+            self.advance_watermark(df)
 
-            print(f"[SUCCESS] Ingested macro indicator {self.indicator}")
+            print(f"[SUCCESS] Ingested {len(df)} rows for macro indicator {self.indicator}")
+            return storage_path
 
         except Exception as e:
             self.log_run(
@@ -0,0 +1,541 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from src.catalog.artifact_catalog import ArtifactCatalog
+from src.ingestion.base_ingestor import BaseIngestor
+from src.pipeline.perf import instrumented
+
+
+# Finance-flavoured word -> weight lexicon (Loughran-McDonald style).
+# Positive weights are bullish, negative bearish.
+DEFAULT_LEXICON = {
+    # bullish
+    "beat": 2.0, "beats": 2.0, "surge": 2.5, "surges": 2.5, "soar": 2.5, "soars": 2.5,
+    "jump": 1.5, "jumps": 1.5, "rally": 2.0, "rallies": 2.0, "gain": 1.5, "gains": 1.5,
+    "rise": 1.0, "rises": 1.0, "record": 1.0, "upgrade": 2.0, "upgrades": 2.0,
+    "upgraded": 2.0, "outperform": 2.0, "strong": 1.5, "growth": 1.5, "profit": 1.5,
+    "profits": 1.5, "raises": 1.0, "boost": 1.5, "boosts": 1.5, "approval": 1.5,
+    "approved": 1.5, "expands": 1.0, "bullish": 2.5, "optimistic": 1.5, "rebound": 1.5,
+    "dividend": 0.5, "buyback": 1.0, "exceeds": 2.0, "tops": 1.5,
+    # bearish
+    "miss": -2.0, "misses": -2.0, "plunge": -2.5, "plunges": -2.5, "slump": -2.5,
+    "slumps": -2.5, "fall": -1.0, "falls": -1.0, "drop": -1.5, "drops": -1.5,
+    "tumble": -2.0, "tumbles": -2.0, "loss": -1.5, "losses": -1.5, "downgrade": -2.0,
+    "downgrades": -2.0, "downgraded": -2.0, "underperform": -2.0, "weak": -1.5,
+    "cut": -1.0, "cuts": -1.0, "lawsuit": -1.5, "probe": -1.5, "fraud": -3.0,
+    "recall": -1.5, "bankruptcy": -3.0, "default": -2.5, "layoffs": -2.0,
+    "warning": -1.5, "warns": -1.5, "bearish": -2.5, "investigation": -1.5,
+    "decline": -1.0, "declines": -1.0, "fine": -1.0, "fined": -1.5, "halts": -1.5,
+}
+
+NEGATORS = frozenset({"not", "no", "never", "without", "fails", "failed", "isn't", "won't"})
+
+
+class LexiconScorer:
+    """
+    Bag-of-words sentiment scored a whole batch at a time.
+
+    The batch is tokenized into one long token Series; lexicon lookup is a
+    single hashed Series.map, negation flips the weight of a token that
+    follows a negator in the same headline, and per-headline sums are
+    np.bincount reductions. No Python work is done per headline beyond
+    the regex tokenizer.
+
+    Any object with score(headlines: pd.Series) -> pd.DataFrame of
+    sentiment / positive_hits / negative_hits (e.g. a hashed linear model)
+    can stand in for it.
+    """
+
+    TOKEN = r"[a-z][a-z'\-]*"
+
+    def __init__(self, lexicon: dict = None, negators=NEGATORS, alpha: float = 15.0):
+        """
+        alpha normalizes the raw weight sum into (-1, 1) as
+        s / sqrt(s^2 + alpha), the VADER compound score.
+        """
+        self.lexicon = pd.Series(lexicon or DEFAULT_LEXICON, dtype=float)
+        self.negators = list(negators)
+        self.alpha = alpha
+
+    @classmethod
+    def from_csv(cls, path, **kwargs):
+        """
+        Lexicon from a two-column word,weight CSV.
+        """
+        df = pd.read_csv(path)
+        return cls(dict(zip(df.iloc[:, 0].str.lower(), df.iloc[:, 1])), **kwargs)
+
+    def score(self, headlines: pd.Series) -> pd.DataFrame:
+        n = len(headlines)
+        tokens = (
+            headlines.reset_index(drop=True)
+            .fillna("")
+            .astype(str)
+            .str.lower()
+            .str.findall(self.TOKEN)
+            .explode()
+            .dropna()
+        )
+        doc = tokens.index.to_numpy(dtype=np.int64)
+
+        weights = tokens.map(self.lexicon).to_numpy(dtype=float)
+        weights = np.nan_to_num(weights, nan=0.0)
+
+        negated = tokens.isin(self.negators).to_numpy()
+        follows_negator = np.zeros(len(tokens), dtype=bool)
+        follows_negator[1:] = negated[:-1] & (doc[1:] == doc[:-1])
+        weights[follows_negator] *= -1
+
+        total = np.bincount(doc, weights=weights, minlength=n)
+        positive = np.bincount(doc, weights=weights > 0, minlength=n)
+        negative = np.bincount(doc, weights=weights < 0, minlength=n)
+
+        return pd.DataFrame({
+            "sentiment": (total / np.sqrt(total ** 2 + self.alpha)).astype("float32"),
+            "positive_hits": positive.astype("int16"),
+            "negative_hits": negative.astype("int16"),
+        })
+
+
+# ---------------------------------------------------------------------------
+# Feeds: async iterators of raw line chunks
+# ---------------------------------------------------------------------------
+
+class FileHeadlineFeed:
+    """
+    Replays a local headline file (one JSON object or plain headline per
+    line) in chunks of roughly chunk_bytes. Reads run on a worker thread
+    so the event loop keeps scoring and writing meanwhile.
+    """
+
+    def __init__(self, path, chunk_bytes: int = 1 << 20):
+        self.path = Path(path)
+        self.chunk_bytes = chunk_bytes
+
+    def __str__(self):
+        return f"file:{self.path}"
+
+    async def chunks(self):
+        with open(self.path, encoding="utf-8", errors="replace") as f:
+            while True:
+                lines = await asyncio.to_thread(f.readlines, self.chunk_bytes)
+                if not lines:
+                    return
+                yield lines
+
+
+class SocketHeadlineFeed:
+    """
+    Newline-delimited headlines from a TCP stream until the peer closes
+    it. The socket is only read when the pipeline has room for another
+    chunk, so a slow consumer throttles the sender through TCP flow
+    control instead of buffering without bound.
+    """
+
+    def __init__(self, host: str, port: int, chunk_bytes: int = 1 << 16):
+        self.host = host
+        self.port = port
+        self.chunk_bytes = chunk_bytes
+
+    def __str__(self):
+        return f"tcp:{self.host}:{self.port}"
+
+    async def chunks(self):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        remainder = b""
+        try:
+            while True:
+                data = await reader.read(self.chunk_bytes)
+                if not data:
+                    break
+                data = remainder + data
+                # Only decode up to the last complete line; a multi-byte
+                # character may straddle two reads
+                cut = data.rfind(b"\n") + 1
+                remainder = data[cut:]
+                if cut:
+                    yield data[:cut].decode("utf-8", errors="replace").splitlines()
+            if remainder:
+                yield [remainder.decode("utf-8", errors="replace")]
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+
+_END = object()
+
+
+class SentimentIngestor(BaseIngestor):
+    """
+    Streaming headline ingestion into the Bronze sentiment domain.
+
+    An asyncio pipeline of bounded queues:
+
+        feed -> [chunks] -> batcher -> [batches] -> scorer -> [scored] -> writer
+
+    Each stage blocks on a full downstream queue, so a slow scorer or
+    writer stops the feed from being read (backpressure) and memory stays
+    bounded at roughly queue_size batches per queue. Batches close at
+    batch_size headlines or after max_batch_latency seconds, whichever
+    comes first, and are scored vectorized. The writer rolls a new
+    Bronze Parquet file every roll_rows headlines or roll_seconds, and
+    every rolled file is logged and announced with its own DATA_INGESTED
+    event.
+
+    Headline fields are stored as received (a missing timestamp is
+    filled with received_at, and a field mixing numbers and text across
+    lines is stored as text); the scorer's columns and received_at are
+    added next to them.
+
+    Headlines are identified by the feed's "id" when it sends one, else
+    by timestamp and text. Many headlines can share the watermark's
+    timestamp, so at the watermark they are de-duplicated by that key
+    (keys stored at the watermark are read back from Bronze on start)
+    rather than all dropped; repeats inside a batch are dropped too.
+    """
+
+    WATERMARK_COLUMN = "timestamp"
+
+    def __init__(
+        self,
+        feed,
+        partition: str = "headlines",
+        scorer=None,
+        line_format: str = "jsonl",
+        batch_size: int = 10_000,
+        max_batch_latency: float = 0.25,
+        queue_size: int = 8,
+        roll_rows: int = 250_000,
+        roll_seconds: float = 60.0,
+        incremental: bool = True,
+        watermarks=None,
+    ):
+        """
+        feed: FileHeadlineFeed, SocketHeadlineFeed or anything with an
+        async chunks() iterator of line lists. line_format "jsonl" expects
+        objects with at least a "headline" (and ideally "timestamp") key;
+        "text" treats every line as a bare headline.
+        """
+        if line_format not in ("jsonl", "text"):
+            raise ValueError(f"Unsupported line format: {line_format}")
+
+        super().__init__(
+            domain="sentiment",
+            source=str(feed),
+            partition=partition,
+            incremental=incremental,
+            watermarks=watermarks,
+            bronze_format="parquet",
+        )
+        self.feed = feed
+        self.scorer = scorer or LexiconScorer()
+        self.line_format = line_format
+        self.batch_size = batch_size
+        self.max_batch_latency = max_batch_latency
+        self.queue_size = queue_size
+        self.roll_rows = roll_rows
+        self.roll_seconds = roll_seconds
+
+        self.since = None
+        # Newest timestamp seen and the keys of the headlines stamped with it
+        self.boundary = None
+        self.boundary_keys = set()
+        self.files = []
+        self.headlines = 0
+        self.dropped = 0
+        self.max_depth = {}
+
+    def fetch(self):
+        """
+        Async iterator of raw line chunks from the feed.
+        """
+        return self.feed.chunks()
+
+    # ---- CPU stages (run on the ingestor's worker thread) ----
+
+    @staticmethod
+    def _parse_line(line: str) -> dict:
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            record = None
+        # Malformed lines are kept as received rather than dropped
+        return record if isinstance(record, dict) else {"headline": line}
+
+    @instrumented("parse")
+    def parse(self, lines: list, received_at: str) -> pd.DataFrame:
+        lines = [line.strip() for line in lines]
+        lines = [line for line in lines if line]
+
+        if self.line_format == "text":
+            df = pd.DataFrame({"headline": lines})
+        else:
+            # One C-level decode for the whole batch; fall back to
+            # line-by-line only when some line is not a JSON object
+            try:
+                records = json.loads("[" + ",".join(lines) + "]")
+                if not all(isinstance(r, dict) for r in records):
+                    raise ValueError
+            except ValueError:
+                records = [self._parse_line(line) for line in lines]
+            df = pd.DataFrame.from_records(records)
+
+        if "headline" not in df:
+            df["headline"] = None
+        if "timestamp" not in df:
+            df["timestamp"] = None
+        df["timestamp"] = df["timestamp"].fillna(received_at)
+        df["received_at"] = received_at
+        return df
+
+    # ---- De-duplication ----
+
+    @staticmethod
+    def key(df: pd.DataFrame) -> pd.Series:
+        """
+        uint64 identity of each headline: the feed's id when present,
+        otherwise its timestamp and text.
+        """
+        ident = df["timestamp"].astype(str) + "\x1f" + df["headline"].astype(str)
+        if "id" in df:
+            ident = ("id\x1f" + df["id"].astype(str)).where(df["id"].notna(), ident)
+        return pd.util.hash_pandas_object(ident, index=False)
+
+    def after_watermark(self, df: pd.DataFrame, watermark) -> pd.DataFrame:
+        """
+        Drop headlines older than the watermark, repeated in the batch or
+        already seen at the boundary timestamp. The newest headlines kept
+        move the boundary forward for later batches.
+        """
+        if df.empty:
+            return df
+        ts = pd.to_datetime(df[self.WATERMARK_COLUMN], errors="coerce")
+        keys = self.key(df)
+        fresh = ~keys.duplicated() & ~keys.isin(self.boundary_keys)
+        if watermark is not None:
+            # An unparseable timestamp cannot be placed against the
+            # watermark; such headlines are kept, as without one
+            fresh &= ts.isna() | (ts >= watermark)
+        fresh = fresh.to_numpy()
+        self.remember_boundary(ts[fresh], keys[fresh])
+        return df[fresh]
+
+    def remember_boundary(self, ts: pd.Series, keys: pd.Series):
+        newest = ts.max()
+        if pd.isna(newest) or (self.boundary is not None and newest < self.boundary):
+            return
+        at = set(keys[(ts == newest).to_numpy()])
+        if self.boundary is not None and newest == self.boundary:
+            at |= self.boundary_keys
+        self.boundary, self.boundary_keys = newest, at
+
+    def stored_keys(self, watermark) -> set:
+        """
+        Keys of the stored headlines stamped exactly at the watermark,
+        from the newest Bronze file holding any.
+        """
+        if watermark is None:
+            return set()
+        for path in reversed(ArtifactCatalog().under("bronze", self.bronze_root())):
+            if not path.exists() or path.suffix != ".parquet":
+                continue
+            names = pq.read_schema(path).names
+            df = pd.read_parquet(path, columns=[c for c in ("timestamp", "headline", "id") if c in names])
+            at = (pd.to_datetime(df["timestamp"], errors="coerce") == watermark).to_numpy()
+            if at.any():
+                return set(self.key(df[at]))
+        return set()
+
+    @instrumented("score")
+    def score_batch(self, lines: list, received_at: str) -> pd.DataFrame:
+        df = self.parse(lines, received_at)
+        before = len(df)
+        df = self.after_watermark(df, self.since).reset_index(drop=True)
+        self.dropped += before - len(df)
+
+        scores = self.scorer.score(df["headline"])
+        return pd.concat([df, scores], axis=1)
+
+    def flush(self, frames: list, opened: float):
+        # Feeds may send a field as a number on one line and text on the
+        # next (ids, prices); Parquet needs one type per column
+        df = self.mixed_as_text(pd.concat(frames, ignore_index=True))
+        storage_path = self.write_raw(df, file_ext=self.bronze_format, part=len(self.files))
+        seconds = time.perf_counter() - opened
+
+        self.log_run(
+            data_date=datetime.utcnow().date().isoformat(),
+            storage_path=storage_path,
+            record_count=len(df),
+            status="SUCCESS",
+            extra={
+                "part": len(self.files),
+                "open_s": round(seconds, 3),
+                "mean_sentiment": float(df["sentiment"].mean()),
+                "queue_high_water": dict(self.max_depth),
+            },
+        )
+        self.advance_watermark(df)
+        self.files.append(storage_path)
+        self.headlines += len(df)
+        return storage_path
+
+    # ---- asyncio pipeline ----
+
+    async def _put(self, q: asyncio.Queue, name: str, item):
+        await q.put(item)
+        self.max_depth[name] = max(self.max_depth.get(name, 0), q.qsize())
+
+    async def _read(self, chunks: asyncio.Queue):
+        try:
+            async for lines in self.fetch():
+                await self._put(chunks, "chunks", lines)
+        finally:
+            await chunks.put(_END)
+
+    async def _batch(self, chunks: asyncio.Queue, batches: asyncio.Queue):
+        loop = asyncio.get_running_loop()
+        pending = []
+        deadline = None
+
+        async def emit():
+            nonlocal pending, deadline
+            if pending:
+                await self._put(batches, "batches", (pending, datetime.utcnow().isoformat()))
+            pending, deadline = [], None
+
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            try:
+                lines = await asyncio.wait_for(chunks.get(), timeout)
+            except asyncio.TimeoutError:
+                await emit()
+                continue
+
+            if lines is _END:
+                await emit()
+                await batches.put(_END)
+                return
+
+            if deadline is None:
+                deadline = loop.time() + self.max_batch_latency
+            pending.extend(lines)
+            while len(pending) >= self.batch_size:
+                head, pending = pending[:self.batch_size], pending[self.batch_size:]
+                await self._put(batches, "batches", (head, datetime.utcnow().isoformat()))
+                if not pending:
+                    deadline = None
+
+    async def _score(self, batches: asyncio.Queue, scored: asyncio.Queue, executor):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await batches.get()
+            if batch is _END:
+                await scored.put(_END)
+                return
+            df = await loop.run_in_executor(executor, self.score_batch, *batch)
+            if not df.empty:
+                await self._put(scored, "scored", df)
+
+    async def _write(self, scored: asyncio.Queue, executor):
+        loop = asyncio.get_running_loop()
+        frames, rows, opened = [], 0, None
+
+        async def roll():
+            nonlocal frames, rows, opened
+            if frames:
+                await loop.run_in_executor(executor, self.flush, frames, opened)
+            frames, rows, opened = [], 0, None
+
+        while True:
+            timeout = None
+            if opened is not None:
+                timeout = max(0.0, self.roll_seconds - (time.perf_counter() - opened))
+            try:
+                df = await asyncio.wait_for(scored.get(), timeout)
+            except asyncio.TimeoutError:
+                await roll()
+                continue
+
+            if df is _END:
+                await roll()
+                return
+
+            if opened is None:
+                opened = time.perf_counter()
+            frames.append(df)
+            rows += len(df)
+            if rows >= self.roll_rows:
+                await roll()
+
+    async def stream(self):
+        chunks = asyncio.Queue(self.queue_size)
+        batches = asyncio.Queue(self.queue_size)
+        scored = asyncio.Queue(self.queue_size)
+
+        # Parsing, scoring and writing share one worker thread: they stay
+        # ordered, and their perf records land in one place for log_run
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="sentiment") as executor:
+            tasks = [
+                asyncio.create_task(self._read(chunks)),
+                asyncio.create_task(self._batch(chunks, batches)),
+                asyncio.create_task(self._score(batches, scored, executor)),
+                asyncio.create_task(self._write(scored, executor)),
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+
+    def run(self) -> dict:
+        start = time.perf_counter()
+        try:
+            self.since = self.watermark()
+            self.boundary, self.boundary_keys = self.since, self.stored_keys(self.since)
+            asyncio.run(self.stream())
+
+            seconds = time.perf_counter() - start
+            summary = {
+                "headlines": self.headlines,
+                "files": [str(p) for p in self.files],
+                "dropped_duplicate_or_stale": self.dropped,
+                "seconds": round(seconds, 3),
+                "headlines_per_s": round(self.headlines / seconds) if seconds > 0 else None,
+                "queue_high_water": dict(self.max_depth),
+            }
+
+            if not self.files:
+                self.log_run(
+                    data_date=datetime.utcnow().date().isoformat(),
+                    storage_path="N/A",
+                    record_count=0,
+                    status="NO_NEW_DATA",
+                )
+                print(f"[SKIP] No new headlines from {self.source}")
+                return summary
+
+            print(
+                f"[SUCCESS] Ingested {self.headlines} headlines from {self.source} "
+                f"into {len(self.files)} file(s) at {summary['headlines_per_s']:,}/s"
+            )
+            return summary
+
+        except Exception as e:
+            self.log_run(
+                data_date=datetime.utcnow().date().isoformat(),
+                storage_path="N/A",
+                record_count=self.headlines,
+                status="FAILED",
+                error_message=str(e),
+            )
+            raise
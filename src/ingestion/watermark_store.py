@@ -0,0 +1,63 @@
+import json
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+
+def _instant(watermark: str) -> pd.Timestamp:
+    """
+    Comparable point in time: offset-aware watermarks in naive UTC.
+    """
+    ts = pd.Timestamp(watermark)
+    return ts.tz_convert(None) if ts.tzinfo is not None else ts
+
+
+class WatermarkStore:
+    """
+    Per-(domain, partition) high-water marks for incremental ingestion.
+
+    The manifest is a small JSON file mapping "domain/partition" to the
+    ISO timestamp of the newest bar already captured in Bronze.
+    """
+
+    MANIFEST = Path("metadata") / "watermarks.json"
+
+    _lock = threading.Lock()
+
+    def __init__(self, manifest_path: Path = None):
+        self.manifest_path = Path(manifest_path or WatermarkStore.MANIFEST)
+
+    @staticmethod
+    def _key(domain: str, partition: str) -> str:
+        return f"{domain}/{partition}"
+
+    def _read(self) -> dict:
+        if not self.manifest_path.exists():
+            return {}
+        with open(self.manifest_path) as f:
+            return json.load(f)
+
+    def get(self, domain: str, partition: str):
+        with WatermarkStore._lock:
+            return self._read().get(self._key(domain, partition))
+
+    def set(self, domain: str, partition: str, watermark: str):
+        """
+        Advance the watermark. It never moves backwards.
+        """
+        with WatermarkStore._lock:
+            marks = self._read()
+            key = self._key(domain, partition)
+
+            current = marks.get(key)
+            if current is not None and _instant(current) >= _instant(watermark):
+                return
+
+            marks[key] = watermark
+
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(marks, f, indent=2, sort_keys=True)
+            tmp_path.replace(self.manifest_path)
@@ -0,0 +1,128 @@
+import json
+import queue
+import socket
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+
+FEED_COLUMNS = ["Date", "Open", "High", "Low", "Close", "Adj Close", "Volume", "Ticker"]
+
+_END = object()
+
+
+def recorded_bars(path) -> pd.DataFrame:
+    """
+    Recorded Silver/Bronze bars (Parquet file or dataset) in replay order:
+    by Date, tickers interleaved as an exchange would deliver them.
+    """
+    df = pd.read_parquet(path)
+    if "Adj Close" not in df.columns:
+        df["Adj Close"] = df["Close"]
+    df = df[FEED_COLUMNS].sort_values(["Date", "Ticker"], kind="stable")
+    df["Ticker"] = df["Ticker"].astype(str)
+    return df.reset_index(drop=True)
+
+
+class ReplayFeed:
+    """
+    In-process stand-in for an exchange feed: a producer thread replays
+    recorded bars into a bounded queue, the engine iterates over
+    (bar, received_ns) pairs. received_ns is stamped when the bar is
+    taken off the queue, so latency covers everything from receipt on.
+
+    speed=None replays as fast as the consumer keeps up; speed=60 plays
+    one recorded minute per second, and so on.
+    """
+
+    def __init__(self, bars, speed: float = None, queue_size: int = 10_000):
+        """
+        bars: a DataFrame of FEED_COLUMNS or a path to recorded bars.
+        """
+        if not isinstance(bars, pd.DataFrame):
+            bars = recorded_bars(Path(bars))
+        self.bars = bars
+        self.speed = speed
+        self.queue = queue.Queue(queue_size)
+
+    def _produce(self):
+        try:
+            records = self.bars.to_dict("records")
+            if self.speed is None:
+                for bar in records:
+                    self.queue.put(bar)
+                return
+
+            start_wall = time.perf_counter()
+            start_bar = records[0]["Date"] if records else None
+            for bar in records:
+                due = (bar["Date"] - start_bar).total_seconds() / self.speed
+                delay = start_wall + due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                self.queue.put(bar)
+        finally:
+            self.queue.put(_END)
+
+    def __iter__(self):
+        threading.Thread(target=self._produce, daemon=True).start()
+        while True:
+            bar = self.queue.get()
+            if bar is _END:
+                return
+            yield bar, time.perf_counter_ns()
+
+
+class SocketBarFeed:
+    """
+    Newline-delimited JSON bars from a TCP feed until the sender closes
+    the connection. Each bar is stamped on decode.
+    """
+
+    def __init__(self, host: str, port: int, chunk_bytes: int = 1 << 16):
+        self.host = host
+        self.port = port
+        self.chunk_bytes = chunk_bytes
+
+    def __iter__(self):
+        with socket.create_connection((self.host, self.port)) as sock:
+            # Bars are small; do not let Nagle hold them back
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            remainder = b""
+            while True:
+                data = sock.recv(self.chunk_bytes)
+                if not data:
+                    break
+                lines = (remainder + data).split(b"\n")
+                remainder = lines.pop()
+                for line in lines:
+                    if line:
+                        yield json.loads(line), time.perf_counter_ns()
+            if remainder.strip():
+                yield json.loads(remainder), time.perf_counter_ns()
+
+
+def send_replay(server: socket.socket, bars: pd.DataFrame, speed: float = None):
+    """
+    Replay recorded bars as JSONL to the first client that connects to
+    `server`, then close it.
+    """
+    conn, _ = server.accept()
+    with conn:
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        for bar, _ in ReplayFeed(bars, speed=speed):
+            bar = {**bar, "Date": pd.Timestamp(bar["Date"]).isoformat()}
+            conn.sendall(json.dumps(bar).encode() + b"\n")
+    server.close()
+
+
+def serve_replay(bars: pd.DataFrame, host: str = "127.0.0.1", port: int = 0, speed: float = None) -> int:
+    """
+    send_replay on a background thread; returns the bound port. Stands in
+    for an exchange gateway when testing SocketBarFeed.
+    """
+    server = socket.create_server((host, port))
+    threading.Thread(target=send_replay, args=(server, bars, speed), daemon=True).start()
+    return server.getsockname()[1]
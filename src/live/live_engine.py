@@ -0,0 +1,492 @@
+import json
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.catalog.artifact_catalog import ArtifactCatalog
+from src.event_bus.event_dispatcher import EventDispatcher
+from src.features.incremental_features import TickerFeatureState
+from src.features.panel_features import FEATURE_COLUMNS, REGIME_LABELS
+from src.ingestion.base_ingestor import BronzeWriter
+from src.pipeline.bar_frequency import check_frequency, periods_per_year
+from src.pipeline.dtype_policy import get_policy
+from src.signals.equities_signals import DEFAULT_RULES
+from src.signals.rule_dsl import RuleSet
+from src.validation.equities_schema import EquitiesBarValidator
+
+
+LATENCY_PERCENTILES = {"p50": 50, "p90": 90, "p99": 99, "p999": 99.9}
+
+# Records per slice when the checkpoint thread builds frames
+FRAME_SLICE = 500
+
+
+def _yield_gil():
+    # A waiting thread only gets the GIL back after the 5 ms switch
+    # interval unless the holder lets go; sleep(0) lets go at once
+    time.sleep(0)
+
+
+def _bar_date(value) -> pd.Timestamp:
+    """
+    A bar's Date as a naive UTC timestamp, so feeds that send offsets and
+    feeds that do not compare; raises ValueError if it cannot be parsed.
+    """
+    try:
+        date = pd.Timestamp(value)
+    except (ValueError, TypeError) as exc:
+        raise ValueError(f"Unparseable Date {value!r}") from exc
+    if date is pd.NaT:
+        raise ValueError("Date is missing")
+    if date.tzinfo is not None:
+        date = date.tz_convert("UTC").tz_localize(None)
+    return date
+
+
+def _frame(records: list) -> pd.DataFrame:
+    """
+    DataFrame of dict records, built in slices with the GIL released in
+    between so the bar loop is never held up for a whole conversion.
+    """
+    parts = []
+    for start in range(0, len(records), FRAME_SLICE):
+        parts.append(pd.DataFrame.from_records(records[start:start + FRAME_SLICE]))
+        _yield_gil()
+    return pd.concat(parts, ignore_index=True)
+
+
+class LatencyHistogram:
+    """
+    Latency counts in log-spaced buckets (2% wide, 100 ns to ~100 s):
+    fixed memory however long the session runs, percentiles within 2%.
+    """
+
+    MIN_NS = 100
+    GROWTH = 1.02
+    BUCKETS = int(math.log(1e11 / MIN_NS) / math.log(GROWTH)) + 1
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.total = 0
+        self.sum_ns = 0
+        self.max_ns = 0
+
+    @classmethod
+    def bucket(cls, ns: int) -> int:
+        if ns <= cls.MIN_NS:
+            return 0
+        return min(int(math.log(ns / cls.MIN_NS) / math.log(cls.GROWTH)), cls.BUCKETS - 1)
+
+    def add(self, ns: int, bucket: int):
+        self.counts[bucket] += 1
+        self.total += 1
+        self.sum_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def percentile(self, q: float) -> float:
+        """
+        Upper edge of the bucket holding the q-th percentile, in ns.
+        """
+        rank = q / 100 * self.total
+        cumulative = np.cumsum(self.counts)
+        i = int(np.searchsorted(cumulative, max(rank, 1)))
+        return min(self.MIN_NS * self.GROWTH ** (i + 1), self.max_ns)
+
+    def report(self) -> dict:
+        if not self.total:
+            return {"bars": 0}
+        report = {"bars": self.total, "mean_us": round(self.sum_ns / self.total / 1_000, 2)}
+        for name, q in LATENCY_PERCENTILES.items():
+            report[f"{name}_us"] = round(self.percentile(q) / 1_000, 2)
+        report["max_us"] = round(self.max_ns / 1_000, 2)
+        return report
+
+
+class LiveBarRecorder(BronzeWriter):
+    """
+    Bronze writer for live bars: every checkpoint appends one raw_data
+    part (all tickers) to this recorder's run under
+    bronze/equities/<partition>/.
+    """
+
+    WATERMARK_COLUMN = "Date"
+
+    def __init__(self, partition: str = "live", watermarks=None):
+        super().__init__(
+            domain="equities",
+            source="live",
+            partition=partition,
+            watermarks=watermarks,
+            bronze_format="parquet",
+        )
+        self.parts = 0
+
+    def advance_watermark(self, df: pd.DataFrame):
+        # Raw feed dates may mix offsets and include rejected values
+        if df.empty:
+            return
+        newest = pd.to_datetime(df[self.WATERMARK_COLUMN], errors="coerce", utc=True, format="ISO8601").max()
+        if pd.notna(newest):
+            self.watermarks.set(self.domain, self.partition, newest.tz_localize(None).isoformat())
+
+    def record(self, df: pd.DataFrame) -> Path:
+        # Rejected bars are kept too: a column mixing numbers and text is
+        # stored as the text received, which Parquet can hold
+        df = self.mixed_as_text(df)
+        storage_path = self.write_raw(df, file_ext=self.bronze_format, part=self.parts)
+        self.parts += 1
+        self.log_run(
+            data_date=datetime.utcnow().date().isoformat(),
+            storage_path=storage_path,
+            record_count=len(df),
+            status="SUCCESS",
+        )
+        self.advance_watermark(df)
+        return storage_path
+
+
+class LiveSignalEngine:
+    """
+    Bar-by-bar equities signals from a streaming feed.
+
+    For every bar: validate it against the equities schema rules
+    (EquitiesBarValidator, plus strictly increasing Date per ticker in
+    place of the (Ticker, Date) uniqueness check), extend the ticker's
+    TickerFeatureState by one bar, evaluate the signal rules compiled for
+    single records, and emit SIGNALS_READY. Nothing touches disk on this
+    path; receipt-to-emit latency of every bar goes into fixed-size
+    histograms (session, per ticker and per checkpoint interval).
+
+    Every checkpoint_bars bars or checkpoint_seconds the buffered bars are
+    handed to a background thread that writes them to the normal layers:
+    raw bars (rejected ones included) to Bronze, valid bars to Silver, feature rows to features and signal rows to signals,
+    all under the "live" partition and registered in the catalog, and the
+    feature state is saved so a restart resumes where it stopped.
+    """
+
+    STORE = Path("data") / "features" / "equities" / "live"
+
+    def __init__(
+        self,
+        rules=None,
+        partition: str = "live",
+        checkpoint_bars: int = 50_000,
+        checkpoint_seconds: float = 60.0,
+        store_path: Path = None,
+        warm_start: Path = None,
+        risk_free: float = 0.0,
+        dtype_policy: str = "compact",
+        watermarks=None,
+        bar_freq: str = "1d",
+    ):
+        """
+        warm_start: a feature state file (e.g. the incremental feature
+        store's _state.json) to seed tickers that have no live state yet.
+        risk_free: per-bar risk-free rate for the excess-return Sharpe.
+        bar_freq: frequency of the feed's bars; annualizes the features
+        of tickers without a saved state.
+        """
+        self.rules = RuleSet.load(rules or DEFAULT_RULES)
+        self.evaluate = self.rules.row_evaluator(categories={"vol_regime": REGIME_LABELS})
+        self.signal_columns = {
+            name: "signal" if i == 0 else f"signal_{name}"
+            for i, name in enumerate(self.rules.strategies)
+        }
+        self.partition = partition
+        self.checkpoint_bars = checkpoint_bars
+        self.checkpoint_seconds = checkpoint_seconds
+        self.store_path = Path(store_path or LiveSignalEngine.STORE)
+        self.state_file = self.store_path / "_state.json"
+        self.warm_start = warm_start
+        self.risk_free = risk_free
+        self.periods_per_year = periods_per_year(check_frequency(bar_freq))
+        self.dtype_policy = get_policy(dtype_policy)
+        self.watermarks = watermarks
+
+        self.states = {}
+        self.saved_states = {}
+        self.last_seen = {}
+        self.recorder = LiveBarRecorder(partition, watermarks)
+        self.dirty = set()
+
+        self.raw = []
+        self.rows = []
+        # Session, since-last-checkpoint and per-ticker latency
+        self.latency = LatencyHistogram()
+        self.interval_latency = LatencyHistogram()
+        self.ticker_latency = {}
+        self.bars = 0
+        self.rejected = 0
+        self.rejections = []
+        self.checkpoints = 0
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="live-checkpoint")
+        self._pending = None
+        self._last_checkpoint = time.perf_counter()
+
+    # ---- State ----
+
+    def load_state(self):
+        for path in (self.warm_start, self.state_file):
+            if path is None or not Path(path).exists():
+                continue
+            with open(path) as f:
+                raw = json.load(f)
+            # Live state written by an earlier session wins over warm start
+            for ticker, state in raw.items():
+                self.states[ticker] = TickerFeatureState.from_dict(state)
+                self.saved_states[ticker] = json.dumps(state)
+                if state["last_date"]:
+                    self.last_seen[ticker] = _bar_date(state["last_date"])
+
+    def save_state(self, snapshot: dict):
+        """
+        Rewrite the state file with the changed tickers' snapshots. Each
+        ticker is encoded on its own: one json.dump of every ticker is a
+        single long call that would hold the GIL throughout.
+        """
+        for ticker, state in snapshot.items():
+            self.saved_states[ticker] = json.dumps(state)
+            _yield_gil()
+
+        self.store_path.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.state_file.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            f.write("{")
+            f.write(",".join(f"{json.dumps(t)}: {s}" for t, s in self.saved_states.items()))
+            f.write("}")
+        tmp_file.replace(self.state_file)
+
+    # ---- Hot path ----
+
+    def on_bar(self, bar: dict, received_ns: int) -> dict:
+        """
+        Process one bar; returns its signal codes, or None if rejected.
+        """
+        self.bars += 1
+        self.raw.append(bar)
+        ticker = bar.get("Ticker")
+
+        date, errors = self.validate_bar(bar)
+
+        if errors:
+            self.rejected += 1
+            if len(self.rejections) < 100:
+                self.rejections.append({"ticker": ticker, "date": str(bar.get("Date")), "errors": errors})
+            return None
+
+        state = self.states.get(ticker)
+        if state is None:
+            state = self.states[ticker] = TickerFeatureState(periods_per_year=self.periods_per_year)
+        features = state.update(date, float(bar["Adj Close"]), self.risk_free)
+        self.last_seen[ticker] = date
+        self.dirty.add(ticker)
+
+        codes = self.evaluate(features)
+
+        EventDispatcher.emit(
+            event_type="SIGNALS_READY",
+            payload={
+                "domain": "equities",
+                "partition": self.partition,
+                "live": True,
+                "ticker": ticker,
+                "date": date.isoformat(),
+                **{self.signal_columns[name]: code for name, code in codes.items()},
+                # JSON has no NaN: warming-up features are null
+                "features": {
+                    k: None if isinstance(v, float) and math.isnan(v) else v
+                    for k, v in features.items()
+                },
+            },
+        )
+
+        self.record_latency(ticker, time.perf_counter_ns() - received_ns)
+
+        row = {**bar, "Date": date, **features}
+        for name, code in codes.items():
+            row[self.signal_columns[name]] = code
+        self.rows.append(row)
+        return codes
+
+    def validate_bar(self, bar: dict):
+        """
+        (Date, errors) of a bar: the schema rules, then a parseable Date
+        strictly after the ticker's previous bar. A bad bar is only ever
+        rejected; nothing here raises into the feed loop.
+        """
+        errors = EquitiesBarValidator.errors(bar)
+        if errors:
+            return None, errors
+
+        try:
+            date = _bar_date(bar["Date"])
+        except ValueError as exc:
+            return None, [str(exc)]
+
+        last = self.last_seen.get(bar["Ticker"])
+        if last is not None and date <= last:
+            return date, [f"Date {date} not after previous bar {last}"]
+        return date, []
+
+    def record_latency(self, ticker: str, ns: int):
+        bucket = LatencyHistogram.bucket(ns)
+        self.latency.add(ns, bucket)
+        self.interval_latency.add(ns, bucket)
+        histogram = self.ticker_latency.get(ticker)
+        if histogram is None:
+            histogram = self.ticker_latency[ticker] = LatencyHistogram()
+        histogram.add(ns, bucket)
+
+    # ---- Checkpoints ----
+
+    def checkpoint(self):
+        """
+        Hand the buffered bars and the changed tickers' state to the
+        checkpoint thread; at most one checkpoint is in flight.
+        """
+        raw, rows = self.raw, self.rows
+        self.raw, self.rows = [], []
+        snapshot = {t: self.states[t].to_dict() for t in self.dirty}
+        self.dirty = set()
+        latency, self.interval_latency = self.interval_latency, LatencyHistogram()
+        self._last_checkpoint = time.perf_counter()
+
+        if self._pending is not None:
+            self._pending.result()
+        self._pending = self._executor.submit(self._write_checkpoint, raw, rows, snapshot, latency)
+
+    def _write_part(self, df: pd.DataFrame, layer: str) -> Path:
+        date_str = datetime.utcnow().date().isoformat()
+        base_path = Path("data") / layer / "equities" / self.partition / date_str
+        base_path.mkdir(parents=True, exist_ok=True)
+
+        out_file = base_path / f"part-{datetime.utcnow():%H%M%S%f}-{self.checkpoints:05d}.parquet"
+        df = self.dtype_policy.apply(df)
+        df.to_parquet(out_file, index=False, **self.dtype_policy.parquet_options(df))
+
+        ArtifactCatalog().register(
+            layer=layer,
+            domain="equities",
+            path=out_file,
+            partition=self.partition,
+            data_date=date_str,
+            row_count=len(df),
+        )
+        return out_file
+
+    def _write_checkpoint(self, raw: list, rows: list, snapshot: dict, latency: LatencyHistogram):
+        paths = {}
+
+        if raw:
+            paths["bronze"] = str(self.recorder.record(_frame(raw)))
+
+        if rows:
+            df = _frame(rows)
+            df["vol_regime"] = pd.Categorical(df["vol_regime"], categories=REGIME_LABELS, ordered=True)
+            for column in self.signal_columns.values():
+                df[column] = df[column].astype(np.int8)
+
+            bar_columns = [c for c in df.columns if c not in FEATURE_COLUMNS + ["vol_regime"]
+                           and c not in self.signal_columns.values()]
+            paths["silver"] = str(self._write_part(df[bar_columns], "silver"))
+            _yield_gil()
+
+            # Batch features only keep fully warmed-up rows
+            features = df.dropna(subset=FEATURE_COLUMNS + ["vol_regime"])
+            feature_columns = [c for c in features.columns if c not in self.signal_columns.values()]
+            paths["features"] = str(self._write_part(features[feature_columns], "features"))
+            _yield_gil()
+            paths["signals"] = str(self._write_part(features, "signals"))
+
+        self.save_state(snapshot)
+        self.checkpoints += 1
+
+        EventDispatcher.emit(
+            event_type="LIVE_CHECKPOINT",
+            payload={
+                "domain": "equities",
+                "partition": self.partition,
+                "checkpoint": self.checkpoints,
+                "bars": len(raw),
+                "valid_bars": len(rows),
+                "paths": paths,
+                "state_path": str(self.state_file),
+                "latency": latency.report(),
+            },
+        )
+
+    # ---- Reporting ----
+
+    def latency_report(self) -> dict:
+        """
+        Receipt-to-emit latency percentiles in microseconds, overall and
+        for the slowest ticker at p99.
+        """
+        report = self.latency.report()
+        if not self.ticker_latency:
+            return report
+
+        per_ticker = {t: h.percentile(99) for t, h in self.ticker_latency.items()}
+        worst = max(per_ticker, key=per_ticker.get)
+        report["worst_ticker"] = str(worst)
+        report["worst_ticker_p99_us"] = round(per_ticker[worst] / 1_000, 2)
+        return report
+
+    def run(self, feed, max_bars: int = None) -> dict:
+        """
+        Consume (bar, received_ns) pairs from the feed until it ends,
+        max_bars is reached or the process is interrupted; the last
+        checkpoint is always written.
+        """
+        self.load_state()
+        start = time.perf_counter()
+
+        try:
+            for bar, received_ns in feed:
+                self.on_bar(bar, received_ns)
+
+                if (
+                    len(self.raw) >= self.checkpoint_bars
+                    or time.perf_counter() - self._last_checkpoint >= self.checkpoint_seconds
+                ):
+                    self.checkpoint()
+                if max_bars is not None and self.bars >= max_bars:
+                    break
+        finally:
+            if self.raw:
+                self.checkpoint()
+            if self._pending is not None:
+                self._pending.result()
+            self._executor.shutdown()
+
+        seconds = time.perf_counter() - start
+        report = {
+            "bars": self.bars,
+            "rejected": self.rejected,
+            "tickers": len(self.last_seen),
+            "checkpoints": self.checkpoints,
+            "seconds": round(seconds, 3),
+            "bars_per_s": round(self.bars / seconds) if seconds > 0 else None,
+            "latency": self.latency_report(),
+            "rejections": self.rejections[:10],
+        }
+
+        EventDispatcher.emit(
+            event_type="LIVE_SESSION_COMPLETE",
+            payload={"domain": "equities", "partition": self.partition, **report},
+        )
+
+        latency = report["latency"]
+        print(
+            f"[LIVE] {self.bars} bars ({self.rejected} rejected) at {report['bars_per_s']:,}/s; "
+            f"latency p50 {latency.get('p50_us', 0):.1f}us p99 {latency.get('p99_us', 0):.1f}us "
+            f"p99.9 {latency.get('p999_us', 0):.1f}us"
+        )
+        return report
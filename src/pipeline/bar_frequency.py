@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+
+# Regular US session: 09:30-16:00, 390 one-minute bars
+SESSION_OPEN = pd.Timedelta(hours=9, minutes=30)
+SESSION_MINUTES = 390
+TRADING_DAYS = 252
+
+# Supported bar frequencies, finest last; None is one bar per session
+BAR_MINUTES = {"1d": None, "1h": 60, "30m": 30, "15m": 15, "5m": 5, "1m": 1}
+
+
+def check_frequency(freq: str) -> str:
+    if freq not in BAR_MINUTES:
+        raise ValueError(f"Unsupported bar frequency: {freq}")
+    return freq
+
+
+def bars_per_day(freq: str) -> int:
+    """
+    Bars in one regular session; a trailing partial bar counts (the
+    15:30-16:00 bar of an hourly series).
+    """
+    minutes = BAR_MINUTES[check_frequency(freq)]
+    return 1 if minutes is None else -(-SESSION_MINUTES // minutes)
+
+
+def periods_per_year(freq: str) -> int:
+    """
+    Bars per year, the annualization factor for returns at this frequency.
+    """
+    return TRADING_DAYS * bars_per_day(freq)
+
+
+def infer_frequency(dates) -> str:
+    """
+    The supported frequency closest to the typical spacing of `dates`.
+    Gaps of a day or more (overnight, weekends) only occur between
+    sessions, so the median spacing within a session is used; a series
+    with no intraday spacing at all is daily.
+    """
+    stamps = np.unique(np.asarray(dates, dtype="datetime64[ns]"))
+    gaps = np.diff(stamps).astype("timedelta64[m]").astype(np.int64)
+    intraday = gaps[(gaps > 0) & (gaps < 24 * 60)]
+    if len(intraday) == 0:
+        return "1d"
+
+    minutes = np.median(intraday)
+    candidates = {f: m for f, m in BAR_MINUTES.items() if m is not None}
+    return min(candidates, key=lambda f: abs(candidates[f] - minutes))
+
+
+def partition_name(ticker: str, freq: str) -> str:
+    """
+    Storage partition of a ticker's bars: daily bars keep the bare ticker
+    (as before intraday support), other frequencies get their own, e.g.
+    AAPL_1m, so watermarks and Bronze deltas never mix frequencies.
+    """
+    return ticker if check_frequency(freq) == "1d" else f"{ticker}_{freq}"
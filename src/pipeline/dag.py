@@ -0,0 +1,279 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from src.event_bus.event_dispatcher import EventDispatcher
+from src.pipeline import perf
+
+
+class Stage:
+    """
+    One unit of work in the pipeline DAG.
+
+    func receives a dict {input artifact name: value} and returns the value
+    of its output artifact (e.g. the Path it wrote). A stage becomes ready
+    as soon as every input artifact has been produced.
+    """
+
+    def __init__(self, name: str, func, inputs=(), output: str = None):
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.output = output or name
+
+
+class DagOrchestrator:
+    """
+    Event-driven DAG runner.
+
+    Each finished stage publishes STAGE_COMPLETED (or STAGE_FAILED) on the
+    EventDispatcher; the orchestrator's subscriber reacts by scheduling
+    every stage whose inputs are now all available. Independent branches
+    and per-ticker fan-out therefore run concurrently on the worker pool.
+    A failed stage only skips its own downstream stages.
+
+    A stage whose events cannot be published, or whose event handling
+    fails, is marked FAILED directly, so run() always returns.
+    """
+
+    def __init__(self, stages: list, max_workers: int = 8):
+        self.stages = {s.name: s for s in stages}
+        self.max_workers = max_workers
+        self.run_id = str(uuid.uuid4())
+
+        self.producers = {s.output: s.name for s in stages}
+        self.artifacts = {}
+        self.status = {}
+        self.timings = {}
+        self.errors = {}
+
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._pool = None
+        self._t0 = None
+
+        self._validate()
+
+    def _validate(self):
+        if len(self.producers) != len(self.stages):
+            raise ValueError("Two stages declare the same output artifact")
+
+        for stage in self.stages.values():
+            missing = [a for a in stage.inputs if a not in self.producers]
+            if missing:
+                raise ValueError(f"Stage {stage.name} has unknown inputs: {missing}")
+
+        # Cycle check via Kahn's algorithm
+        indegree = {n: len(s.inputs) for n, s in self.stages.items()}
+        ready = [n for n, d in indegree.items() if d == 0]
+        seen = 0
+        while ready:
+            name = ready.pop()
+            seen += 1
+            for other in self._dependents(name):
+                indegree[other.name] -= 1
+                if indegree[other.name] == 0:
+                    ready.append(other.name)
+        if seen != len(self.stages):
+            raise ValueError("Pipeline DAG contains a cycle")
+
+    def _dependents(self, stage_name: str) -> list:
+        output = self.stages[stage_name].output
+        return [s for s in self.stages.values() if output in s.inputs]
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def _submit_ready(self):
+        """
+        Caller holds the lock.
+        """
+        for stage in self.stages.values():
+            if stage.name in self.status:
+                continue
+            if all(a in self.artifacts for a in stage.inputs):
+                self.status[stage.name] = "RUNNING"
+                try:
+                    self._pool.submit(self._execute, stage)
+                except RuntimeError as e:
+                    self._fail(stage.name, f"Could not schedule: {e}")
+
+    def _execute(self, stage: Stage):
+        try:
+            self._run_stage(stage)
+        except Exception as e:
+            # Emitting the stage's event failed, so _on_event never saw it
+            with self._lock:
+                if self.status.get(stage.name) == "RUNNING":
+                    self._fail(stage.name, f"{type(e).__name__}: {e}")
+                self._check_done()
+
+    def _run_stage(self, stage: Stage):
+        inputs = {a: self.artifacts[a] for a in stage.inputs}
+        start = time.perf_counter()
+        # Pool threads are reused; drop metrics a failed stage left behind
+        perf.reset()
+
+        try:
+            with perf.profiled(stage.name):
+                value = stage.func(inputs)
+        except Exception as e:
+            EventDispatcher.emit(
+                event_type="STAGE_FAILED",
+                payload={
+                    "dag_run_id": self.run_id,
+                    "stage": stage.name,
+                    "start_s": start - self._t0,
+                    "duration_s": time.perf_counter() - start,
+                    "error": str(e),
+                },
+            )
+            return
+
+        self._complete(stage, value, start)
+
+    def _complete(self, stage: Stage, value, start: float):
+        # Keep the in-memory value; the event carries its string form
+        with self._lock:
+            self.artifacts[stage.output] = value
+
+        EventDispatcher.emit(
+            event_type="STAGE_COMPLETED",
+            payload={
+                "dag_run_id": self.run_id,
+                "stage": stage.name,
+                "output": stage.output,
+                "value": None if value is None else str(value),
+                "start_s": start - self._t0,
+                "duration_s": time.perf_counter() - start,
+            },
+        )
+
+    def _on_event(self, event: dict):
+        payload = event["payload"]
+        if payload.get("dag_run_id") != self.run_id:
+            return
+
+        with self._lock:
+            name = payload["stage"]
+            # The dispatcher swallows handler errors; record them here
+            try:
+                self.timings[name] = (payload["start_s"], payload["duration_s"])
+
+                if event["event_type"] == "STAGE_COMPLETED":
+                    self.status[name] = "SUCCESS"
+                    self._submit_ready()
+                else:
+                    self._fail(name, payload["error"])
+            except Exception as e:
+                self._fail(name, f"Event handling failed: {type(e).__name__}: {e}")
+
+            self._check_done()
+
+    def _fail(self, name: str, error: str):
+        """
+        Caller holds the lock.
+        """
+        self.status[name] = "FAILED"
+        self.errors[name] = error
+        print(f"[DAG] Stage {name} failed: {error}")
+        self._skip_downstream(name)
+
+    def _check_done(self):
+        """
+        Caller holds the lock.
+        """
+        if all(s in ("SUCCESS", "FAILED", "SKIPPED") for s in self.status.values()) \
+                and len(self.status) == len(self.stages):
+            self._done.set()
+
+    def _skip_downstream(self, stage_name: str):
+        for other in self._dependents(stage_name):
+            if other.name not in self.status:
+                self.status[other.name] = "SKIPPED"
+                self._skip_downstream(other.name)
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def critical_path(self) -> list:
+        """
+        Longest chain of successful stages by summed duration.
+        """
+        longest = {}
+
+        def path_to(name):
+            if name not in longest:
+                stage = self.stages[name]
+                best = max(
+                    (path_to(self.producers[a]) for a in stage.inputs),
+                    key=lambda p: p[0],
+                    default=(0.0, []),
+                )
+                duration = self.timings.get(name, (0.0, 0.0))[1]
+                longest[name] = (best[0] + duration, best[1] + [name])
+            return longest[name]
+
+        done = [n for n, s in self.status.items() if s == "SUCCESS"]
+        if not done:
+            return []
+        return max((path_to(n) for n in done), key=lambda p: p[0])[1]
+
+    def report(self) -> dict:
+        rows = sorted(self.timings.items(), key=lambda kv: kv[1][0])
+
+        print("[DAG] Stage timings")
+        for name, (start_s, duration_s) in rows:
+            print(
+                f"  {name:<32} {self.status[name]:<8} "
+                f"start +{start_s:7.2f}s  took {duration_s:7.2f}s"
+            )
+        for name, status in self.status.items():
+            if name not in self.timings:
+                print(f"  {name:<32} {status}")
+
+        path = self.critical_path()
+        print(f"[DAG] Critical path: {' -> '.join(path)}")
+
+        return {
+            "timings": {
+                name: {"start_s": s, "duration_s": d} for name, (s, d) in rows
+            },
+            "status": dict(self.status),
+            "critical_path": path,
+            "wall_s": time.perf_counter() - self._t0,
+        }
+
+    # ------------------------------------------------------------------
+    # Entry point
+    # ------------------------------------------------------------------
+
+    def run(self) -> dict:
+        EventDispatcher.subscribe("STAGE_COMPLETED", self._on_event)
+        EventDispatcher.subscribe("STAGE_FAILED", self._on_event)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                self._pool = pool
+                self._t0 = time.perf_counter()
+
+                with self._lock:
+                    self._submit_ready()
+
+                if self.stages:
+                    self._done.wait()
+        finally:
+            EventDispatcher.unsubscribe("STAGE_COMPLETED", self._on_event)
+            EventDispatcher.unsubscribe("STAGE_FAILED", self._on_event)
+
+        summary = self.report()
+
+        EventDispatcher.emit(
+            event_type="PIPELINE_COMPLETE",
+            payload={"dag_run_id": self.run_id, **summary},
+        )
+
+        return summary
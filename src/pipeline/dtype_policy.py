@@ -0,0 +1,139 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+FLOAT32_MAX = np.finfo(np.float32).max
+
+
+class DtypePolicy:
+    """
+    Column dtypes a stage writes, applied just before every write.
+
+    The compact policy stores prices, returns and features as float32
+    (about 7 significant digits, ample for bar data and ratios), repeated
+    strings such as Ticker as dictionary-encoded categoricals and
+    position / trade flags as int8. Columns that compound money over
+    thousands of bars (the equity curve) stay float64. Computations still
+    run in float64; only the stored and carried frames are narrowed.
+
+    parquet_options() carries the matching encodings: dictionaries only
+    for low-cardinality columns, byte-stream-split for floats (their
+    exponent bytes then compress well) and zstd compression.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        float_dtype: str = None,
+        categorical_columns: tuple = (),
+        int8_columns: tuple = (),
+        float64_columns: tuple = (),
+        compression: str = None,
+        byte_stream_split: bool = False,
+    ):
+        self.name = name
+        self.float_dtype = float_dtype
+        self.categorical_columns = categorical_columns
+        self.int8_columns = int8_columns
+        self.float64_columns = float64_columns
+        self.compression = compression
+        self.byte_stream_split = byte_stream_split
+
+    def apply(self, df: pd.DataFrame, categoricals: bool = True) -> pd.DataFrame:
+        """
+        df with its columns narrowed (a copy); the resulting dtypes depend
+        on the policy only, never on the values. categoricals=False keeps
+        strings as-is, for writers that need one Arrow schema across
+        chunks (Parquet dictionary-encodes them on disk either way).
+        """
+        casts = {}
+        for column in df.columns:
+            dtype = df[column].dtype
+
+            if column in self.int8_columns and dtype != np.int8:
+                casts[column] = np.int8
+
+            elif (
+                categoricals
+                and column in self.categorical_columns
+                and not isinstance(dtype, pd.CategoricalDtype)
+            ):
+                casts[column] = "category"
+
+            elif (
+                self.float_dtype
+                and dtype == np.float64
+                and column not in self.float64_columns
+            ):
+                # The schema follows the policy alone; a value the narrow
+                # type cannot hold is an error, not a silent float64 column
+                values = df[column].to_numpy()
+                if (np.isfinite(values) & (np.abs(values) > FLOAT32_MAX)).any():
+                    raise ValueError(
+                        f"Column {column} exceeds the {self.float_dtype} range of the "
+                        f"{self.name} dtype policy; list it in float64_columns"
+                    )
+                casts[column] = self.float_dtype
+
+        return df.astype(casts) if casts else df
+
+    def parquet_options(self, df: pd.DataFrame) -> dict:
+        """
+        Writer keyword arguments for df, accepted by both
+        DataFrame.to_parquet and pyarrow.parquet.ParquetWriter.
+        """
+        options = {}
+        if self.compression:
+            options["compression"] = self.compression
+        if self.byte_stream_split:
+            floats = [c for c in df.columns if pd.api.types.is_float_dtype(df[c])]
+            options["use_byte_stream_split"] = floats
+            # Unique-valued floats only bloat a dictionary page
+            options["use_dictionary"] = [c for c in df.columns if c not in floats]
+        return options
+
+
+POLICIES = {
+    "compact": DtypePolicy(
+        "compact",
+        float_dtype="float32",
+        categorical_columns=("Ticker",),
+        int8_columns=("position", "trade"),
+        float64_columns=("equity",),
+        compression="zstd",
+        byte_stream_split=True,
+    ),
+    # pandas defaults, as written before the policy existed
+    "legacy": DtypePolicy("legacy"),
+}
+
+
+def get_policy(policy) -> DtypePolicy:
+    if isinstance(policy, DtypePolicy):
+        return policy
+    if policy not in POLICIES:
+        raise ValueError(f"Unsupported dtype policy: {policy}")
+    return POLICIES[policy]
+
+
+def footprint(stage: str, path: Path, df: pd.DataFrame = None) -> dict:
+    """
+    On-disk size of a stage's output and, when the frame is given, its
+    in-memory size. path may be a file or a directory of Parquet files
+    (Gold). Streaming writers never hold the whole frame and pass none.
+    """
+    path = Path(path)
+    files = [path] if path.is_file() else list(path.glob("*.parquet"))
+
+    report = {
+        "parquet_mb": round(sum(f.stat().st_size for f in files) / 1024 ** 2, 3),
+        "memory_mb": None,
+    }
+    if df is not None:
+        report["memory_mb"] = round(df.memory_usage(deep=True).sum() / 1024 ** 2, 3)
+
+    memory = f", {report['memory_mb']} MiB in memory" if df is not None else ""
+    print(f"[FOOTPRINT] {stage}: {report['parquet_mb']} MiB Parquet{memory}")
+    return report
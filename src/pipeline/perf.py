@@ -0,0 +1,303 @@
+import argparse
+import cProfile
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows: no getrusage, RSS deltas are reported as None
+    resource = None
+
+
+PROFILE_DIR = Path("metadata") / "profiles"
+
+# Step metrics of the stage running on this thread, drained by collect()
+_local = threading.local()
+
+
+def _steps() -> dict:
+    if not hasattr(_local, "steps"):
+        _local.steps = {}
+    return _local.steps
+
+
+def _sized() -> set:
+    # (step, input path) pairs already counted since the last reset
+    if not hasattr(_local, "sized"):
+        _local.sized = set()
+    return _local.sized
+
+
+def _max_rss_mb():
+    if resource is None:
+        return None
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1024 ** 2 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def _size(path) -> int:
+    if path is None:
+        return 0
+    path = Path(path)
+    if path.is_file():
+        return path.stat().st_size
+    if path.is_dir():
+        return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+    return 0
+
+
+def _rows(result, args) -> int:
+    for value in (result, *args):
+        if isinstance(value, pd.DataFrame):
+            return len(value)
+    # write_streaming returns (path, rows)
+    if isinstance(result, tuple) and len(result) == 2 and isinstance(result[1], int):
+        return result[1]
+    return 0
+
+
+def instrumented(step: str, reads: str = None, writes: bool = False):
+    """
+    Record wall time, thread CPU time, peak RSS growth, rows and bytes of
+    a stage method under `step`.
+
+    reads names the instance attribute holding the input path; its size
+    on disk (input_bytes, not bytes actually read: a projected Parquet
+    read touches less) is taken once per step and stage, however often
+    the step runs. writes=True sizes the returned path (bytes written).
+    Rows come from the DataFrame returned or passed in. Repeated calls
+    within one stage (e.g. per-chunk validation) accumulate.
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            wall = time.perf_counter()
+            cpu = time.thread_time()
+            rss = _max_rss_mb()
+
+            result = func(self, *args, **kwargs)
+
+            record = _steps().setdefault(step, {
+                "calls": 0,
+                "wall_s": 0.0,
+                "cpu_s": 0.0,
+                "rss_delta_mb": 0.0 if rss is not None else None,
+                "rows": 0,
+                "input_bytes": 0,
+                "bytes_written": 0,
+            })
+            record["calls"] += 1
+            record["wall_s"] += time.perf_counter() - wall
+            record["cpu_s"] += time.thread_time() - cpu
+            if rss is not None:
+                # Process-wide high-water mark: only growth beyond every
+                # earlier peak is attributed to this step
+                record["rss_delta_mb"] += _max_rss_mb() - rss
+            record["rows"] += _rows(result, args)
+            if reads:
+                source = getattr(self, reads, None)
+                if source is not None and (step, str(source)) not in _sized():
+                    _sized().add((step, str(source)))
+                    record["input_bytes"] += _size(source)
+            if writes:
+                # A path, (path, ...) or {name: path / (path, ...)}
+                outputs = result.values() if isinstance(result, dict) else [result]
+                for output in outputs:
+                    path = output[0] if isinstance(output, tuple) else output
+                    record["bytes_written"] += _size(path)
+
+            return result
+        return wrapper
+    return decorate
+
+
+def reset():
+    _steps().clear()
+    _sized().clear()
+
+
+def collect() -> dict:
+    """
+    Step metrics recorded on this thread since the last collect(), with
+    rows/sec, ready to attach to a lifecycle event payload.
+    """
+    steps = {}
+    for step, record in _steps().items():
+        steps[step] = {
+            **{k: round(v, 6) if isinstance(v, float) else v for k, v in record.items()},
+            "rows_per_s": round(record["rows"] / record["wall_s"]) if record["wall_s"] > 0 else None,
+        }
+    reset()
+    return steps
+
+
+# ---------------------------------------------------------------------------
+# Opt-in profiling: PERF_PROFILE=cprofile | sample
+# ---------------------------------------------------------------------------
+
+class _Sampler:
+    """
+    Samples one thread's Python stack every `interval` seconds into
+    collapsed-stack counts ("outer;inner count" lines, flamegraph input).
+    """
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{Path(code.co_filename).name}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def dump(self, path: Path):
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class profiled:
+    """
+    Context manager around one stage. With PERF_PROFILE=cprofile the
+    stage's thread is profiled with cProfile (metadata/profiles/*.prof,
+    readable with pstats / snakeviz); with PERF_PROFILE=sample its stack
+    is sampled every PERF_SAMPLE_MS ms into a collapsed-stack *.folded
+    file. Unset, it costs nothing.
+    """
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.mode = os.getenv("PERF_PROFILE", "")
+        self._profiler = None
+
+    def _path(self, suffix: str) -> Path:
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+        name = "".join(c if c.isalnum() or c in "-_" else "_" for c in self.stage).strip("_")
+        return PROFILE_DIR / f"{name}-{stamp}{suffix}"
+
+    def __enter__(self):
+        if self.mode == "cprofile":
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        elif self.mode == "sample":
+            interval = float(os.getenv("PERF_SAMPLE_MS", "5")) / 1000
+            self._profiler = _Sampler(threading.get_ident(), interval)
+            self._profiler.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self.mode == "cprofile":
+            self._profiler.disable()
+            self._profiler.dump_stats(self._path(".prof"))
+        elif self.mode == "sample":
+            self._profiler.stop()
+            self._profiler.dump(self._path(".folded"))
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Cross-run summary
+# ---------------------------------------------------------------------------
+
+def summarize(event_log: Path = None, top: int = 10) -> dict:
+    """
+    Slowest stages (STAGE_COMPLETED durations) and slowest instrumented
+    steps (event perf payloads) across every run in the event log.
+    Per-ticker stages such as features[AAPL] are grouped as features[*].
+    """
+    from src.event_bus.event_dispatcher import EventDispatcher
+
+    stages = defaultdict(list)
+    steps = defaultdict(lambda: defaultdict(list))
+
+    with open(event_log or EventDispatcher.EVENT_LOG) as f:
+        for line in f:
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            payload = event.get("payload", {})
+
+            if event.get("event_type") == "STAGE_COMPLETED":
+                name = payload["stage"].split("[")[0]
+                suffix = "[*]" if "[" in payload["stage"] else ""
+                stages[name + suffix].append(payload["duration_s"])
+
+            for step, record in (payload.get("perf") or {}).items():
+                key = f"{event['event_type']}/{payload.get('domain')}/{step}"
+                for metric in ("wall_s", "cpu_s", "rows_per_s", "input_bytes", "bytes_written"):
+                    if record.get(metric) is not None:
+                        steps[key][metric].append(record[metric])
+
+    def table(groups: dict, value) -> list:
+        rows = [
+            {"name": name, "runs": len(value(v)), "mean_s": sum(value(v)) / len(value(v)),
+             "max_s": max(value(v)), "total_s": sum(value(v))}
+            for name, v in groups.items() if value(v)
+        ]
+        return sorted(rows, key=lambda r: r["total_s"], reverse=True)[:top]
+
+    return {
+        "stages": table(stages, lambda durations: durations),
+        "steps": table(steps, lambda metrics: metrics["wall_s"]),
+        "step_metrics": {
+            key: {metric: sum(values) / len(values) for metric, values in metrics.items()}
+            for key, metrics in steps.items()
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Summarize the slowest stages across runs from the event log."
+    )
+    parser.add_argument("--log", type=Path, default=None)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    summary = summarize(args.log, args.top)
+
+    print("[PERF] Slowest stages (by total time across runs)")
+    for r in summary["stages"]:
+        print(f"  {r['name']:<28} runs {r['runs']:>5}  mean {r['mean_s']:8.3f}s  "
+              f"max {r['max_s']:8.3f}s  total {r['total_s']:9.2f}s")
+
+    print("[PERF] Slowest steps")
+    for r in summary["steps"]:
+        metrics = summary["step_metrics"][r["name"]]
+        print(f"  {r['name']:<44} calls {r['runs']:>5}  mean {r['mean_s']:8.3f}s  "
+              f"cpu {metrics.get('cpu_s', 0):7.3f}s  "
+              f"{metrics.get('rows_per_s', 0):>12,.0f} rows/s  "
+              f"input {metrics.get('input_bytes', 0) / 1024 ** 2:8.1f} MiB  "
+              f"written {metrics.get('bytes_written', 0) / 1024 ** 2:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
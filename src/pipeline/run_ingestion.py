@@ -1,59 +1,308 @@
-from pathlib import Path
+import os
+from datetime import datetime
+from functools import partial
 
+from src.event_bus.event_dispatcher import EventDispatcher
 from src.ingestion.equities_ingestor import EquitiesIngestor
 from src.ingestion.macro_ingestor import MacroIngestor
+from src.ingestion.rate_limiter import RateLimiter
+from src.sources import providers as sources
 from src.silver.equities_silver import EquitiesSilverProcessor
 from src.silver.macro_silver import MacroSilverProcessor
+from src.silver.bar_resampler import IntradayResampler
 from src.features.equities_features import EquitiesFeatureFactory
+from src.features.incremental_features import IncrementalFeatureEngine
+from src.features.macro_enrichment import MacroEnricher
 from src.signals.equities_signals import EquitiesSignalEngine
 from src.backtest.equities_backtest import EquitiesBacktester
+from src.pipeline.dag import DagOrchestrator, Stage
+from src.pipeline.stage_cache import StageCache
+from src.pipeline import bar_frequency, dtype_policy
+from src.silver import bronze_reader, equities_silver, macro_silver
+from src.validation import equities_schema, fast_validator, macro_schema
+from src.features import equities_features, incremental_features, macro_enrichment, panel_features, quantile_sketch
+from src.signals import equities_signals, rule_dsl
+from src.backtest import bootstrap, equities_backtest
 
 
-if __name__ == "__main__":
+# ---- Stage functions: (static args..., inputs) -> output artifact ----
+# Stages downstream of Bronze are memoized through the StageCache when one
+# is given: unchanged inputs, parameters and code reuse the last output.
+
+def _cached(cache, stage, compute, inputs, params, code, event_type):
+    if cache is None:
+        return compute()
+    return cache.run(stage, compute, inputs, params, code, event_type)
+
+
+def bar_interval():
+    return os.getenv("BAR_INTERVAL", "1d")
+
+
+def ingest_equities(ticker, rate_limiters, inputs):
+    ingestor = EquitiesIngestor(ticker, rate_limiters=rate_limiters, interval=bar_interval())
+    ingestor.run()
+    # Silver reads every incremental delta in the ticker's partition
+    return ingestor.bronze_root()
+
+
+def silver_equities(ticker, cache, inputs):
+    bronze_path = inputs[f"bronze/equities/{ticker}"]
+    interval = bar_interval()
+    # Bounded-memory Silver for large backfills; the default for minute bars
+    processor = EquitiesSilverProcessor(
+        bronze_path,
+        partition=bar_frequency.partition_name(ticker, interval),
+        streaming=os.getenv("SILVER_STREAMING", "0" if interval == "1d" else "1") == "1",
+        dtype_policy=os.getenv("DTYPE_POLICY", "compact"),
+    )
+    return _cached(
+        cache, f"silver_equities[{ticker}]", processor.run,
+        inputs=[bronze_path],
+        params={
+            "partition": processor.partition,
+            "streaming": processor.streaming,
+            "dtype_policy": processor.dtype_policy.name,
+        },
+        code=[equities_silver, bronze_reader, equities_schema, fast_validator, dtype_policy],
+        event_type="DATA_VALIDATED",
+    )
+
+
+def resample_equities(ticker, freqs, inputs):
+    # Not cached: one streaming pass over minute Silver writes every
+    # frequency, and the stage's output is a {freq: path} mapping
+    resampler = IntradayResampler(
+        inputs[f"silver/equities/{ticker}"],
+        ticker,
+        freqs=freqs,
+        dtype_policy=os.getenv("DTYPE_POLICY", "compact"),
+    )
+    return resampler.run()
+
+
+def enrich_macro(indicators, cache, inputs):
+    macro_paths = {ind: inputs[f"silver/macro/{ind}"] for ind in indicators}
+    enricher = MacroEnricher(macro_paths)
+    return _cached(
+        cache, "macro_enrichment", enricher.run,
+        inputs=list(macro_paths.values()),
+        params={
+            "indicators": sorted(indicators),
+            "publication_lag": enricher.publication_lag,
+            # The calendar runs to today
+            "as_of": datetime.utcnow().date().isoformat(),
+        },
+        code=[macro_enrichment],
+        event_type="MACRO_ENRICHMENT_READY",
+    )
+
+
+def build_features(ticker, cache, risk_free_col, inputs):
+    silver_path = inputs[f"silver/equities/{ticker}"]
+    macro_path = inputs.get("features/macro/as_of")
+    partition = bar_frequency.partition_name(ticker, bar_interval())
+
+    if os.getenv("INCREMENTAL_FEATURES", "1") == "1":
+        # Not cached: the engine keeps per-ticker state and only processes
+        # the Silver bars it has not seen, so a re-run is already cheap
+        engine = IncrementalFeatureEngine(
+            silver_path,
+            partition=partition,
+            macro_path=macro_path,
+            risk_free_col=risk_free_col if macro_path else None,
+            dtype_policy=os.getenv("DTYPE_POLICY", "compact"),
+            bar_freq=bar_interval(),
+        )
+        return engine.run()
+
+    factory = EquitiesFeatureFactory(
+        silver_path,
+        partition=partition,
+        macro_path=macro_path,
+        risk_free_col=risk_free_col if macro_path else None,
+        dtype_policy=os.getenv("DTYPE_POLICY", "compact"),
+        bar_freq=bar_interval(),
+    )
+    return _cached(
+        cache, f"features[{ticker}]", factory.run,
+        inputs=[p for p in (silver_path, macro_path) if p],
+        params={
+            "partition": factory.partition,
+            "panel": factory.panel,
+            "risk_free_col": factory.risk_free_col,
+            "dtype_policy": factory.dtype_policy.name,
+            "bar_freq": factory.bar_freq,
+        },
+        code=[equities_features, panel_features, quantile_sketch, macro_enrichment, bar_frequency, dtype_policy],
+        event_type="FEATURES_READY",
+    )
+
 
-    # ---- Bronze: Equities ----
-    try:
-        equities = EquitiesIngestor("AAPL")
-        equities.run()
-    except Exception as e:
-        print(f"[PIPELINE HALT] Equities ingestion failed: {e}")
-        raise
+def generate_signals(ticker, cache, inputs):
+    feature_path = inputs[f"features/equities/{ticker}"]
+    engine = EquitiesSignalEngine(
+        feature_path,
+        partition=bar_frequency.partition_name(ticker, bar_interval()),
+        dtype_policy=os.getenv("DTYPE_POLICY", "compact"),
+    )
+    return _cached(
+        cache, f"signals[{ticker}]", engine.run,
+        inputs=[feature_path],
+        params={"partition": engine.partition, "dtype_policy": engine.dtype_policy.name},
+        code=[equities_signals, rule_dsl, incremental_features, dtype_policy],
+        event_type="SIGNALS_READY",
+    )
 
-    # ---- Bronze: Macro ----
-    macro = MacroIngestor(indicator="DFF")
-    macro.run()
 
-    # ---- Silver: Equities ----
-    bronze_equities_file = max(
-        Path("data/bronze/equities").rglob("raw_data.csv"),
-        key=lambda p: p.stat().st_mtime,
+def run_backtest(ticker, cache, inputs):
+    signal_path = inputs[f"signals/equities/{ticker}"]
+    backtester = EquitiesBacktester(
+        signal_path,
+        partition=bar_frequency.partition_name(ticker, bar_interval()),
+        dtype_policy=os.getenv("DTYPE_POLICY", "compact"),
+        bootstrap_paths=int(os.getenv("BOOTSTRAP_PATHS", "2000")),
+        bar_freq=bar_interval(),
+    )
+    return _cached(
+        cache, f"backtest[{ticker}]", backtester.run,
+        inputs=[signal_path],
+        params={
+            "partition": backtester.partition,
+            "bar_freq": backtester.bar_freq,
+            "initial_capital": backtester.initial_capital,
+            "txn_cost": backtester.txn_cost,
+            "dtype_policy": backtester.dtype_policy.name,
+            "bootstrap_paths": backtester.resampler.n_paths if backtester.resampler else 0,
+        },
+        code=[equities_backtest, bootstrap, rule_dsl, bar_frequency, dtype_policy],
+        event_type="BACKTEST_COMPLETE",
     )
 
-    equities_silver = EquitiesSilverProcessor(bronze_equities_file)
-    silver_equities_path = equities_silver.run()
-    print(f"[SILVER] Equities validated → {silver_equities_path}")
 
-    # ---- Silver: Macro ----
-    bronze_macro_file = max(
-        Path("data/bronze/macro").rglob("raw_data.csv"),
-        key=lambda p: p.stat().st_mtime,
+def ingest_macro(indicator, inputs):
+    ingestor = MacroIngestor(indicator=indicator)
+    ingestor.run()
+    return ingestor.bronze_root()
+
+
+def silver_macro(indicator, cache, inputs):
+    bronze_path = inputs[f"bronze/macro/{indicator}"]
+    processor = MacroSilverProcessor(bronze_path, partition=indicator)
+    return _cached(
+        cache, f"silver_macro[{indicator}]", processor.run,
+        inputs=[bronze_path],
+        params={"partition": indicator},
+        code=[macro_silver, bronze_reader, macro_schema, fast_validator],
+        event_type="DATA_VALIDATED",
     )
 
-    macro_silver = MacroSilverProcessor(bronze_macro_file)
-    silver_macro_path = macro_silver.run()
-    print(f"[SILVER] Macro validated → {silver_macro_path}")
 
-    # ---- Features ----
-    features = EquitiesFeatureFactory(silver_equities_path)
-    features_path = features.run()
-    print(f"[FEATURES] Written → {features_path}")
+def build_pipeline(
+    tickers: list,
+    indicators: list,
+    rate_limiters: dict = None,
+    cache: StageCache = None,
+    risk_free_col: str = "DFF",
+    resample_freqs: list = None,
+) -> list:
+    """
+    One Bronze -> Silver -> Features -> Signals -> Gold chain per ticker
+    and one Bronze -> Silver chain per macro indicator. The macro chains
+    meet in a single enrichment stage that builds the as-of table once;
+    every ticker's feature stage waits for it and broadcasts it by Date.
+    Ticker chains run concurrently with each other and, up to Silver,
+    with the macro branch.
+    resample_freqs (e.g. ["5m", "1h", "1d"]) adds a stage per ticker that
+    builds those bars from the ticker's intraday Silver.
+    """
+    stages = []
+
+    macro_inputs = []
+    if indicators:
+        macro_inputs = ["features/macro/as_of"]
+        stages.append(
+            Stage("macro_enrichment", partial(enrich_macro, indicators, cache),
+                  inputs=[f"silver/macro/{ind}" for ind in indicators],
+                  output="features/macro/as_of"),
+        )
+    if risk_free_col not in indicators:
+        risk_free_col = None
+
+    for t in tickers:
+        stages += [
+            Stage(f"ingest_equities[{t}]", partial(ingest_equities, t, rate_limiters),
+                  output=f"bronze/equities/{t}"),
+            Stage(f"silver_equities[{t}]", partial(silver_equities, t, cache),
+                  inputs=[f"bronze/equities/{t}"], output=f"silver/equities/{t}"),
+            Stage(f"features[{t}]", partial(build_features, t, cache, risk_free_col),
+                  inputs=[f"silver/equities/{t}", *macro_inputs],
+                  output=f"features/equities/{t}"),
+            Stage(f"signals[{t}]", partial(generate_signals, t, cache),
+                  inputs=[f"features/equities/{t}"], output=f"signals/equities/{t}"),
+            Stage(f"backtest[{t}]", partial(run_backtest, t, cache),
+                  inputs=[f"signals/equities/{t}"], output=f"gold/equities/{t}"),
+        ]
+        if resample_freqs:
+            stages.append(
+                Stage(f"resample_equities[{t}]", partial(resample_equities, t, resample_freqs),
+                      inputs=[f"silver/equities/{t}"], output=f"silver/equities/{t}/resampled"),
+            )
+
+    for ind in indicators:
+        stages += [
+            Stage(f"ingest_macro[{ind}]", partial(ingest_macro, ind),
+                  output=f"bronze/macro/{ind}"),
+            Stage(f"silver_macro[{ind}]", partial(silver_macro, ind, cache),
+                  inputs=[f"bronze/macro/{ind}"], output=f"silver/macro/{ind}"),
+        ]
+
+    return stages
+
+
+if __name__ == "__main__":
+
+    EventDispatcher.configure(durability=os.getenv("EVENT_DURABILITY", "event"))
+
+    tickers = os.getenv("EQUITIES_TICKERS", "AAPL").split(",")
+    tickers = [t.strip() for t in tickers if t.strip()]
+    indicators = os.getenv("MACRO_INDICATORS", "DFF").split(",")
+    indicators = [i.strip() for i in indicators if i.strip()]
+    # Coarser bars built from intraday Silver, e.g. BAR_INTERVAL=1m
+    # RESAMPLE_FREQS=5m,1h,1d
+    resample_freqs = [f.strip() for f in os.getenv("RESAMPLE_FREQS", "").split(",") if f.strip()]
+
+    # Shared per-provider limits across every concurrent ingestion stage,
+    # applied by the HTTP source layer to each request (retries included).
+    # Responses are cached on disk, so re-running a failed pipeline does
+    # not download everything again.
+    sources.configure(
+        rate_limiters={
+            "yahoo": RateLimiter(5, burst=5),
+            "stooq": RateLimiter(2, burst=2),
+            "fred": RateLimiter(2, burst=2),
+        },
+        ttl=float(os.getenv("HTTP_CACHE_TTL", "3600")),
+        cache=os.getenv("HTTP_CACHE", "1") != "0",
+    )
+
+    cache = None
+    if os.getenv("STAGE_CACHE", "1") != "0":
+        cache = StageCache(
+            max_bytes=int(float(os.getenv("STAGE_CACHE_MAX_MB", "2048")) * 1024 ** 2),
+            max_age_days=float(os.getenv("STAGE_CACHE_MAX_AGE_DAYS", "30")),
+        )
+
+    dag = DagOrchestrator(
+        build_pipeline(tickers, indicators, cache=cache, resample_freqs=resample_freqs),
+        max_workers=int(os.getenv("PIPELINE_WORKERS", "8")),
+    )
+    summary = dag.run()
+    if cache is not None:
+        cache.evict()
 
-    # ---- Signals ----
-    signals = EquitiesSignalEngine(features_path)
-    signals_path = signals.run()
-    print(f"[SIGNALS] Written → {signals_path}")
+    if dag.errors:
+        print(f"[PIPELINE HALT] {len(dag.errors)} stage(s) failed: {dag.errors}")
+        raise RuntimeError(f"Pipeline stages failed: {sorted(dag.errors)}")
 
-    # ---- Backtest (Gold) ----
-    backtester = EquitiesBacktester(signals_path)
-    gold_path = backtester.run()
-    print(f"[GOLD] Backtest results → {gold_path}")
+    print(f"[GOLD] Pipeline complete in {summary['wall_s']:.2f}s")
@@ -0,0 +1,360 @@
+import hashlib
+import inspect
+import json
+import shutil
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from src.event_bus.event_dispatcher import EventDispatcher
+
+
+class StageCache:
+    """
+    Content-addressed memoization for pipeline stages.
+
+    A stage's cache key is the SHA-256 of its input artifacts' bytes, its
+    parameters and the source of the code that computes it. The output of
+    a miss is copied into data/cache/<stage>/<key>/ so later same-day runs
+    that overwrite the dated output directory cannot corrupt it. On a hit
+    the cached copy is returned and the stage's lifecycle event is emitted
+    again with cache_hit=True.
+
+    Entries and the memoized file digests live in a SQLite index
+    (metadata/stage_cache.db), so a lookup or hit touches one row instead
+    of rewriting a manifest. evict(), called once the pipeline run is over,
+    removes entries least-recently-used first while the cache exceeds
+    max_bytes, and unconditionally after max_age_days. Entries this
+    instance stored or served are pinned and never evicted by it: their
+    paths may have been handed to downstream stages.
+    """
+
+    CACHE_DIR = Path("data") / "cache"
+    DB_PATH = Path("metadata") / "stage_cache.db"
+
+    _lock = threading.Lock()
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            key          TEXT PRIMARY KEY,
+            stage        TEXT NOT NULL,
+            path         TEXT NOT NULL,
+            source_path  TEXT NOT NULL,
+            bytes        INTEGER NOT NULL,
+            created      REAL NOT NULL,
+            last_used    REAL NOT NULL,
+            event        TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_entries_last_used ON entries (last_used);
+        CREATE TABLE IF NOT EXISTS files (
+            path         TEXT PRIMARY KEY,
+            fingerprint  TEXT NOT NULL,
+            sha256       TEXT NOT NULL
+        );
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path = None,
+        db_path: Path = None,
+        max_bytes: int = 2 * 1024 ** 3,
+        max_age_days: float = 30,
+    ):
+        self.cache_dir = Path(cache_dir or StageCache.CACHE_DIR)
+        self.db_path = Path(db_path or StageCache.DB_PATH)
+        self.max_bytes = max_bytes
+        self.max_age_s = max_age_days * 86_400
+        self.pinned = set()
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(self.SCHEMA)
+        return conn
+
+    def _execute(self, fn):
+        """
+        Run fn(conn) in one transaction under the lock.
+        """
+        with StageCache._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    return fn(conn)
+            finally:
+                conn.close()
+
+    # ------------------------------------------------------------------
+    # Hashing
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _files(path: Path) -> list:
+        path = Path(path)
+        if path.is_dir():
+            return sorted(p for p in path.rglob("*") if p.is_file())
+        return [path]
+
+    @staticmethod
+    def _fingerprint(path: Path) -> str:
+        stat = path.stat()
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _digests(self, paths: list) -> dict:
+        """
+        SHA-256 of each file, memoized on (size, mtime) so unchanged
+        Bronze deltas are not re-read on every run. Only new or changed
+        digests are written back.
+        """
+        fingerprints = {str(p): self._fingerprint(p) for p in paths}
+
+        def known(conn):
+            memo = {}
+            names = list(fingerprints)
+            # SQLite caps the number of bound parameters per statement
+            for i in range(0, len(names), 500):
+                batch = names[i:i + 500]
+                rows = conn.execute(
+                    f"SELECT * FROM files WHERE path IN ({','.join('?' * len(batch))})", batch
+                )
+                memo.update({r["path"]: r for r in rows})
+            return memo
+
+        memo = self._execute(known)
+
+        digests, changed = {}, []
+        for path, fingerprint in fingerprints.items():
+            row = memo.get(path)
+            if row is not None and row["fingerprint"] == fingerprint:
+                digests[path] = row["sha256"]
+            else:
+                digests[path] = self._hash_file(Path(path))
+                changed.append((path, fingerprint, digests[path]))
+
+        if changed:
+            self._execute(lambda conn: conn.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?)", changed
+            ))
+        return digests
+
+    @staticmethod
+    def code_version(code) -> str:
+        """
+        Hash the source files of the given modules, classes or functions.
+        """
+        digest = hashlib.sha256()
+        for source in sorted({inspect.getfile(obj) for obj in code}):
+            digest.update(Path(source).read_bytes())
+        return digest.hexdigest()
+
+    def key(self, stage: str, inputs: list, params: dict, code=()) -> str:
+        files = [(Path(root), path) for root in inputs for path in self._files(root)]
+        digests = self._digests([path for _, path in files])
+
+        digest = hashlib.sha256()
+        digest.update(stage.encode())
+        for root, path in files:
+            rel = path.relative_to(root) if root.is_dir() else path.name
+            digest.update(str(rel).encode())
+            digest.update(digests[str(path)].encode())
+
+        digest.update(json.dumps(params or {}, sort_keys=True, default=str).encode())
+        digest.update(self.code_version(code).encode())
+        return digest.hexdigest()
+
+    # ------------------------------------------------------------------
+    # Lookup & storage
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _entry(row) -> dict:
+        entry = dict(row)
+        entry["event"] = json.loads(entry["event"]) if entry["event"] else None
+        return entry
+
+    def get(self, key: str):
+        """
+        Return the cache entry for key, or None on a miss.
+        """
+        def lookup(conn):
+            row = conn.execute("SELECT * FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            if not Path(row["path"]).exists():
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+
+            now = time.time()
+            conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (now, key))
+            return {**self._entry(row), "last_used": now}
+
+        entry = self._execute(lookup)
+        if entry is not None:
+            self.pinned.add(key)
+        return entry
+
+    def put(self, key: str, stage: str, output: Path, event: dict = None) -> dict:
+        output = Path(output)
+        entry_dir = self.cache_dir / self._safe_name(stage) / key
+        cached = entry_dir / output.name
+
+        if entry_dir.exists():
+            shutil.rmtree(entry_dir)
+        entry_dir.mkdir(parents=True)
+        if output.is_dir():
+            shutil.copytree(output, cached)
+        else:
+            shutil.copy2(output, cached)
+
+        now = time.time()
+        entry = {
+            "key": key,
+            "stage": stage,
+            "path": str(cached),
+            "source_path": str(output),
+            "bytes": sum(p.stat().st_size for p in self._files(cached)),
+            "created": now,
+            "last_used": now,
+            "event": event,
+        }
+
+        def store(conn):
+            conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key, stage, entry["path"], entry["source_path"], entry["bytes"], now, now,
+                    json.dumps(event, default=str) if event else None,
+                ),
+            )
+
+        self._execute(store)
+        self.pinned.add(key)
+        return entry
+
+    @staticmethod
+    def _safe_name(stage: str) -> str:
+        return "".join(c if c.isalnum() or c in "-_" else "_" for c in stage)
+
+    def _evict(self, conn: sqlite3.Connection):
+        """
+        Caller holds the lock and the transaction.
+        """
+        now = time.time()
+        entries = conn.execute("SELECT key, path, bytes, created FROM entries ORDER BY last_used").fetchall()
+
+        expired = {
+            e["key"] for e in entries
+            if now - e["created"] > self.max_age_s and e["key"] not in self.pinned
+        }
+
+        total = sum(e["bytes"] for e in entries if e["key"] not in expired)
+        for e in entries:
+            if total <= self.max_bytes:
+                break
+            if e["key"] not in expired and e["key"] not in self.pinned:
+                expired.add(e["key"])
+                total -= e["bytes"]
+
+        for e in entries:
+            if e["key"] in expired:
+                shutil.rmtree(Path(e["path"]).parent, ignore_errors=True)
+        conn.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k in expired])
+
+        if expired:
+            print(f"[CACHE] Evicted {len(expired)} entries")
+
+    def evict(self):
+        """
+        Apply the age and size limits, and forget digests of files that
+        no longer exist. Call it after the run, not while stages are
+        still reading cached outputs.
+        """
+        def sweep(conn):
+            self._evict(conn)
+            gone = [(r["path"],) for r in conn.execute("SELECT path FROM files") if not Path(r["path"]).exists()]
+            conn.executemany("DELETE FROM files WHERE path = ?", gone)
+
+        self._execute(sweep)
+
+    # ------------------------------------------------------------------
+    # Memoized execution
+    # ------------------------------------------------------------------
+
+    def run(
+        self,
+        stage: str,
+        compute,
+        inputs: list,
+        params: dict = None,
+        code=(),
+        event_type: str = None,
+    ) -> Path:
+        """
+        Return compute()'s output path, reusing a cached copy when the
+        inputs, params and code are unchanged.
+
+        event_type names the lifecycle event compute() emits; its payload
+        is stored with the entry and replayed on a hit.
+        """
+        key = self.key(stage, inputs, params, code)
+
+        entry = self.get(key)
+        if entry is not None:
+            return self._replay(key, entry, event_type)
+
+        captured = []
+
+        def capture(event):
+            captured.append(event)
+
+        if event_type:
+            EventDispatcher.subscribe(event_type, capture)
+        try:
+            output = compute()
+            EventDispatcher.drain()
+        finally:
+            if event_type:
+                EventDispatcher.unsubscribe(event_type, capture)
+
+        if output is None:
+            return None
+
+        # Other stages may emit the same event type concurrently
+        event = next(
+            (e for e in captured if str(output) in map(str, e["payload"].values())),
+            None,
+        )
+        self.put(key, stage, output, event)
+        return output
+
+    def _replay(self, key: str, entry: dict, event_type: str) -> Path:
+        cached = Path(entry["path"])
+        print(f"[CACHE] Hit for {entry['stage']} ({key[:12]})")
+
+        if event_type:
+            payload = dict((entry.get("event") or {}).get("payload", {}))
+            for name, value in payload.items():
+                if value == entry["source_path"]:
+                    payload[name] = str(cached)
+
+            EventDispatcher.emit(
+                event_type=event_type,
+                payload={**payload, "cache_hit": True, "cache_key": key},
+            )
+
+        return cached
@@ -2,57 +2,112 @@ import pandas as pd
 from pathlib import Path
 from datetime import datetime
 
+from src.catalog.artifact_catalog import ArtifactCatalog
 from src.event_bus.event_dispatcher import EventDispatcher
+from src.features.incremental_features import read_features
+from src.pipeline.dtype_policy import footprint, get_policy
+from src.signals.rule_dsl import RuleSet, to_categorical
+from src.pipeline.perf import collect, instrumented
+
+
+# The default strategy with its Sharpe thresholds as parameters; the
+# parameter sweep and walk-forward backtests vary them
+DEFAULT_STRATEGY = {
+    "buy": "sharpe_60d > {buy_sharpe} and cagr_60d > 0 and vol_regime == 'LOW'",
+    "sell": "sharpe_60d < {sell_sharpe} or vol_regime == 'HIGH'",
+}
+DEFAULT_THRESHOLDS = {"buy_sharpe": 1, "sell_sharpe": 0}
+
+
+def strategy_rules(template: dict = None, **thresholds) -> dict:
+    """
+    BUY / SELL rules of a strategy template with its threshold
+    placeholders filled in (DEFAULT_THRESHOLDS where not given).
+    """
+    values = {**DEFAULT_THRESHOLDS, **thresholds}
+    return {side: rule.format(**values) for side, rule in (template or DEFAULT_STRATEGY).items()}
+
+
+DEFAULT_RULES = {"strategies": {"default": strategy_rules()}}
 
 
 class EquitiesSignalEngine:
-    def __init__(self, feature_path: Path):
+    """
+    Evaluates a RuleSet over the feature frame. The first strategy is
+    written to `signal`, any others to `signal_<name>`, as int8 codes
+    (HOLD=0, BUY=1, SELL=-1) or, with categorical=True, as a
+    SELL/HOLD/BUY Categorical.
+    """
+
+    def __init__(
+        self,
+        feature_path: Path,
+        partition: str = None,
+        rules=None,
+        categorical: bool = False,
+        dtype_policy: str = "compact",
+    ):
+        """
+        rules: spec dict, YAML path or RuleSet; defaults to DEFAULT_RULES.
+        """
         self.feature_path = feature_path
+        self.partition = partition
+        self.rules = RuleSet.load(rules or DEFAULT_RULES)
+        self.categorical = categorical
+        self.dtype_policy = get_policy(dtype_policy)
 
+    @instrumented("load", reads="feature_path")
     def load(self) -> pd.DataFrame:
-        df = pd.read_parquet(self.feature_path)
+        df = read_features(self.feature_path)
         return df.sort_values("Date").reset_index(drop=True)
 
+    @instrumented("generate_signals")
     def generate_signals(self, df: pd.DataFrame) -> pd.DataFrame:
-        df["signal"] = "HOLD"
+        signals = self.rules.evaluate(df)
 
-        buy_mask = (
-            (df["sharpe_60d"] > 1)
-            & (df["cagr_60d"] > 0)
-            & (df["vol_regime"] == "LOW")
-        )
-
-        sell_mask = (
-            (df["sharpe_60d"] < 0)
-            | (df["vol_regime"] == "HIGH")
-        )
-
-        df.loc[buy_mask, "signal"] = "BUY"
-        df.loc[sell_mask, "signal"] = "SELL"
+        for i, (name, codes) in enumerate(signals.items()):
+            column = "signal" if i == 0 else f"signal_{name}"
+            df[column] = to_categorical(codes) if self.categorical else codes
 
         return df
 
+    @instrumented("write", writes=True)
     def write(self, df: pd.DataFrame) -> Path:
         date_str = datetime.utcnow().date().isoformat()
-        signal_path = Path("data") / "signals" / "equities" / date_str
+        signal_path = Path("data") / "signals" / "equities"
+        if self.partition:
+            signal_path = signal_path / self.partition
+        signal_path = signal_path / date_str
         signal_path.mkdir(parents=True, exist_ok=True)
 
         out_file = signal_path / "signals.parquet"
-        df.to_parquet(out_file, index=False)
+        df.to_parquet(out_file, index=False, **self.dtype_policy.parquet_options(df))
+
+        ArtifactCatalog().register(
+            layer="signals",
+            domain="equities",
+            path=out_file,
+            partition=self.partition,
+            data_date=date_str,
+            row_count=len(df),
+        )
 
         return out_file
 
     def run(self) -> Path:
         df = self.load()
-        df_signals = self.generate_signals(df)
+        df_signals = self.dtype_policy.apply(self.generate_signals(df))
         signal_path = self.write(df_signals)
 
         EventDispatcher.emit(
             event_type="SIGNALS_READY",
             payload={
                 "domain": "equities",
+                "partition": self.partition,
                 "signal_path": str(signal_path),
                 "row_count": len(df_signals),
+                "footprint": footprint("signals", signal_path, df_signals),
+                "perf": collect(),
             },
         )
 
@@ -0,0 +1,349 @@
+import ast
+import operator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+# Compact signal encoding shared by the signal engine and the backtesters
+HOLD, BUY, SELL = 0, 1, -1
+SIGNAL_LABELS = {HOLD: "HOLD", BUY: "BUY", SELL: "SELL"}
+SIGNAL_CODES = {label: code for code, label in SIGNAL_LABELS.items()}
+
+
+def to_codes(signal) -> np.ndarray:
+    """
+    int8 signal codes from an int8, Categorical or legacy string column.
+    """
+    signal = pd.Series(signal)
+    if pd.api.types.is_integer_dtype(signal):
+        return signal.to_numpy(dtype=np.int8)
+    return signal.astype(object).map(SIGNAL_CODES).fillna(HOLD).to_numpy(dtype=np.int8)
+
+
+def to_categorical(codes: np.ndarray) -> pd.Categorical:
+    return pd.Categorical.from_codes(
+        np.asarray(codes) + 1,  # SELL, HOLD, BUY -> 0, 1, 2
+        categories=["SELL", "HOLD", "BUY"],
+    )
+
+
+_COMPARE = {
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+}
+
+_ARITHMETIC = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+
+
+class RuleError(ValueError):
+    pass
+
+
+class _Evaluator:
+    """
+    Evaluates compiled rule ASTs against one feature frame. Column arrays
+    and identical sub-expressions are computed once and shared by every
+    rule of every strategy.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.columns = {}
+        self.memo = {}
+
+    def column(self, name: str):
+        if name not in self.columns:
+            if name not in self.df.columns:
+                raise RuleError(f"Unknown feature column in rule: {name}")
+            series = self.df[name]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                # Compare on integer codes; string constants are mapped below
+                self.columns[name] = series
+            else:
+                self.columns[name] = series.to_numpy()
+        return self.columns[name]
+
+    def eval(self, node):
+        key = ast.dump(node)
+        if key not in self.memo:
+            self.memo[key] = self._eval(node)
+        return self.memo[key]
+
+    def _eval(self, node):
+        if isinstance(node, ast.BoolOp):
+            values = [self.eval(v) for v in node.values]
+            combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+            result = values[0]
+            for v in values[1:]:
+                result = combine(result, v)
+            return result
+
+        if isinstance(node, ast.UnaryOp):
+            operand = self.eval(node.operand)
+            if isinstance(node.op, ast.Not):
+                return np.logical_not(operand)
+            return -operand
+
+        if isinstance(node, ast.Compare):
+            result = None
+            left = node.left
+            for op, right in zip(node.ops, node.comparators):
+                mask = self._compare(left, _COMPARE[type(op)], right)
+                result = mask if result is None else result & mask
+                left = right
+            return result
+
+        if isinstance(node, ast.BinOp):
+            return _ARITHMETIC[type(node.op)](self.eval(node.left), self.eval(node.right))
+
+        if isinstance(node, ast.Name):
+            value = self.column(node.id)
+            return value.to_numpy() if isinstance(value, pd.Series) else value
+
+        if isinstance(node, ast.Constant):
+            return node.value
+
+        raise RuleError(f"Unsupported expression: {ast.dump(node)}")
+
+    def _compare(self, left, op, right):
+        # Categorical == "LABEL" compares integer codes, never strings
+        for col_node, const_node in ((left, right), (right, left)):
+            if (
+                isinstance(col_node, ast.Name)
+                and isinstance(const_node, ast.Constant)
+                and isinstance(const_node.value, str)
+            ):
+                column = self.column(col_node.id)
+                if isinstance(column, pd.Series):
+                    categories = list(column.cat.categories)
+                    code = categories.index(const_node.value) if const_node.value in categories else -2
+                    codes = column.cat.codes.to_numpy()
+                    if op in (operator.eq, operator.ne):
+                        return op(codes, code)
+                    # Ordered comparisons need the constant on the right
+                    if col_node is right:
+                        return op(code, codes)
+                    return op(codes, code)
+
+        with np.errstate(invalid="ignore"):
+            return op(self.eval(left), self.eval(right))
+
+
+class _RowCompiler:
+    """
+    Compiles rule ASTs into closures over one feature record (a dict of
+    scalars) for bar-by-bar evaluation, with the vectorized semantics:
+    comparisons with NaN or missing values are False, and categorical
+    columns (given as label lists) compare on codes, a missing label
+    being code -1.
+    """
+
+    def __init__(self, categories: dict = None):
+        self.categories = {
+            name: {label: code for code, label in enumerate(labels)}
+            for name, labels in (categories or {}).items()
+        }
+
+    def compile(self, node):
+        if isinstance(node, ast.BoolOp):
+            parts = [self.compile(v) for v in node.values]
+            if isinstance(node.op, ast.And):
+                def all_of(row):
+                    for part in parts:
+                        if not part(row):
+                            return False
+                    return True
+                return all_of
+
+            def any_of(row):
+                for part in parts:
+                    if part(row):
+                        return True
+                return False
+            return any_of
+
+        if isinstance(node, ast.UnaryOp):
+            operand = self.compile(node.operand)
+            if isinstance(node.op, ast.Not):
+                return lambda row: not operand(row)
+            return lambda row: -operand(row)
+
+        if isinstance(node, ast.Compare):
+            pairs = []
+            left = node.left
+            for op, right in zip(node.ops, node.comparators):
+                pairs.append(self._compare(left, _COMPARE[type(op)], right))
+                left = right
+
+            def compare(row):
+                for pair in pairs:
+                    if not pair(row):
+                        return False
+                return True
+            return compare
+
+        if isinstance(node, ast.BinOp):
+            op = _ARITHMETIC[type(node.op)]
+            left, right = self.compile(node.left), self.compile(node.right)
+            return lambda row: op(left(row), right(row))
+
+        if isinstance(node, ast.Name):
+            name = node.id
+
+            def column(row):
+                try:
+                    return row[name]
+                except KeyError:
+                    raise RuleError(f"Unknown feature column in rule: {name}") from None
+            return column
+
+        if isinstance(node, ast.Constant):
+            value = node.value
+            return lambda row: value
+
+        raise RuleError(f"Unsupported expression: {ast.dump(node)}")
+
+    def _compare(self, left, op, right):
+        for col_node, const_node in ((left, right), (right, left)):
+            if (
+                isinstance(col_node, ast.Name)
+                and col_node.id in self.categories
+                and isinstance(const_node, ast.Constant)
+                and isinstance(const_node.value, str)
+            ):
+                codes = self.categories[col_node.id]
+                name, code = col_node.id, codes.get(const_node.value, -2)
+                if col_node is left:
+                    return lambda row: op(codes.get(row[name], -1), code)
+                return lambda row: op(code, codes.get(row[name], -1))
+
+        left, right = self.compile(left), self.compile(right)
+
+        def compare(row):
+            try:
+                return bool(op(left(row), right(row)))
+            except TypeError:  # None against a number: unknown, so False
+                return False
+        return compare
+
+
+class RuleSet:
+    """
+    Declarative signal strategies compiled to vectorized NumPy.
+
+    A spec maps strategy names to BUY / SELL conditions written as Python
+    boolean expressions over feature columns:
+
+        strategies:
+          default:
+            buy:  "sharpe_60d > 1 and cagr_60d > 0 and vol_regime == 'LOW'"
+            sell: "sharpe_60d < 0 or vol_regime == 'HIGH'"
+
+    Expressions are parsed once into an AST restricted to comparisons,
+    and/or/not and arithmetic on column names and constants; there is no
+    eval(). All strategies are evaluated in one pass over the frame with
+    shared column reads and sub-expressions. SELL overrides BUY; anything
+    else is HOLD. Results are int8 codes (HOLD=0, BUY=1, SELL=-1).
+    """
+
+    ALLOWED_NODES = (
+        ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.UnaryOp, ast.Not, ast.USub,
+        ast.Compare, ast.BinOp, ast.Name, ast.Load, ast.Constant,
+        *_COMPARE, *_ARITHMETIC,
+    )
+
+    def __init__(self, spec: dict):
+        strategies = spec.get("strategies", spec)
+        if not strategies:
+            raise RuleError("Rule spec defines no strategies")
+
+        self.strategies = {
+            name: {side: self.compile(rules.get(side, "False")) for side in ("buy", "sell")}
+            for name, rules in strategies.items()
+        }
+
+    @classmethod
+    def from_yaml(cls, path: Path) -> "RuleSet":
+        import yaml
+
+        with open(path) as f:
+            return cls(yaml.safe_load(f))
+
+    @classmethod
+    def load(cls, rules) -> "RuleSet":
+        """
+        Accept a RuleSet, a spec dict or a YAML file path.
+        """
+        if isinstance(rules, RuleSet):
+            return rules
+        if isinstance(rules, dict):
+            return cls(rules)
+        return cls.from_yaml(rules)
+
+    @classmethod
+    def compile(cls, expression) -> ast.AST:
+        if isinstance(expression, bool):
+            expression = str(expression)
+        try:
+            tree = ast.parse(expression, mode="eval")
+        except SyntaxError as e:
+            raise RuleError(f"Invalid rule {expression!r}: {e}") from e
+
+        for node in ast.walk(tree):
+            if not isinstance(node, cls.ALLOWED_NODES):
+                raise RuleError(
+                    f"Rule {expression!r} uses unsupported syntax: {type(node).__name__}"
+                )
+        return tree.body
+
+    def evaluate(self, df: pd.DataFrame) -> dict:
+        """
+        {strategy name: int8 signal codes} for every row of df.
+        """
+        evaluator = _Evaluator(df)
+        n = len(df)
+        signals = {}
+
+        for name, rules in self.strategies.items():
+            buy = np.broadcast_to(evaluator.eval(rules["buy"]), n)
+            sell = np.broadcast_to(evaluator.eval(rules["sell"]), n)
+
+            codes = np.zeros(n, dtype=np.int8)
+            codes[buy] = BUY
+            codes[sell] = SELL
+            signals[name] = codes
+
+        return signals
+
+    def row_evaluator(self, categories: dict = None):
+        """
+        Compiled per-record evaluation for live use: returns a function
+        mapping one feature dict to {strategy name: signal code}, equal
+        to evaluate() on the same values as a one-row frame. categories
+        lists the labels of categorical columns in code order, e.g.
+        {"vol_regime": ["LOW", "MED", "HIGH"]}.
+        """
+        compiler = _RowCompiler(categories)
+        compiled = [
+            (name, compiler.compile(rules["buy"]), compiler.compile(rules["sell"]))
+            for name, rules in self.strategies.items()
+        ]
+
+        def evaluate_row(row: dict) -> dict:
+            return {
+                name: SELL if sell(row) else BUY if buy(row) else HOLD
+                for name, buy, sell in compiled
+            }
+
+        return evaluate_row
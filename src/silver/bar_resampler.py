@@ -0,0 +1,224 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pathlib import Path
+from datetime import datetime
+
+from src.catalog.artifact_catalog import ArtifactCatalog
+from src.event_bus.event_dispatcher import EventDispatcher
+from src.pipeline.bar_frequency import BAR_MINUTES, SESSION_OPEN, check_frequency, partition_name
+from src.pipeline.dtype_policy import get_policy
+from src.pipeline.perf import collect, instrumented
+from src.silver.equities_silver import SILVER_COLS
+
+
+DAY_NS = 86_400 * 10 ** 9
+
+
+def bucket_starts(dates, freq: str) -> np.ndarray:
+    """
+    Start of the `freq` bar each timestamp falls in (int64 ns). Intraday
+    buckets are aligned to the session open, so hourly bars run 09:30,
+    10:30, ... as Yahoo's do; daily buckets are the calendar day.
+    """
+    ts = np.asarray(dates, dtype="datetime64[ns]").view(np.int64)
+    day = ts - ts % DAY_NS
+    minutes = BAR_MINUTES[check_frequency(freq)]
+    if minutes is None:
+        return day
+
+    step = minutes * 60 * 10 ** 9
+    open_ns = SESSION_OPEN.value
+    return day + open_ns + (ts - day - open_ns) // step * step
+
+
+class BarResampler:
+    """
+    Streaming OHLCV aggregation of finer bars into `freq` bars.
+
+    Chunks may interleave tickers but each ticker's bars must arrive in
+    Date order (Silver row order). A ticker's newest bucket may continue
+    in the next chunk, so it is held back; every other bucket is final.
+    State is one open bucket per ticker, whatever the input length.
+    """
+
+    def __init__(self, freq: str):
+        self.freq = check_frequency(freq)
+        self.pending = None
+
+    def _aggregate(self, df: pd.DataFrame, bucket: np.ndarray) -> pd.DataFrame:
+        if df.empty:
+            return pd.DataFrame(columns=SILVER_COLS)
+
+        codes, tickers = pd.factorize(df["Ticker"])
+        # Stable: bars keep their time order inside each (ticker, bucket)
+        order = np.lexsort((bucket, codes))
+        codes, bucket = codes[order], bucket[order]
+
+        starts = np.flatnonzero(
+            np.concatenate([[True], (codes[1:] != codes[:-1]) | (bucket[1:] != bucket[:-1])])
+        )
+        ends = np.append(starts[1:], len(order)) - 1
+
+        def column(name):
+            return df[name].to_numpy(dtype=np.float64)[order]
+
+        high, low = column("High"), column("Low")
+        return pd.DataFrame({
+            "Date": bucket[starts].view("datetime64[ns]"),
+            "Open": column("Open")[starts],
+            "High": np.maximum.reduceat(high, starts),
+            "Low": np.minimum.reduceat(low, starts),
+            "Close": column("Close")[ends],
+            "Adj Close": column("Adj Close")[ends],
+            "Volume": np.add.reduceat(column("Volume"), starts),
+            "Ticker": np.asarray(tickers, dtype=object)[codes[starts]],
+        })
+
+    def push(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add a chunk of bars; returns the buckets it completed.
+        """
+        df = chunk[SILVER_COLS]
+        if self.pending is not None:
+            df = pd.concat([self.pending, df], ignore_index=True)
+        if df.empty:
+            return df
+
+        bucket = bucket_starts(df["Date"], self.freq)
+        newest = pd.Series(bucket).groupby(df["Ticker"].to_numpy(), sort=False).transform("max").to_numpy()
+        hold = bucket == newest
+
+        self.pending = df[hold]
+        done = ~hold
+        return self._aggregate(df[done].reset_index(drop=True), bucket[done])
+
+    def flush(self) -> pd.DataFrame:
+        """
+        The held-back buckets, once the input has ended.
+        """
+        df, self.pending = self.pending, None
+        if df is None:
+            return pd.DataFrame(columns=SILVER_COLS)
+        df = df.reset_index(drop=True)
+        return self._aggregate(df, bucket_starts(df["Date"], self.freq))
+
+
+class IntradayResampler:
+    """
+    Build coarser Silver bars (default 5m, 1h, 1d) from a ticker's
+    validated minute bars in one streaming pass: Silver is read
+    chunk_size rows at a time, every target frequency aggregates the same
+    chunk, and finished bars are appended to that frequency's output as
+    Parquet row groups. Memory is bounded by the chunk size.
+
+    Each frequency is written as its own Silver partition
+    (partition_name(ticker, freq), e.g. AAPL_5m; daily bars go to
+    AAPL_1d so they never mix with directly ingested daily bars) and can
+    feed the feature stage like any other Silver file.
+    """
+
+    def __init__(
+        self,
+        silver_path: Path,
+        ticker: str,
+        freqs=("5m", "1h", "1d"),
+        chunk_size: int = 500_000,
+        dtype_policy: str = "compact",
+    ):
+        self.silver_path = Path(silver_path)
+        self.ticker = ticker
+        self.freqs = [check_frequency(f) for f in freqs]
+        self.chunk_size = chunk_size
+        self.dtype_policy = get_policy(dtype_policy)
+
+    def partition(self, freq: str) -> str:
+        return f"{self.ticker}_1d" if freq == "1d" else partition_name(self.ticker, freq)
+
+    def iter_chunks(self):
+        parquet_file = pq.ParquetFile(self.silver_path)
+        for batch in parquet_file.iter_batches(batch_size=self.chunk_size, columns=SILVER_COLS):
+            yield batch.to_pandas()
+
+    def output_path(self, freq: str) -> Path:
+        date_str = datetime.utcnow().date().isoformat()
+        out_dir = Path("data") / "silver" / "equities" / self.partition(freq) / date_str
+        out_dir.mkdir(parents=True, exist_ok=True)
+        return out_dir / "validated.parquet"
+
+    @instrumented("resample", reads="silver_path", writes=True)
+    def write_streaming(self) -> dict:
+        """
+        Returns {freq: (path, rows)}.
+        """
+        resamplers = {freq: BarResampler(freq) for freq in self.freqs}
+        writers = {}
+        rows = dict.fromkeys(self.freqs, 0)
+        out_files = {freq: self.output_path(freq) for freq in self.freqs}
+
+        def append(freq, bars):
+            if bars.empty:
+                return
+            # One Arrow schema for every row group: Ticker stays a string
+            bars = self.dtype_policy.apply(bars, categoricals=False)
+            writer = writers.get(freq)
+            table = pa.Table.from_pandas(bars, schema=writer.schema if writer else None, preserve_index=False)
+            if writer is None:
+                writer = writers[freq] = pq.ParquetWriter(
+                    out_files[freq].with_suffix(".parquet.tmp"),
+                    table.schema,
+                    **self.dtype_policy.parquet_options(bars),
+                )
+            writer.write_table(table)
+            rows[freq] += len(bars)
+
+        try:
+            for chunk in self.iter_chunks():
+                for freq, resampler in resamplers.items():
+                    append(freq, resampler.push(chunk))
+            for freq, resampler in resamplers.items():
+                append(freq, resampler.flush())
+        finally:
+            for writer in writers.values():
+                writer.close()
+
+        if not writers:
+            raise ValueError(f"No bars to resample in {self.silver_path}")
+
+        outputs = {}
+        for freq, out_file in out_files.items():
+            # Readers never see a half-written Silver file
+            out_file.with_suffix(".parquet.tmp").replace(out_file)
+            ArtifactCatalog().register(
+                layer="silver",
+                domain="equities",
+                path=out_file,
+                partition=self.partition(freq),
+                data_date=out_file.parent.name,
+                row_count=rows[freq],
+            )
+            outputs[freq] = (out_file, rows[freq])
+
+        return outputs
+
+    def run(self) -> dict:
+        """
+        Resample every target frequency and emit BARS_RESAMPLED; returns
+        {freq: Silver path}.
+        """
+        outputs = self.write_streaming()
+
+        EventDispatcher.emit(
+            event_type="BARS_RESAMPLED",
+            payload={
+                "domain": "equities",
+                "partition": self.ticker,
+                "silver_path": str(self.silver_path),
+                "outputs": {freq: str(path) for freq, (path, _) in outputs.items()},
+                "row_counts": {freq: rows for freq, (_, rows) in outputs.items()},
+                "perf": collect(),
+            },
+        )
+
+        return {freq: path for freq, (path, _) in outputs.items()}
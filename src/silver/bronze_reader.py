@@ -0,0 +1,105 @@
+import pandas as pd
+import pyarrow.parquet as pq
+from pathlib import Path
+
+from src.catalog.artifact_catalog import ArtifactCatalog
+
+
+def bronze_files(bronze_path: Path) -> list:
+    """
+    Resolve a Bronze location to its raw files in ingestion order.
+    A file path is returned as-is; a directory (e.g. one ticker's
+    partition) expands to every immutable delta on disk beneath it.
+    The artifact catalog orders the registered deltas; files it does not
+    know (written before the catalog existed, or never registered) come
+    first, by modification time. Every file on disk is returned, so the
+    list matches what the stage cache hashes for the directory.
+    """
+    bronze_path = Path(bronze_path)
+
+    if bronze_path.is_file():
+        return [bronze_path]
+
+    on_disk = {p for p in bronze_path.rglob("raw_data.*") if p.is_file()}
+    if not on_disk:
+        raise FileNotFoundError(f"No Bronze files found under {bronze_path}")
+
+    catalogued = [p for p in ArtifactCatalog().under("bronze", bronze_path) if p in on_disk]
+    unregistered = sorted(on_disk.difference(catalogued), key=lambda p: p.stat().st_mtime)
+
+    return unregistered + catalogued
+
+
+def _read_file(
+    file_path: Path,
+    columns: list = None,
+    parse_dates: list = None,
+) -> pd.DataFrame:
+    if file_path.suffix == ".parquet":
+        # Typed columnar read: projection only, no text parsing
+        if columns is not None:
+            available = pq.read_schema(file_path).names
+            columns = [c for c in columns if c in available]
+        return pq.read_table(file_path, columns=columns).to_pandas()
+
+    if file_path.suffix == ".csv":
+        usecols = None
+        if columns is not None:
+            usecols = lambda c: c in columns
+        return pd.read_csv(file_path, usecols=usecols, parse_dates=parse_dates)
+
+    raise ValueError(f"Unsupported Bronze file type: {file_path.suffix}")
+
+
+def read_bronze(
+    bronze_path: Path,
+    columns: list = None,
+    parse_dates: list = None,
+) -> pd.DataFrame:
+    """
+    Read and concatenate every Bronze delta under `bronze_path`.
+    Parquet and legacy CSV deltas may be mixed. `columns` projects the
+    read (missing columns are skipped); `parse_dates` applies to CSV only.
+    Later deltas come last, so callers can de-duplicate with keep="last".
+    """
+    frames = [
+        _read_file(f, columns=columns, parse_dates=parse_dates)
+        for f in bronze_files(bronze_path)
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+
+def iter_bronze(
+    bronze_path: Path,
+    columns: list = None,
+    parse_dates: list = None,
+    chunk_size: int = 500_000,
+):
+    """
+    Stream every Bronze delta under `bronze_path` as DataFrames of at most
+    chunk_size rows, in ingestion order. Parquet is read record batch by
+    record batch and CSV with a chunked reader, so memory is bounded by
+    the chunk size rather than the file size.
+    """
+    for file_path in bronze_files(bronze_path):
+        if file_path.suffix == ".parquet":
+            parquet_file = pq.ParquetFile(file_path)
+            file_columns = columns
+            if columns is not None:
+                file_columns = [c for c in columns if c in parquet_file.schema_arrow.names]
+            for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=file_columns):
+                yield batch.to_pandas()
+
+        elif file_path.suffix == ".csv":
+            usecols = None
+            if columns is not None:
+                usecols = lambda c: c in columns
+            yield from pd.read_csv(
+                file_path,
+                usecols=usecols,
+                parse_dates=parse_dates,
+                chunksize=chunk_size,
+            )
+
+        else:
+            raise ValueError(f"Unsupported Bronze file type: {file_path.suffix}")
@@ -1,79 +1,267 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pathlib import Path
 from datetime import datetime
 
-from src.validation.equities_schema import EquitiesSchema
+from src.pipeline.dtype_policy import footprint, get_policy
+from src.silver.bronze_reader import iter_bronze, read_bronze
+from src.validation.equities_schema import EquitiesSchema, EquitiesValidator
+from src.catalog.artifact_catalog import ArtifactCatalog
 from src.event_bus.event_dispatcher import EventDispatcher
+from src.pipeline.perf import collect, instrumented
+
+
+NUMERIC_COLS = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+SILVER_COLS = ["Date", *NUMERIC_COLS, "Ticker"]
 
 
 class EquitiesSilverProcessor:
-    def __init__(self, bronze_path: Path):
-        self.bronze_path = bronze_path
+    VALIDATION_MODES = ("fast", "pandera")
 
-    def load(self) -> pd.DataFrame:
-        df = pd.read_csv(self.bronze_path)
+    def __init__(
+        self,
+        bronze_path: Path,
+        partition: str = None,
+        validation: str = "fast",
+        streaming: bool = False,
+        chunk_size: int = 500_000,
+        dtype_policy: str = "compact",
+    ):
+        """
+        partition (e.g. a ticker) gives concurrent per-ticker runs their
+        own Silver directory.
+        validation="fast" evaluates EquitiesSchema as compiled NumPy masks;
+        "pandera" runs the pandera schema itself. Both enforce the same
+        checks.
+        streaming=True processes Bronze chunk_size rows at a time and
+        appends each chunk to the output as a Parquet row group, so peak
+        memory does not grow with the input.
+        dtype_policy names the DtypePolicy applied to the validated frame
+        before it is written ("compact" or "legacy").
+        """
+        if validation not in self.VALIDATION_MODES:
+            raise ValueError(f"Unsupported validation mode: {validation}")
 
-        # ---- Date coercion ----
-        df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-        invalid_dates = df["Date"].isna().sum()
+        self.bronze_path = bronze_path
+        self.partition = partition
+        self.validation = validation
+        self.streaming = streaming
+        self.chunk_size = chunk_size
+        self.dtype_policy = get_policy(dtype_policy)
+        self.dropped = {"invalid_date": 0, "invalid_numeric": 0, "duplicate": 0}
+        self._adj_close_defaulted = False
 
-        if invalid_dates > 0:
-            print(f"[SILVER] Dropped {invalid_dates} rows with invalid Date")
-            df = df.dropna(subset=["Date"])
+    def _coerce(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Type coercion shared by the batch and streaming paths. Dropped
+        rows are counted in self.dropped.
+        """
+        # ---- Date coercion ----
+        if not pd.api.types.is_datetime64_any_dtype(df["Date"]):
+            df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+        invalid_dates = df["Date"].isna()
 
         # ---- Schema normalization ----
         if "Adj Close" not in df.columns:
-            print("[SILVER] 'Adj Close' missing — defaulting to Close")
+            if not self._adj_close_defaulted:
+                print("[SILVER] 'Adj Close' missing — defaulting to Close")
+                self._adj_close_defaulted = True
             df["Adj Close"] = df["Close"]
 
         # ---- Numeric coercion ----
-        numeric_cols = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+        for col in NUMERIC_COLS:
+            if not pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], errors="coerce")
+        invalid_numeric = df[NUMERIC_COLS].isna().any(axis=1) & ~invalid_dates
+
+        # ---- One filter for every invalid row ----
+        self.dropped["invalid_date"] += int(invalid_dates.sum())
+        self.dropped["invalid_numeric"] += int(invalid_numeric.sum())
+
+        if invalid_dates.any() or invalid_numeric.any():
+            df = df[~(invalid_dates | invalid_numeric)]
+
+        return df[SILVER_COLS]
+
+    def _report_dropped(self):
+        messages = {
+            "invalid_date": "rows with invalid Date",
+            "invalid_numeric": "rows with invalid numeric values",
+            "duplicate": "duplicate bars across deltas",
+        }
+        for reason, count in self.dropped.items():
+            if count > 0:
+                print(f"[SILVER] Dropped {count} {messages[reason]}")
 
-        for col in numeric_cols:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+    @instrumented("load", reads="bronze_path")
+    def load(self) -> pd.DataFrame:
+        # Only the schema columns are read; Parquet deltas arrive typed
+        df = self._coerce(read_bronze(self.bronze_path, columns=SILVER_COLS))
 
+        # ---- Delta de-duplication ----
+        # Overlapping incremental deltas may repeat a bar; latest wins.
         before = len(df)
-        df = df.dropna(subset=numeric_cols)
-        dropped = before - len(df)
+        df = df.drop_duplicates(subset=["Ticker", "Date"], keep="last")
+        self.dropped["duplicate"] += before - len(df)
+
+        self._report_dropped()
+        return df.sort_values(["Ticker", "Date"]).reset_index(drop=True)
+
+    def iter_chunks(self):
+        """
+        Coerced Bronze chunks in ingestion order, with the same latest-wins
+        de-duplication as load().
+
+        Deltas are watermarked, so a later delta can only repeat a
+        ticker's newest bar (an intraday re-fetch of the still-forming
+        bar). Each ticker's newest bar is therefore held back until a
+        later chunk replaces it or Bronze ends; the only state kept is one
+        bar per ticker. A bar older than its ticker's newest one could
+        revise a row already written, so it raises ValueError: such Bronze
+        needs the batch path (streaming=False).
+        """
+        held = None
+
+        for chunk in iter_bronze(
+            self.bronze_path,
+            columns=SILVER_COLS,
+            parse_dates=["Date"],
+            chunk_size=self.chunk_size,
+        ):
+            chunk = self._coerce(chunk)
+            before = len(chunk)
+            chunk = chunk.drop_duplicates(subset=["Ticker", "Date"], keep="last")
+            self.dropped["duplicate"] += before - len(chunk)
+
+            if held is not None:
+                newest = chunk["Ticker"].map(held.set_index("Ticker")["Date"])
+                if (chunk["Date"] < newest).any():
+                    raise ValueError(
+                        f"Out-of-order bars under {self.bronze_path}; "
+                        "process this Bronze with streaming=False"
+                    )
+                # Latest wins: a repeat of a held bar replaces it
+                repeated = chunk.loc[chunk["Date"] == newest, "Ticker"]
+                self.dropped["duplicate"] += len(repeated)
+                chunk = pd.concat([held[~held["Ticker"].isin(repeated)], chunk], ignore_index=True)
 
-        if dropped > 0:
-            print(f"[SILVER] Dropped {dropped} rows with invalid numeric values")
+            if chunk.empty:
+                continue
 
-        return df
+            is_newest = chunk["Date"] == chunk.groupby("Ticker", sort=False)["Date"].transform("max")
+            held = chunk[is_newest]
+            if (~is_newest).any():
+                yield chunk[~is_newest].reset_index(drop=True)
 
+        if held is not None and not held.empty:
+            yield held.reset_index(drop=True)
+
+    @instrumented("validate")
     def validate(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Enforce the equities schema. Any violation raises a hard failure.
         """
+        if self.validation == "fast":
+            return EquitiesValidator.validate(df)
         return EquitiesSchema.validate(df)
 
+    def output_path(self) -> Path:
+        date_str = datetime.utcnow().date().isoformat()
+        out_dir = Path("data") / "silver" / "equities"
+        if self.partition:
+            out_dir = out_dir / self.partition
+        out_dir = out_dir / date_str
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        return out_dir / "validated.parquet"
+
+    def register(self, out_file: Path, row_count: int):
+        ArtifactCatalog().register(
+            layer="silver",
+            domain="equities",
+            path=out_file,
+            partition=self.partition,
+            data_date=out_file.parent.name,
+            row_count=row_count,
+        )
+
+    @instrumented("write", writes=True)
     def write(self, df: pd.DataFrame) -> Path:
         """
         Write validated equities data to the Silver layer in Parquet format.
         """
-        date_str = datetime.utcnow().date().isoformat()
-        out_dir = Path("data") / "silver" / "equities" / date_str
-        out_dir.mkdir(parents=True, exist_ok=True)
-
-        out_file = out_dir / "validated.parquet"
-        df.to_parquet(out_file, index=False)
+        out_file = self.output_path()
+        df.to_parquet(out_file, index=False, **self.dtype_policy.parquet_options(df))
+        self.register(out_file, len(df))
 
         return out_file
 
+    @instrumented("write_streaming", reads="bronze_path", writes=True)
+    def write_streaming(self) -> tuple:
+        """
+        Validate and append each chunk as a Parquet row group. Nothing
+        larger than one chunk is held in memory. Returns (path, rows).
+        """
+        out_file = self.output_path()
+        tmp_file = out_file.with_suffix(".parquet.tmp")
+        writer = None
+        row_count = 0
+
+        try:
+            for chunk in self.iter_chunks():
+                # One Arrow schema for every row group: Ticker stays a string
+                chunk = self.dtype_policy.apply(self.validate(chunk), categoricals=False)
+                table = pa.Table.from_pandas(
+                    chunk,
+                    schema=writer.schema if writer else None,
+                    preserve_index=False,
+                )
+                if writer is None:
+                    writer = pq.ParquetWriter(
+                        tmp_file,
+                        table.schema,
+                        **self.dtype_policy.parquet_options(chunk),
+                    )
+                writer.write_table(table)
+                row_count += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if writer is None:
+            raise ValueError(f"No valid Bronze rows under {self.bronze_path}")
+
+        # Readers never see a half-written Silver file
+        tmp_file.replace(out_file)
+        self.register(out_file, row_count)
+
+        return out_file, row_count
+
     def run(self) -> Path:
         """
         Execute the full Bronze → Silver pipeline and emit DATA_VALIDATED.
         """
-        df = self.load()
-        df_valid = self.validate(df)
-        silver_path = self.write(df_valid)
+        if self.streaming:
+            silver_path, row_count = self.write_streaming()
+            self._report_dropped()
+            report = footprint("silver_equities", silver_path)
+        else:
+            df_valid = self.dtype_policy.apply(self.validate(self.load()))
+            silver_path = self.write(df_valid)
+            row_count = len(df_valid)
+            report = footprint("silver_equities", silver_path, df_valid)
 
         EventDispatcher.emit(
             event_type="DATA_VALIDATED",
             payload={
                 "domain": "equities",
+                "partition": self.partition,
                 "silver_path": str(silver_path),
-                "row_count": len(df_valid),
+                "row_count": row_count,
+                "dropped_rows": dict(self.dropped),
+                "footprint": report,
+                "perf": collect(),
             },
         )
 
@@ -2,20 +2,40 @@ import pandas as pd
 from pathlib import Path
 from datetime import datetime
 
-from src.validation.macro_schema import MacroSchema
+from src.silver.bronze_reader import read_bronze
+from src.validation.macro_schema import MacroSchema, MacroValidator
+from src.catalog.artifact_catalog import ArtifactCatalog
 from src.event_bus.event_dispatcher import EventDispatcher
+from src.pipeline.perf import collect, instrumented
 
 
 class MacroSilverProcessor:
-    def __init__(self, bronze_path: Path):
+    VALIDATION_MODES = ("fast", "pandera")
+
+    def __init__(
+        self,
+        bronze_path: Path,
+        partition: str = None,
+        validation: str = "fast",
+    ):
+        if validation not in self.VALIDATION_MODES:
+            raise ValueError(f"Unsupported validation mode: {validation}")
+
         self.bronze_path = bronze_path
+        self.partition = partition
+        self.validation = validation
 
+    @instrumented("load", reads="bronze_path")
     def load(self) -> pd.DataFrame:
         """
         Load macro data from the Bronze layer and perform
         explicit cleanup required for schema validation.
         """
-        df = pd.read_csv(self.bronze_path, parse_dates=["date"])
+        df = read_bronze(
+            self.bronze_path,
+            columns=["date", "DFF"],
+            parse_dates=["date"],
+        )
 
         # Drop invalid timestamps explicitly
         initial_rows = len(df)
@@ -25,8 +45,9 @@ class MacroSilverProcessor:
         if dropped > 0:
             print(f"[SILVER] Dropped {dropped} rows with invalid date")
 
-        # Explicit numeric coercion
-        df["DFF"] = pd.to_numeric(df["DFF"], errors="coerce")
+        # Explicit numeric coercion (Parquet deltas are already typed)
+        if not pd.api.types.is_numeric_dtype(df["DFF"]):
+            df["DFF"] = pd.to_numeric(df["DFF"], errors="coerce")
 
         before_numeric = len(df)
         df = df.dropna(subset=["DFF"])
@@ -35,25 +56,44 @@ class MacroSilverProcessor:
         if dropped_numeric > 0:
             print(f"[SILVER] Dropped {dropped_numeric} rows with invalid DFF values")
 
-        return df
+        # Overlapping incremental deltas may repeat a date; latest wins
+        df = df.drop_duplicates(subset=["date"], keep="last")
 
+        return df.sort_values("date").reset_index(drop=True)
+
+    @instrumented("validate")
     def validate(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Enforce the macro schema. Any violation raises a hard failure.
         """
+        if self.validation == "fast":
+            return MacroValidator.validate(df)
         return MacroSchema.validate(df)
 
+    @instrumented("write", writes=True)
     def write(self, df: pd.DataFrame) -> Path:
         """
         Write validated macro data to the Silver layer in Parquet format.
         """
         date_str = datetime.utcnow().date().isoformat()
-        silver_path = Path("data") / "silver" / "macro" / date_str
+        silver_path = Path("data") / "silver" / "macro"
+        if self.partition:
+            silver_path = silver_path / self.partition
+        silver_path = silver_path / date_str
         silver_path.mkdir(parents=True, exist_ok=True)
 
         out_file = silver_path / "validated.parquet"
         df.to_parquet(out_file, index=False)
 
+        ArtifactCatalog().register(
+            layer="silver",
+            domain="macro",
+            path=out_file,
+            partition=self.partition,
+            data_date=date_str,
+            row_count=len(df),
+        )
+
         return out_file
 
     def run(self) -> Path:
@@ -69,8 +109,10 @@ class MacroSilverProcessor:
             event_type="DATA_VALIDATED",
             payload={
                 "domain": "macro",
+                "partition": self.partition,
                 "silver_path": str(silver_path),
                 "row_count": len(df_valid),
+                "perf": collect(),
             },
         )
 
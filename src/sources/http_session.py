@@ -0,0 +1,230 @@
+import hashlib
+import json
+import random
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+# Headers kept with a cached body; enough to serve and revalidate it
+CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Date")
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter: attempt n sleeps a uniform
+    random time in [0, min(max_backoff, backoff * 2**n)], so concurrent
+    clients that failed together do not retry together. A Retry-After
+    header from the server takes precedence.
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        max_retries: int = 4,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        retry_statuses=RETRY_STATUSES,
+        seed: int = None,
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self._random = random.Random(seed)
+
+    def delay(self, attempt: int, retry_after: str = None) -> float:
+        if retry_after is not None:
+            try:
+                return min(self.max_backoff, max(0.0, float(retry_after)))
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+        return self._random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+
+class ResponseCache:
+    """
+    On-disk cache of GET responses, one <key>.json (metadata) and
+    <key>.body pair per URL under data/cache/http/.
+
+    An entry younger than its TTL is served without touching the network.
+    An older one is revalidated with If-None-Match / If-Modified-Since when
+    the server sent an ETag or Last-Modified, and served again on 304.
+    """
+
+    CACHE_DIR = Path("data") / "cache" / "http"
+
+    def __init__(self, cache_dir: Path = None):
+        self.cache_dir = Path(cache_dir or ResponseCache.CACHE_DIR)
+
+    @staticmethod
+    def key(url: str, params: dict = None) -> str:
+        if params:
+            url = f"{url}?{urlencode(sorted(params.items()))}"
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def get(self, key: str):
+        """
+        (metadata, body) or None.
+        """
+        meta_path = self.cache_dir / f"{key}.json"
+        body_path = self.cache_dir / f"{key}.body"
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            return meta, body_path.read_bytes()
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def put(self, key: str, url: str, response: requests.Response):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "url": url,
+            "status": response.status_code,
+            "headers": {h: response.headers[h] for h in CACHED_HEADERS if h in response.headers},
+            "stored_at": time.time(),
+        }
+        # Body first, metadata last: a reader never sees metadata
+        # pointing at a half-written body
+        for suffix, data in ((".body", response.content), (".json", json.dumps(meta).encode())):
+            tmp_path = self.cache_dir / f"{key}{suffix}.{threading.get_ident()}.tmp"
+            tmp_path.write_bytes(data)
+            tmp_path.replace(self.cache_dir / f"{key}{suffix}")
+
+    def touch(self, key: str, meta: dict):
+        """
+        Restart an entry's TTL after a successful revalidation.
+        """
+        meta = {**meta, "stored_at": time.time()}
+        tmp_path = self.cache_dir / f"{key}.json.{threading.get_ident()}.tmp"
+        tmp_path.write_text(json.dumps(meta))
+        tmp_path.replace(self.cache_dir / f"{key}.json")
+
+    @staticmethod
+    def fresh(meta: dict, ttl: float) -> bool:
+        return time.time() - meta["stored_at"] < ttl
+
+
+def _from_cache(url: str, meta: dict, body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = meta["status"]
+    response.headers = CaseInsensitiveDict(meta["headers"])
+    response._content = body
+    response.url = url
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.from_cache = True
+    return response
+
+
+class SourceSession:
+    """
+    HTTP client for one data provider, shared by every ingestor thread.
+
+    - keep-alive connections from a pooled requests.Session
+    - a token-bucket RateLimiter consulted before every request,
+      retries included
+    - RetryPolicy backoff on connection errors, timeouts, 429 and 5xx
+    - a ResponseCache with TTL and conditional revalidation (ttl=0 or
+      cache=None disables it)
+
+    `stats` counts requests, cache hits, 304 revalidations and retries.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limiter=None,
+        retry: RetryPolicy = None,
+        cache: ResponseCache = None,
+        ttl: float = 3600,
+        timeout: float = 30,
+        pool_size: int = 8,
+        headers: dict = None,
+    ):
+        self.name = name
+        self.limiter = limiter
+        self.retry = retry or RetryPolicy()
+        self.cache = cache
+        self.ttl = ttl
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(headers or {})
+
+        self.stats = {"requests": 0, "cache_hits": 0, "revalidated": 0, "retries": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, stat: str):
+        with self._stats_lock:
+            self.stats[stat] += 1
+
+    def _request(self, url: str, params: dict, headers: dict) -> requests.Response:
+        """
+        One GET with rate limiting and retries; the last failure is raised.
+        """
+        for attempt in range(self.retry.max_retries + 1):
+            if self.limiter is not None:
+                self.limiter.acquire()
+            self._count("requests")
+
+            try:
+                response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.retry.max_retries:
+                    raise
+                wait = self.retry.delay(attempt)
+                print(f"[HTTP] {self.name} {type(e).__name__}; retry {attempt + 1} in {wait:.2f}s")
+            else:
+                if response.status_code not in self.retry.retry_statuses or attempt == self.retry.max_retries:
+                    return response
+                wait = self.retry.delay(attempt, response.headers.get("Retry-After"))
+                print(f"[HTTP] {self.name} {response.status_code}; retry {attempt + 1} in {wait:.2f}s")
+
+            self._count("retries")
+            time.sleep(wait)
+
+    def get(self, url: str, params: dict = None, ttl: float = None) -> requests.Response:
+        """
+        GET through the cache. Non-2xx/304 final responses raise
+        requests.HTTPError; cached responses carry from_cache=True.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        use_cache = self.cache is not None and ttl > 0
+        key = self.cache.key(url, params) if use_cache else None
+        cached = self.cache.get(key) if use_cache else None
+
+        headers = {}
+        if cached is not None:
+            meta, body = cached
+            if self.cache.fresh(meta, ttl):
+                self._count("cache_hits")
+                return _from_cache(meta["url"], meta, body)
+            if "ETag" in meta["headers"]:
+                headers["If-None-Match"] = meta["headers"]["ETag"]
+            if "Last-Modified" in meta["headers"]:
+                headers["If-Modified-Since"] = meta["headers"]["Last-Modified"]
+
+        response = self._request(url, params, headers)
+
+        if response.status_code == 304 and cached is not None:
+            self._count("revalidated")
+            self.cache.touch(key, meta)
+            return _from_cache(meta["url"], meta, body)
+
+        response.raise_for_status()
+        response.from_cache = False
+        if use_cache and response.status_code == 200 and "no-store" not in response.headers.get("Cache-Control", ""):
+            self.cache.put(key, response.url, response)
+        return response
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,224 @@
+import io
+import threading
+
+import pandas as pd
+
+from src.ingestion.rate_limiter import RateLimiter
+from src.pipeline.bar_frequency import check_frequency
+from src.sources.http_session import ResponseCache, RetryPolicy, SourceSession
+
+
+BAR_COLUMNS = ["Date", "Open", "High", "Low", "Close", "Volume"]
+
+
+def no_bars() -> pd.DataFrame:
+    """
+    Empty bar frame: an incremental window with nothing new in it (a
+    weekend, a holiday) is a valid empty delta, not a source failure.
+    """
+    return pd.DataFrame({col: pd.Series(dtype="datetime64[ns]" if col == "Date" else float) for col in BAR_COLUMNS})
+
+
+class YahooSource:
+    """
+    Bars from the Yahoo Finance chart API, adjusted the way
+    yf.download(auto_adjust=True) adjusts them: OHLC scaled by
+    adjclose / close, no separate Adj Close column. Daily bars are dated
+    at midnight, intraday bars at their start in exchange time.
+    """
+
+    BASE_URL = "https://query2.finance.yahoo.com"
+    # Yahoo rejects requests without a browser-like User-Agent
+    HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; data-titan-os)"}
+    # Days of history Yahoo serves per intraday interval
+    INTRADAY_LOOKBACK = {"1m": 7, "5m": 60, "15m": 60, "30m": 60, "1h": 730}
+
+    def __init__(self, session: SourceSession, base_url: str = None):
+        self.session = session
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+
+    def fetch(self, ticker: str, start=None, interval: str = "1d") -> pd.DataFrame:
+        lookback = self.INTRADAY_LOOKBACK.get(check_frequency(interval))
+        params = {"interval": interval, "events": "div,splits", "includeAdjustedClose": "true"}
+        if start is None:
+            params["range"] = "1y" if lookback is None else f"{lookback}d"
+        else:
+            start = pd.Timestamp(start, tz="UTC")
+            if lookback is not None:
+                # Older intraday history is rejected outright; take what exists
+                start = max(start, pd.Timestamp.now(tz="UTC").normalize() - pd.Timedelta(days=lookback - 1))
+            params["period1"] = int(start.timestamp())
+            params["period2"] = int((pd.Timestamp.now(tz="UTC").normalize() + pd.Timedelta(days=1)).timestamp())
+
+        # The window ends with the current UTC day, so its URL is the same
+        # all day while new bars keep arriving: incremental and intraday
+        # requests always go to the network
+        ttl = 0 if start is not None or lookback is not None else None
+        chart = self.session.get(f"{self.base_url}/v8/finance/chart/{ticker}", params, ttl=ttl).json()["chart"]
+        if chart.get("error"):
+            raise ValueError(f"Yahoo error for {ticker}: {chart['error']}")
+
+        result = (chart.get("result") or [{}])[0]
+        if not result.get("timestamp"):
+            if start is not None:
+                return no_bars()
+            raise ValueError("Yahoo returned empty dataframe")
+
+        quote = result["indicators"]["quote"][0]
+        dates = (
+            pd.to_datetime(result["timestamp"], unit="s", utc=True)
+            .tz_convert(result.get("meta", {}).get("exchangeTimezoneName", "UTC"))
+            .tz_localize(None)
+        )
+        df = pd.DataFrame({
+            "Date": dates.normalize() if lookback is None else dates,
+            **{col.capitalize(): quote[col] for col in ("open", "high", "low", "close", "volume")},
+        })
+
+        adjclose = result["indicators"].get("adjclose", [{}])[0].get("adjclose")
+        if adjclose is not None:
+            ratio = pd.Series(adjclose, dtype=float) / df["Close"].astype(float)
+            for col in ("Open", "High", "Low"):
+                df[col] = df[col].astype(float) * ratio
+            df["Close"] = pd.Series(adjclose, dtype=float)
+
+        return df
+
+
+class StooqSource:
+    """
+    Daily bars from Stooq's CSV download endpoint (what
+    pandas_datareader's "stooq" reader calls). US tickers get the .us
+    suffix Stooq expects. The endpoint has no intraday bars.
+    """
+
+    BASE_URL = "https://stooq.com"
+
+    def __init__(self, session: SourceSession, base_url: str = None):
+        self.session = session
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+
+    def fetch(self, ticker: str, start=None, interval: str = "1d") -> pd.DataFrame:
+        if interval != "1d":
+            raise ValueError(f"Stooq has no {interval} bars")
+
+        symbol = ticker if "." in ticker else f"{ticker}.us"
+        params = {
+            "s": symbol.lower(),
+            "i": "d",
+            "d1": pd.Timestamp(start or "2023-01-01").strftime("%Y%m%d"),
+            "d2": pd.Timestamp.now(tz="UTC").strftime("%Y%m%d"),
+        }
+        # d2 is today, so an incremental window's URL stays the same all
+        # day while new bars arrive; only full downloads are cached
+        response = self.session.get(f"{self.base_url}/q/d/l/", params, ttl=0 if start is not None else None)
+
+        if not response.content.startswith(b"Date"):
+            # Stooq answers "No data" both for unknown tickers and for an
+            # incremental window without new bars
+            if start is not None:
+                return no_bars()
+            raise ValueError(f"Stooq returned no data for {ticker}")
+        return pd.read_csv(io.BytesIO(response.content), parse_dates=["Date"])
+
+
+class FredSource:
+    """
+    FRED series from the public fredgraph CSV endpoint (no API key).
+    Missing observations ("." in FRED's files) become NaN, as with fredapi.
+    """
+
+    BASE_URL = "https://fred.stlouisfed.org"
+
+    def __init__(self, session: SourceSession, base_url: str = None):
+        self.session = session
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+
+    def fetch(self, indicator: str, start=None) -> pd.DataFrame:
+        params = {"id": indicator}
+        if start is not None:
+            params["cosd"] = pd.Timestamp(start).date().isoformat()
+
+        # An open-ended window gains observations without its URL changing
+        response = self.session.get(
+            f"{self.base_url}/graph/fredgraph.csv", params, ttl=0 if start is not None else None
+        )
+        df = pd.read_csv(io.BytesIO(response.content))
+        if indicator not in df.columns:
+            raise ValueError(f"FRED returned no {indicator} column")
+
+        # Older files name the date column DATE, newer ones observation_date
+        df = df.rename(columns={df.columns[0]: "date"})[["date", indicator]]
+        df["date"] = pd.to_datetime(df["date"])
+        df[indicator] = pd.to_numeric(df[indicator], errors="coerce")
+        return df
+
+
+# ---------------------------------------------------------------------------
+# Process-wide sources: one pooled session, limiter and cache per provider,
+# shared by every ingestor thread.
+# ---------------------------------------------------------------------------
+
+SOURCE_TYPES = {"yahoo": YahooSource, "stooq": StooqSource, "fred": FredSource}
+
+# Requests per second; bursts of the same size
+DEFAULT_RATE_LIMITS = {"yahoo": 5, "stooq": 2, "fred": 2}
+
+_config = {}
+_sources = {}
+_lock = threading.Lock()
+
+
+def configure(
+    rate_limiters: dict = None,
+    ttl: float = 3600,
+    cache: bool = True,
+    cache_dir=None,
+    base_urls: dict = None,
+    retry: RetryPolicy = None,
+):
+    """
+    Replace the shared sources' settings; sources are rebuilt on their
+    next get_source(). rate_limiters maps a provider to a RateLimiter
+    (default: DEFAULT_RATE_LIMITS); base_urls points providers at another
+    host, e.g. a local stub server.
+    """
+    with _lock:
+        for source in _sources.values():
+            source.session.close()
+        _sources.clear()
+        _config.clear()
+        _config.update({
+            "rate_limiters": rate_limiters,
+            "ttl": ttl,
+            "cache": cache,
+            "cache_dir": cache_dir,
+            "base_urls": base_urls or {},
+            "retry": retry,
+        })
+
+
+def get_source(name: str):
+    if name not in SOURCE_TYPES:
+        raise ValueError(f"Unknown data source: {name}")
+
+    with _lock:
+        if name not in _sources:
+            rate_limiters = _config.get("rate_limiters")
+            if rate_limiters is None:
+                rate = DEFAULT_RATE_LIMITS[name]
+                limiter = RateLimiter(rate, burst=max(1, int(rate)))
+            else:
+                limiter = rate_limiters.get(name)
+
+            source_type = SOURCE_TYPES[name]
+            session = SourceSession(
+                name,
+                limiter=limiter,
+                retry=_config.get("retry"),
+                cache=ResponseCache(_config.get("cache_dir")) if _config.get("cache", True) else None,
+                ttl=_config.get("ttl", 3600),
+                headers=getattr(source_type, "HEADERS", None),
+            )
+            _sources[name] = source_type(session, _config.get("base_urls", {}).get(name))
+        return _sources[name]
@@ -1,6 +1,8 @@
 import pandera as pa
 from pandera import Column, DataFrameSchema, Check
 
+from src.validation.fast_validator import FastValidator, RecordValidator
+
 
 EquitiesSchema = DataFrameSchema(
     {
@@ -19,10 +21,13 @@ EquitiesSchema = DataFrameSchema(
             lambda df: df["High"] >= df["Low"],
             error="High price must be >= Low price",
         ),
-        Check(
-            lambda df: df["Date"].is_unique,
-            error="Duplicate timestamps detected",
-        ),
     ],
+    # One bar per ticker and timestamp (multi-ticker panels repeat Dates)
+    unique=["Ticker", "Date"],
     strict=True,
 )
+
+EquitiesValidator = FastValidator(EquitiesSchema)
+
+# One live bar at a time (see src/live/live_engine.py)
+EquitiesBarValidator = RecordValidator(EquitiesSchema)
@@ -1,17 +1,17 @@
 import pandera as pa
 from pandera import Column, DataFrameSchema, Check
 
+from src.validation.fast_validator import FastValidator
+
 
 MacroSchema = DataFrameSchema(
     {
         "date": Column(pa.DateTime, nullable=False),
         "DFF": Column(float, Check.ge(0)),  # Fed Funds Rate >= 0
     },
-    checks=[
-        Check(
-            lambda df: df["date"].is_unique,
-            error="Duplicate macro timestamps detected",
-        )
-    ],
+    # Duplicate macro timestamps are rejected
+    unique=["date"],
     strict=True,
 )
+
+MacroValidator = FastValidator(MacroSchema)
@@ -0,0 +1,50 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.catalog.artifact_catalog import ArtifactCatalog
+from src.event_bus.event_dispatcher import EventDispatcher
+from src.ingestion.base_ingestor import BronzeWriter
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """
+    A scratch working directory: every data/ and metadata/ write of the
+    test lands under tmp_path, and the class-level paths are restored.
+    """
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "metadata").mkdir()
+    monkeypatch.setattr(ArtifactCatalog, "DB_PATH", tmp_path / "metadata" / "catalog.db")
+    monkeypatch.setattr(EventDispatcher, "EVENT_LOG", tmp_path / "metadata" / "event_log.jsonl")
+    monkeypatch.setattr(BronzeWriter, "RUN_LOG", tmp_path / "metadata" / "run_log.jsonl")
+    monkeypatch.setattr(EventDispatcher, "verbose", False)
+    yield tmp_path
+    EventDispatcher.close()
+
+
+def run_log(workspace) -> list:
+    path = workspace / "metadata" / "run_log.jsonl"
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def bars(ticker: str, dates, close=100.0) -> pd.DataFrame:
+    """
+    Valid OHLCV bars with the Bronze equities columns.
+    """
+    dates = pd.to_datetime(list(dates))
+    close = np.broadcast_to(np.asarray(close, dtype=float), len(dates))
+    return pd.DataFrame({
+        "Date": dates,
+        "Open": close,
+        "High": close + 1,
+        "Low": close - 1,
+        "Close": close,
+        "Adj Close": close,
+        "Volume": np.full(len(dates), 1_000, dtype=np.int64),
+        "Ticker": ticker,
+    })
@@ -0,0 +1,53 @@
+import json
+
+import pandas as pd
+
+from src.catalog.artifact_catalog import ArtifactCatalog
+from src.ingestion.equities_ingestor import EquitiesIngestor
+from tests.conftest import bars
+
+
+MINUTES = pd.to_datetime([
+    "2024-01-02 09:30", "2024-01-02 09:31",
+    "2024-01-03 09:30", "2024-01-03 09:31", "2024-01-03 09:32",
+])
+
+
+def ingest_minutes():
+    fetch = lambda ticker, start, interval: bars("AAPL", MINUTES).drop(columns="Ticker")
+    return EquitiesIngestor("AAPL", price_sources=[("fake", fetch)], interval="1m")
+
+
+def catalog_rows(partition: str) -> list:
+    return ArtifactCatalog().range("bronze", "equities", partition)
+
+
+def test_rebuild_records_each_intraday_session_file(workspace):
+    ingestor = ingest_minutes()
+    ingestor.run()
+    written = catalog_rows("AAPL_1m")
+
+    ArtifactCatalog().rebuild()
+    rebuilt = catalog_rows("AAPL_1m")
+
+    assert [r["path"] for r in rebuilt] == [r["path"] for r in written]
+    assert [r["data_date"] for r in rebuilt] == ["2024-01-02", "2024-01-03"]
+    assert [r["row_count"] for r in rebuilt] == [2, 3]
+    assert all(r["path"].endswith("raw_data.parquet") for r in rebuilt)
+
+
+def test_rebuild_resolves_older_directory_entries_from_disk(workspace):
+    ingest_minutes().run()
+
+    # A run log written before per-file records existed
+    run_log = workspace / "metadata" / "run_log.jsonl"
+    entries = [json.loads(line) for line in run_log.read_text().splitlines()]
+    for entry in entries:
+        entry.pop("files", None)
+    run_log.write_text("".join(json.dumps(e) + "\n" for e in entries))
+
+    ArtifactCatalog().rebuild()
+
+    rows = catalog_rows("AAPL_1m")
+    assert [r["data_date"] for r in rows] == ["2024-01-02", "2024-01-03"]
+    assert all(r["path"].endswith("raw_data.parquet") for r in rows)
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.bootstrap import (
+    BOOTSTRAP_METRICS, BootstrapResampler, path_metrics, stationary_bootstrap_indices,
+)
+from src.backtest.equities_backtest import EquitiesBacktester
+
+
+def returns(n: int = 500, seed: int = 11) -> np.ndarray:
+    return np.random.default_rng(seed).normal(0.0005, 0.01, n)
+
+
+def test_indices_are_wrapped_blocks_of_the_mean_length():
+    idx = stationary_bootstrap_indices(250, 400, mean_block=10, rng=np.random.default_rng(0))
+
+    assert idx.shape == (400, 250)
+    assert idx.min() >= 0 and idx.max() < 250
+    # within a block, each day follows the previous one (wrapping at the end)
+    continues = idx[:, 1:] == (idx[:, :-1] + 1) % 250
+    assert 1 / (1 - continues.mean()) == pytest.approx(10, rel=0.1)
+
+
+def test_path_metrics_match_the_backtester():
+    r = returns()
+    df = pd.DataFrame({"net_return": r, "equity": 1_000_000 * np.cumprod(1 + r)})
+
+    expected = EquitiesBacktester(None).metrics(df, periods=252)
+    result = path_metrics(r[np.newaxis, :], periods_per_year=252)
+
+    for metric in BOOTSTRAP_METRICS:
+        assert result[metric][0] == pytest.approx(expected[metric])
+
+
+def test_resample_is_reproducible_per_seed():
+    r = returns()
+
+    first = BootstrapResampler(n_paths=200, seed=3).resample(r)
+    again = BootstrapResampler(n_paths=200, seed=3).resample(r)
+    other = BootstrapResampler(n_paths=200, seed=4).resample(r)
+
+    pd.testing.assert_frame_equal(first, again)
+    assert not first.equals(other)
+
+
+def test_chunked_resample_yields_every_path():
+    r = returns()
+
+    paths = BootstrapResampler(n_paths=250, max_cells=len(r) * 16).resample(r)
+
+    assert len(paths) == 250
+    assert list(paths.columns) == BOOTSTRAP_METRICS
+    assert paths.notna().all().all()
+
+
+def test_nan_returns_are_dropped():
+    r = returns()
+    with_gaps = np.insert(r, [0, 100], np.nan)
+
+    resampler = BootstrapResampler(n_paths=50)
+
+    pd.testing.assert_frame_equal(resampler.resample(with_gaps), resampler.resample(r))
+
+
+def test_too_few_returns_are_rejected():
+    with pytest.raises(ValueError):
+        BootstrapResampler(n_paths=10).resample([0.01, np.nan])
+
+
+def test_intervals_contain_the_point_estimate():
+    r = returns()
+    point = {m: v[0] for m, v in path_metrics(r[np.newaxis, :]).items()}
+    resampler = BootstrapResampler(n_paths=1_000, mean_block=20, confidence=0.9)
+
+    table = resampler.intervals(resampler.resample(r), point=point).set_index("metric")
+
+    assert list(table.index) == BOOTSTRAP_METRICS
+    assert (table["lower"] <= table["median"]).all()
+    assert (table["median"] <= table["upper"]).all()
+    assert ((table["lower"] <= table["point"]) & (table["point"] <= table["upper"])).all()
+    assert (table["paths"] == 1_000).all()
+    assert (table["confidence"] == 0.9).all()
+
+
+def test_intervals_widen_with_confidence():
+    paths = BootstrapResampler(n_paths=500).resample(returns())
+
+    narrow = BootstrapResampler(confidence=0.5).intervals(paths).set_index("metric")
+    wide = BootstrapResampler(confidence=0.99).intervals(paths).set_index("metric")
+
+    assert (wide["lower"] < narrow["lower"]).all()
+    assert (wide["upper"] > narrow["upper"]).all()
+    assert narrow["point"].isna().all()
+
+
+def test_drawdown_distribution_is_ordered():
+    paths = BootstrapResampler(n_paths=300).resample(returns())
+
+    quantiles = BootstrapResampler().drawdown_distribution(paths)
+
+    assert list(quantiles) == ["p01", "p05", "p25", "p50", "p75", "p95"]
+    assert list(quantiles.values()) == sorted(quantiles.values())
+    assert all(v <= 0 for v in quantiles.values())
@@ -0,0 +1,59 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from src.catalog.artifact_catalog import ArtifactCatalog
+from src.silver.bronze_reader import bronze_files, read_bronze
+from tests.conftest import bars
+
+
+ROOT = Path("data") / "bronze" / "equities" / "AAPL"
+
+
+def delta(name: str, df, register: bool = True, mtime: float = None) -> Path:
+    path = ROOT / "2024-01-02" / name / "raw_data.parquet"
+    path.parent.mkdir(parents=True)
+    df.to_parquet(path, index=False)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    if register:
+        ArtifactCatalog().register(layer="bronze", domain="equities", path=path, partition="AAPL")
+    return path
+
+
+def test_catalog_orders_registered_deltas(workspace):
+    # Registration order, not name or mtime order, is ingestion order
+    second = delta("b", bars("AAPL", ["2024-01-03"]), mtime=1_000)
+    first = delta("a", bars("AAPL", ["2024-01-04"]), mtime=2_000)
+
+    assert bronze_files(ROOT) == [second, first]
+
+
+def test_unregistered_files_are_included_first(workspace):
+    registered = delta("run-2", bars("AAPL", ["2024-01-04"]))
+    legacy = delta("run-1", bars("AAPL", ["2024-01-03"]), register=False)
+
+    assert bronze_files(ROOT) == [legacy, registered]
+
+
+def test_catalog_entries_for_deleted_files_are_ignored(workspace):
+    kept = delta("run-1", bars("AAPL", ["2024-01-03"]))
+    gone = delta("run-2", bars("AAPL", ["2024-01-04"]))
+    gone.unlink()
+
+    assert bronze_files(ROOT) == [kept]
+
+
+def test_missing_bronze_raises(workspace):
+    ROOT.mkdir(parents=True)
+    with pytest.raises(FileNotFoundError):
+        bronze_files(ROOT)
+
+
+def test_later_deltas_are_read_last(workspace):
+    delta("run-1", bars("AAPL", ["2024-01-03"], close=1.0))
+    delta("run-2", bars("AAPL", ["2024-01-03"], close=2.0))
+
+    df = read_bronze(ROOT)
+    assert df["Close"].tolist() == [1.0, 2.0]
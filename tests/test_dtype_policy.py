@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipeline.dtype_policy import DtypePolicy, get_policy
+
+
+def frame(scale: float = 1.0) -> pd.DataFrame:
+    return pd.DataFrame({
+        "Date": pd.date_range("2024-01-01", periods=3),
+        "Ticker": ["AAA", "AAA", "BBB"],
+        "Close": np.array([100.0, 101.5, 99.25]) * scale,
+        "position": [0, 1, 1],
+        "trade": [0, 1, 0],
+        "equity": [1e6, 1.000001e6, 1.000002e6],
+    })
+
+
+def test_compact_policy_narrows_columns():
+    df = get_policy("compact").apply(frame())
+
+    assert df["Close"].dtype == np.float32
+    assert isinstance(df["Ticker"].dtype, pd.CategoricalDtype)
+    assert df["position"].dtype == np.int8
+    assert df["trade"].dtype == np.int8
+    # compounding money keeps its precision
+    assert df["equity"].dtype == np.float64
+    assert df["equity"].tolist() == frame()["equity"].tolist()
+    assert df["Date"].dtype == frame()["Date"].dtype
+
+
+def test_apply_leaves_the_input_alone():
+    original = frame()
+
+    get_policy("compact").apply(original)
+
+    assert original["Close"].dtype == np.float64
+    assert original["Ticker"].dtype == object
+
+
+def test_strings_stay_strings_without_categoricals():
+    df = get_policy("compact").apply(frame(), categoricals=False)
+
+    assert df["Ticker"].dtype == object
+    assert df["Close"].dtype == np.float32
+
+
+def test_dtypes_follow_the_policy_not_the_values():
+    small = get_policy("compact").apply(frame())
+    large = get_policy("compact").apply(frame(scale=1e30))
+
+    assert small.dtypes.to_dict() == large.dtypes.to_dict()
+
+
+def test_value_beyond_float32_raises():
+    with pytest.raises(ValueError, match="Close"):
+        get_policy("compact").apply(frame(scale=1e300))
+
+
+def test_non_finite_values_fit_float32():
+    df = frame()
+    df.loc[0, "Close"] = np.inf
+    df.loc[1, "Close"] = np.nan
+
+    assert get_policy("compact").apply(df)["Close"].dtype == np.float32
+
+
+def test_legacy_policy_is_a_no_op():
+    df = frame()
+
+    assert get_policy("legacy").apply(df) is df
+    assert get_policy("legacy").parquet_options(df) == {}
+
+
+def test_parquet_options_split_floats_from_dictionaries():
+    policy = get_policy("compact")
+    df = policy.apply(frame())
+
+    options = policy.parquet_options(df)
+
+    assert options["compression"] == "zstd"
+    assert set(options["use_byte_stream_split"]) == {"Close", "equity"}
+    assert set(options["use_dictionary"]) == {"Date", "Ticker", "position", "trade"}
+
+
+def test_get_policy():
+    policy = DtypePolicy("custom", float_dtype="float32")
+
+    assert get_policy(policy) is policy
+    assert get_policy("compact").name == "compact"
+    with pytest.raises(ValueError):
+        get_policy("tiny")
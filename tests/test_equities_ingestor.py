@@ -0,0 +1,133 @@
+import pandas as pd
+import pytest
+
+from src.ingestion.equities_ingestor import EquitiesIngestor
+from src.ingestion.rate_limiter import RateLimiter
+from src.sources.providers import no_bars
+from tests.conftest import bars, run_log
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.calls = 0
+
+    def acquire(self):
+        self.calls += 1
+
+
+def source(frames, calls=None):
+    """
+    Fetch function returning the given frames (or raising the given
+    exceptions) one call at a time.
+    """
+    frames = list(frames)
+
+    def fetch(ticker, start, interval):
+        if calls is not None:
+            calls.append(start)
+        result = frames.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result.drop(columns="Ticker")
+
+    return fetch
+
+
+DAYS = pd.bdate_range("2024-01-02", periods=5)
+
+
+def test_falls_back_to_next_source_and_rate_limits_each(workspace):
+    limiters = {"primary": CountingLimiter(), "backup": CountingLimiter()}
+    ingestor = EquitiesIngestor(
+        "AAPL",
+        price_sources=[
+            ("primary", source([ConnectionError("down")])),
+            ("backup", source([bars("AAPL", DAYS)])),
+        ],
+        rate_limiters=limiters,
+    )
+
+    path = ingestor.run()
+
+    assert path.exists()
+    assert len(pd.read_parquet(path)) == len(DAYS)
+    assert limiters["primary"].calls == 1
+    assert limiters["backup"].calls == 1
+    assert run_log(workspace)[-1]["status"] == "SUCCESS"
+
+
+def test_empty_full_download_counts_as_source_failure(workspace):
+    ingestor = EquitiesIngestor(
+        "AAPL",
+        price_sources=[
+            ("primary", lambda ticker, start, interval: no_bars()),
+            ("backup", source([bars("AAPL", DAYS)])),
+        ],
+    )
+
+    assert ingestor.run() is not None
+
+
+def test_all_sources_failing_logs_failed(workspace):
+    ingestor = EquitiesIngestor(
+        "AAPL",
+        price_sources=[
+            ("primary", source([ConnectionError("down")])),
+            ("backup", source([ValueError("no data")])),
+        ],
+    )
+
+    with pytest.raises(RuntimeError, match="All sources failed"):
+        ingestor.run()
+    assert run_log(workspace)[-1]["status"] == "FAILED"
+
+
+def test_incremental_run_without_new_bars_is_no_new_data(workspace):
+    primary_calls, backup_calls = [], []
+    ingestor = EquitiesIngestor(
+        "AAPL",
+        price_sources=[
+            ("primary", source([bars("AAPL", DAYS), no_bars().assign(Ticker="AAPL")], primary_calls)),
+            ("backup", source([], backup_calls)),
+        ],
+    )
+    assert ingestor.run() is not None
+
+    # The next run asks from the watermark day and gets nothing
+    rerun = EquitiesIngestor("AAPL", price_sources=ingestor.price_sources)
+    assert rerun.run() is None
+
+    assert primary_calls == [None, DAYS[-1].date().isoformat()]
+    assert backup_calls == []
+    assert run_log(workspace)[-1]["status"] == "NO_NEW_DATA"
+
+
+def test_watermark_bar_is_fetched_again_and_revised(workspace):
+    sources = [("primary", source([bars("AAPL", DAYS), bars("AAPL", DAYS[-1:], close=101.0)]))]
+    EquitiesIngestor("AAPL", price_sources=sources).run()
+
+    path = EquitiesIngestor("AAPL", price_sources=sources).run()
+
+    revised = pd.read_parquet(path)
+    assert revised["Date"].tolist() == [DAYS[-1]]
+    assert revised["Close"].tolist() == [101.0]
+
+
+def test_rate_limiter_allows_a_burst_then_paces():
+    limiter = RateLimiter(rate=50, burst=2)
+
+    start = pd.Timestamp.now()
+    for _ in range(2):
+        limiter.acquire()
+    burst = (pd.Timestamp.now() - start).total_seconds()
+    for _ in range(3):
+        limiter.acquire()
+    paced = (pd.Timestamp.now() - start).total_seconds()
+
+    assert burst < 0.02
+    assert paced >= 3 / 50 * 0.9
+
+
+def test_rate_limiter_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
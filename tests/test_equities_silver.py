@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.catalog.artifact_catalog import ArtifactCatalog
+from src.silver.equities_silver import SILVER_COLS, EquitiesSilverProcessor
+from tests.conftest import bars
+
+
+ROOT = Path("data") / "bronze" / "equities" / "panel"
+
+
+def write_deltas(*frames):
+    for i, df in enumerate(frames):
+        path = ROOT / "2024-01-02" / f"run-{i}" / "raw_data.parquet"
+        path.parent.mkdir(parents=True)
+        df.to_parquet(path, index=False)
+        ArtifactCatalog().register(layer="bronze", domain="equities", path=path, partition="panel")
+
+
+def minutes(start: str, n: int):
+    return pd.date_range(start, periods=n, freq="min")
+
+
+def overlapping_deltas():
+    # Run 2 re-fetches each ticker's still-forming last bar with a revision
+    first = pd.concat([
+        bars("AAA", minutes("2024-01-02 09:30", 5), close=10.0),
+        bars("BBB", minutes("2024-01-02 09:30", 3), close=20.0),
+    ])
+    second = pd.concat([
+        bars("AAA", minutes("2024-01-02 09:34", 4), close=11.0),
+        bars("BBB", minutes("2024-01-02 09:32", 2), close=21.0),
+    ])
+    return first, second
+
+
+def sorted_frame(df):
+    # Streaming writes Ticker as plain strings (one schema per row group)
+    df = df[SILVER_COLS].astype({"Ticker": str})
+    return df.sort_values(["Ticker", "Date"]).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 100])
+def test_streaming_matches_batch(workspace, chunk_size):
+    write_deltas(*overlapping_deltas())
+
+    batch = EquitiesSilverProcessor(ROOT)
+    expected = batch.load()
+
+    streaming = EquitiesSilverProcessor(ROOT, streaming=True, chunk_size=chunk_size)
+    streamed = pd.concat(list(streaming.iter_chunks()), ignore_index=True)
+
+    pd.testing.assert_frame_equal(sorted_frame(streamed), sorted_frame(expected))
+    assert streaming.dropped == batch.dropped
+    # The re-fetched bars win in both modes
+    revised = expected.set_index(["Ticker", "Date"])["Close"]
+    assert revised[("AAA", pd.Timestamp("2024-01-02 09:34"))] == 11.0
+    assert revised[("BBB", pd.Timestamp("2024-01-02 09:32"))] == 21.0
+
+
+def test_streaming_write_matches_batch_write(workspace):
+    write_deltas(*overlapping_deltas())
+
+    batch_path = EquitiesSilverProcessor(ROOT, partition="batch").run()
+    stream_path = EquitiesSilverProcessor(ROOT, partition="stream", streaming=True, chunk_size=2).run()
+
+    pd.testing.assert_frame_equal(
+        sorted_frame(pd.read_parquet(stream_path)),
+        sorted_frame(pd.read_parquet(batch_path)),
+    )
+
+
+def test_streaming_refuses_out_of_order_bronze(workspace):
+    write_deltas(
+        bars("AAA", minutes("2024-01-02 09:30", 5)),
+        bars("AAA", minutes("2024-01-02 09:31", 1), close=50.0),
+    )
+
+    with pytest.raises(ValueError, match="streaming=False"):
+        list(EquitiesSilverProcessor(ROOT, streaming=True, chunk_size=2).iter_chunks())
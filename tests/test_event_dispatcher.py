@@ -0,0 +1,59 @@
+import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.event_bus.event_dispatcher import EventDispatcher
+
+
+@pytest.fixture
+def batch(workspace, monkeypatch):
+    monkeypatch.setattr(EventDispatcher, "durability", "batch")
+    monkeypatch.setattr(EventDispatcher, "batch_size", 1_000)
+    monkeypatch.setattr(EventDispatcher, "flush_interval", 60.0)
+    EventDispatcher.flush()
+    return workspace / "metadata" / "event_log.jsonl"
+
+
+def logged(path) -> list:
+    if not path.exists():
+        return []
+    return [json.loads(line)["event_type"] for line in path.read_text().splitlines()]
+
+
+def emit_in_child(event_type: str):
+    EventDispatcher.emit(event_type=event_type, payload={})
+    return event_type
+
+
+def test_quiet_bus_is_flushed_on_a_timer(batch, monkeypatch):
+    monkeypatch.setattr(EventDispatcher, "flush_interval", 0.05)
+    EventDispatcher.emit(event_type="LONELY", payload={})
+
+    deadline = time.monotonic() + 2
+    while not logged(batch) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert logged(batch) == ["LONELY"]
+
+
+def test_forked_child_writes_its_own_events_once(batch):
+    EventDispatcher.emit(event_type="PARENT", payload={})
+
+    child = multiprocessing.get_context("fork").Process(target=emit_in_child, args=("CHILD",))
+    child.start()
+    child.join()
+    assert child.exitcode == 0
+
+    EventDispatcher.flush()
+    assert sorted(logged(batch)) == ["CHILD", "PARENT"]
+
+
+def test_process_pool_events_are_not_lost(batch):
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("fork")) as pool:
+        names = list(pool.map(emit_in_child, [f"WORKER_{i}" for i in range(6)]))
+
+    EventDispatcher.flush()
+    assert sorted(logged(batch)) == sorted(names)
@@ -0,0 +1,126 @@
+import pandas as pd
+import pandera as pa
+import pytest
+
+from src.validation.equities_schema import EquitiesSchema, EquitiesValidator
+from tests.conftest import bars
+
+
+def violations(failure_cases: pd.DataFrame) -> set:
+    """
+    (column, check, index) of every failure case, comparable across
+    pandera and the compiled validator.
+    """
+    return {
+        (str(row.column), str(row.check), str(row.index))
+        for row in failure_cases[["column", "check", "index"]].itertuples(index=False)
+    }
+
+
+def pandera_violations(df: pd.DataFrame) -> set:
+    try:
+        EquitiesSchema.validate(df, lazy=True)
+    except pa.errors.SchemaErrors as exc:
+        return violations(exc.failure_cases)
+    return set()
+
+
+def frame() -> pd.DataFrame:
+    return bars("AAA", pd.date_range("2024-01-01", periods=6))
+
+
+def negative_price(df):
+    df.loc[1, "Close"] = -1.0
+    return df
+
+
+def high_below_low(df):
+    df.loc[2, "High"] = 50.0
+    return df
+
+
+def duplicate_key(df):
+    df.loc[4, "Date"] = df.loc[3, "Date"]
+    return df
+
+
+def negative_volume(df):
+    df.loc[0, "Volume"] = -5
+    return df
+
+
+def extra_column(df):
+    df["Note"] = "x"
+    return df
+
+
+def float_volume(df):
+    df["Volume"] = df["Volume"].astype(float)
+    return df
+
+
+@pytest.mark.parametrize("corrupt", [
+    negative_price, high_below_low, duplicate_key, negative_volume,
+    extra_column, float_volume,
+])
+def test_failures_match_pandera(corrupt):
+    df = corrupt(frame())
+
+    expected = pandera_violations(df)
+    failure_cases, _ = EquitiesValidator.failures(df)
+
+    assert expected
+    assert violations(failure_cases) == expected
+
+
+def test_every_violation_is_reported_at_once():
+    df = duplicate_key(high_below_low(negative_price(frame())))
+
+    failure_cases, _ = EquitiesValidator.failures(df)
+
+    assert violations(failure_cases) == pandera_violations(df)
+    assert set(failure_cases["check"]) >= {
+        "greater_than_or_equal_to(0)",
+        "multiple_fields_uniqueness",
+        "High price must be >= Low price",
+    }
+
+
+def test_valid_frame_passes_both():
+    df = frame()
+
+    assert pandera_violations(df) == set()
+    assert EquitiesValidator.validate(df) is df
+
+
+def test_validate_raises_a_schema_error_with_failure_cases():
+    df = negative_price(frame())
+
+    with pytest.raises(pa.errors.SchemaError) as exc:
+        EquitiesValidator.validate(df)
+
+    assert violations(exc.value.failure_cases) == pandera_violations(df)
+
+
+def test_duplicates_across_chunks_are_caught():
+    df = pd.concat([
+        bars("AAA", pd.date_range("2024-01-01", periods=4)),
+        bars("AAA", ["2024-01-02"]),
+    ], ignore_index=True)
+
+    # each chunk is unique on its own
+    with pytest.raises(pa.errors.SchemaError) as exc:
+        EquitiesValidator.validate(df, chunk_size=2)
+
+    cases = exc.value.failure_cases
+    assert set(cases["check"]) == {"multiple_fields_uniqueness"}
+    assert set(cases["index"]) == {4}
+
+
+def test_same_ticker_date_in_other_ticker_is_not_a_duplicate():
+    df = pd.concat([
+        bars("AAA", pd.date_range("2024-01-01", periods=3)),
+        bars("BBB", pd.date_range("2024-01-01", periods=3)),
+    ], ignore_index=True)
+
+    assert EquitiesValidator.validate(df, chunk_size=2) is df
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.equities_features import EquitiesFeatureFactory
+from src.features.incremental_features import IncrementalFeatureEngine, read_features
+from src.features.panel_features import FEATURE_COLUMNS
+from tests.conftest import bars
+
+
+DAYS = pd.bdate_range("2023-01-02", periods=160)
+
+
+def silver(days, revised_close: dict = None) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    frames = []
+    for ticker in ("AAA", "BBB"):
+        close = 100 * np.cumprod(1 + rng.normal(0, 0.015, len(DAYS)))
+        frame = bars(ticker, DAYS, close)
+        frames.append(frame[frame["Date"].isin(days)])
+    df = pd.concat(frames, ignore_index=True)
+    for (ticker, date), value in (revised_close or {}).items():
+        df.loc[(df["Ticker"] == ticker) & (df["Date"] == date), "Adj Close"] = value
+    return df
+
+
+def run_incremental(workspace, df: pd.DataFrame) -> pd.DataFrame:
+    path = workspace / "silver.parquet"
+    df.to_parquet(path, index=False)
+    return IncrementalFeatureEngine(path, partition="panel").run()
+
+
+def full_recompute(workspace, df: pd.DataFrame) -> pd.DataFrame:
+    path = workspace / "silver_full.parquet"
+    df.to_parquet(path, index=False)
+    return pd.read_parquet(EquitiesFeatureFactory(path, panel=True).run())
+
+
+def sorted_features(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.astype({"Ticker": str}).sort_values(["Ticker", "Date"]).reset_index(drop=True)
+    return df[["Ticker", "Date", *FEATURE_COLUMNS, "vol_regime"]]
+
+
+def assert_same_features(ours: pd.DataFrame, full: pd.DataFrame):
+    ours, full = sorted_features(ours), sorted_features(full)
+    pd.testing.assert_frame_equal(ours[["Ticker", "Date"]], full[["Ticker", "Date"]])
+    np.testing.assert_allclose(
+        ours[FEATURE_COLUMNS].to_numpy(dtype=float),
+        full[FEATURE_COLUMNS].to_numpy(dtype=float),
+        rtol=1e-5,
+    )
+    assert ours["vol_regime"].astype(str).tolist() == full["vol_regime"].astype(str).tolist()
+
+
+@pytest.mark.parametrize("first_run_bars", [100, 159])
+def test_incremental_runs_match_a_full_recompute(workspace, first_run_bars):
+    run_incremental(workspace, silver(DAYS[:first_run_bars]))
+    store = run_incremental(workspace, silver(DAYS))
+
+    assert_same_features(read_features(store), full_recompute(workspace, silver(DAYS)))
+
+
+def test_revised_newest_bar_is_processed_again(workspace):
+    run_incremental(workspace, silver(DAYS[:120]))
+
+    # The session of the newest stored bar was still open: its close changes
+    revised = silver(DAYS, revised_close={("AAA", DAYS[119]): 150.0})
+    store = run_incremental(workspace, revised)
+
+    features = read_features(store)
+    assert not features.duplicated(["Ticker", "Date"]).any()
+    assert_same_features(features, full_recompute(workspace, revised))
+
+
+def test_rerun_without_new_bars_changes_nothing(workspace):
+    df = silver(DAYS)
+    store = run_incremental(workspace, df)
+    before = sorted_features(read_features(store))
+
+    run_incremental(workspace, df)
+
+    pd.testing.assert_frame_equal(sorted_features(read_features(store)), before)
@@ -0,0 +1,78 @@
+import time
+
+import pandas as pd
+import pytest
+
+from src.live.live_engine import LatencyHistogram, LiveSignalEngine
+from tests.conftest import run_log
+
+
+def bar(date, ticker: str = "AAA", close: float = 100.0, **overrides) -> dict:
+    return {
+        "Date": date, "Open": close, "High": close + 1, "Low": close - 1,
+        "Close": close, "Adj Close": close, "Volume": 1_000, "Ticker": ticker,
+        **overrides,
+    }
+
+
+@pytest.fixture
+def engine(workspace):
+    return LiveSignalEngine(checkpoint_bars=1_000_000, checkpoint_seconds=3600)
+
+
+def feed(bars):
+    return [(b, time.perf_counter_ns()) for b in bars]
+
+
+@pytest.mark.parametrize("bad, reason", [
+    (bar("2024-01-02 10:01", High=90.0), "High price"),
+    (bar("2024-01-02 10:01", Close=-1.0), "Close"),
+    (bar("2024-01-02 10:01", Volume="lots"), "Volume"),
+    (bar("not-a-date"), "Unparseable Date"),
+    (bar(None), "Date"),
+    (bar("2024-01-02 10:00"), "not after previous bar"),
+    (bar("2024-01-02 09:59"), "not after previous bar"),
+])
+def test_bad_bar_is_rejected_without_stopping_the_feed(engine, bad, reason):
+    report = engine.run(feed([bar("2024-01-02 10:00"), bad, bar("2024-01-02 10:02")]))
+
+    assert report["bars"] == 3
+    assert report["rejected"] == 1
+    assert reason in " ".join(report["rejections"][0]["errors"])
+    assert engine.last_seen["AAA"] == pd.Timestamp("2024-01-02 10:02")
+
+
+def test_tz_aware_and_naive_dates_are_compared_in_utc(engine):
+    codes = [
+        engine.on_bar(b, time.perf_counter_ns())
+        for b in (
+            bar("2024-01-02 15:00"),
+            bar("2024-01-02 10:01-05:00"),  # 15:01 UTC
+            bar(pd.Timestamp("2024-01-02 15:01", tz="UTC")),
+        )
+    ]
+
+    assert codes[0] is not None and codes[1] is not None
+    assert codes[2] is None
+    assert engine.last_seen["AAA"] == pd.Timestamp("2024-01-02 15:01")
+
+
+def test_checkpoint_records_raw_bars_to_bronze(engine, workspace):
+    engine.run(feed([bar("2024-01-02 10:00"), bar("not-a-date"), bar("2024-01-02 10:01")]))
+
+    entry = run_log(workspace)[-1]
+    assert entry["status"] == "SUCCESS"
+    assert entry["record_count"] == 3
+    assert len(pd.read_parquet(entry["storage_path"])) == 3
+
+
+def test_latency_histogram_is_bounded_and_close_to_exact():
+    histogram = LatencyHistogram()
+    samples = range(1_000, 1_001_000, 100)
+    for ns in samples:
+        histogram.add(ns, LatencyHistogram.bucket(ns))
+
+    assert len(histogram.counts) == LatencyHistogram.BUCKETS
+    assert histogram.total == len(samples)
+    exact = pd.Series(samples).quantile(0.99)
+    assert exact <= histogram.percentile(99) <= exact * LatencyHistogram.GROWTH ** 2
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.equities_backtest import EquitiesBacktester
+from src.backtest.parameter_sweep import ParameterSweep
+from src.features.panel_features import REGIME_LABELS
+from src.signals.equities_signals import EquitiesSignalEngine, strategy_rules
+
+
+def features(ticker: str = "AAA", n: int = 300, seed: int = 3) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Date": pd.bdate_range("2023-01-02", periods=n),
+        "Ticker": ticker,
+        "Adj Close": 100 * np.cumprod(1 + rng.normal(0, 0.01, n)),
+        "sharpe_60d": rng.normal(0.5, 1.0, n),
+        "cagr_60d": rng.normal(0.05, 0.1, n),
+        "vol_regime": pd.Categorical.from_codes(rng.integers(0, 3, n), REGIME_LABELS, ordered=True),
+    })
+
+
+def write_features(workspace, df: pd.DataFrame, name: str = "features.parquet"):
+    path = workspace / name
+    df.to_parquet(path, index=False)
+    return path
+
+
+def test_sweep_matches_the_signal_engine_and_backtester(workspace):
+    df = features()
+    sweep = ParameterSweep(
+        write_features(workspace, df),
+        buy_sharpe=(0.5, 1.0), sell_sharpe=(-0.5, 0.0), txn_cost_bps=(0, 10), bar_freq="1d",
+    )
+    results = pd.read_parquet(sweep.run())
+    assert len(results) == 8
+
+    for row in results.itertuples():
+        rules = {"strategies": {"s": strategy_rules(buy_sharpe=row.buy_sharpe, sell_sharpe=row.sell_sharpe)}}
+        signals = EquitiesSignalEngine(None, rules=rules).generate_signals(df.copy())
+        backtester = EquitiesBacktester(None, txn_cost_bps=row.txn_cost_bps, bar_freq="1d")
+        simulated = backtester.simulate(signals)
+        expected = backtester.metrics(simulated)
+
+        assert row.CAGR == pytest.approx(expected["CAGR"])
+        assert row.Sharpe == pytest.approx(expected["Sharpe"])
+        assert row.MaxDrawdown == pytest.approx(expected["MaxDrawdown"])
+        assert row.Trades == simulated["trade"].sum()
+
+
+def test_custom_strategy_template_drives_the_signals(workspace):
+    path = write_features(workspace, features())
+    template = {"buy": "sharpe_60d > {buy_sharpe}", "sell": "sharpe_60d < {sell_sharpe}"}
+
+    default = pd.read_parquet(ParameterSweep(path, bar_freq="1d").run())
+    custom = pd.read_parquet(ParameterSweep(path, bar_freq="1d", rules=template).run())
+
+    assert default["Trades"].iloc[0] != custom["Trades"].iloc[0]
+
+
+def test_sweeps_of_different_tickers_do_not_overwrite_each_other(workspace):
+    first = ParameterSweep(write_features(workspace, features("AAA"), "a.parquet"), bar_freq="1d").run()
+    second = ParameterSweep(write_features(workspace, features("BBB", seed=4), "b.parquet"), bar_freq="1d").run()
+
+    assert first != second
+    assert first.parent.parent.name == "AAA"
+    assert second.parent.parent.name == "BBB"
+    assert first.exists() and second.exists()
+
+
+def test_sweep_refuses_a_multi_ticker_panel(workspace):
+    path = write_features(workspace, pd.concat([features("AAA"), features("BBB")]))
+
+    with pytest.raises(ValueError, match="one ticker"):
+        ParameterSweep(path).run()
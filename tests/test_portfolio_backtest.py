@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.equities_backtest import EquitiesBacktester
+from src.backtest.portfolio_backtest import PortfolioBacktester
+from src.signals.rule_dsl import BUY, HOLD
+
+
+DAYS = pd.bdate_range("2024-01-02", periods=6)
+
+
+def signals(closes: dict, signal: dict = None) -> pd.DataFrame:
+    frames = []
+    for ticker, close in closes.items():
+        frames.append(pd.DataFrame({
+            "Date": DAYS[:len(close)],
+            "Ticker": ticker,
+            "Adj Close": np.asarray(close, dtype=float),
+            "signal": np.asarray((signal or {}).get(ticker, [BUY] * len(close)), dtype=np.int8),
+            "vol_60d": 0.01,
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def simulate(df: pd.DataFrame, **kwargs) -> dict:
+    backtester = PortfolioBacktester(None, bar_freq="1d", **kwargs)
+    return backtester.simulate(backtester.to_matrices(df))
+
+
+def test_weights_drift_between_rebalances():
+    df = signals({"AAA": [100, 110, 110, 110], "BBB": [100, 100, 100, 100]})
+    result = simulate(df, rebalance_every=2, txn_cost_bps=10)
+
+    # Bar 1 is not a rebalance bar: AAA's gain raises its weight
+    np.testing.assert_allclose(result["weights"][1], [55 / 105, 50 / 105])
+    assert result["turnover"][1] == 0
+
+    # Bar 2 trades back to 50/50 from the drifted weights
+    np.testing.assert_allclose(result["weights"][2], [0.5, 0.5])
+    assert result["turnover"][2] == pytest.approx(2 * (55 / 105 - 0.5))
+    np.testing.assert_allclose(result["txn_cost"], result["turnover"] * 0.001)
+
+
+def test_daily_rebalancing_pays_for_drift():
+    df = signals({"AAA": [100, 110, 99, 108], "BBB": [100, 95, 97, 101]})
+
+    daily = simulate(df, rebalance_every=1)
+    held = simulate(df, rebalance_every=10)
+
+    assert (daily["turnover"][1:] > 0).all()
+    assert (held["turnover"] == 0).all()
+
+
+def test_equity_follows_the_drifted_holdings():
+    df = signals({"AAA": [100, 110, 121, 133.1], "BBB": [100, 90, 81, 72.9]})
+    result = simulate(df, rebalance_every=100, txn_cost_bps=0)
+
+    # Buy-and-hold of 50/50: the value is the average of the two price paths
+    expected = 1_000_000 * (df.pivot(index="Date", columns="Ticker", values="Adj Close") / 100).mean(axis=1)
+    np.testing.assert_allclose(result["equity"], expected.to_numpy())
+
+
+def test_single_ticker_matches_the_single_asset_backtester():
+    close = [100, 102, 101, 105, 104, 108]
+    signal = [HOLD, BUY, BUY, HOLD, BUY, BUY]
+    df = signals({"AAA": close}, {"AAA": signal})
+
+    result = simulate(df, rebalance_every=1, txn_cost_bps=10)
+    expected = EquitiesBacktester(None, txn_cost_bps=10, bar_freq="1d").simulate(df)
+
+    np.testing.assert_allclose(result["net_return"], expected["net_return"])
+    np.testing.assert_allclose(result["equity"], expected["equity"])
+
+
+def test_runs_in_different_partitions_do_not_overwrite_each_other(workspace):
+    path = workspace / "signals.parquet"
+    signals({"AAA": [100, 101, 102], "BBB": [100, 99, 98]}).to_parquet(path, index=False)
+
+    equal = PortfolioBacktester(path, partition="portfolio_equal", bar_freq="1d").run()
+    inverse = PortfolioBacktester(path, weighting="inverse_vol", partition="portfolio_inverse_vol", bar_freq="1d").run()
+
+    assert equal != inverse
+    assert (equal / "portfolio_equity.parquet").exists()
+    assert (inverse / "portfolio_equity.parquet").exists()
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.signals.rule_dsl import (
+    BUY, HOLD, SELL, RuleError, RuleSet, to_categorical, to_codes,
+)
+
+REGIMES = ["LOW", "MED", "HIGH"]
+
+SPEC = {
+    "strategies": {
+        "default": {
+            "buy": "sharpe_60d > 1 and cagr_60d > 0 and vol_regime == 'LOW'",
+            "sell": "sharpe_60d < 0 or vol_regime == 'HIGH'",
+        },
+        "momentum": {
+            "buy": "cagr_60d - 0.1 > 0",
+        },
+    }
+}
+
+
+def features() -> pd.DataFrame:
+    return pd.DataFrame({
+        "sharpe_60d": [2.0, 2.0, -1.0, 0.5, np.nan, 2.0],
+        "cagr_60d": [0.2, 0.2, 0.3, 0.05, 0.2, -0.1],
+        "vol_regime": pd.Categorical(
+            ["LOW", "HIGH", "LOW", "MED", "LOW", None], categories=REGIMES, ordered=True,
+        ),
+    })
+
+
+def test_evaluate_codes_every_strategy():
+    signals = RuleSet(SPEC).evaluate(features())
+
+    assert signals["default"].dtype == np.int8
+    np.testing.assert_array_equal(signals["default"], [BUY, SELL, SELL, HOLD, HOLD, HOLD])
+    # no sell rule: never SELL
+    np.testing.assert_array_equal(signals["momentum"], [BUY, BUY, BUY, HOLD, BUY, HOLD])
+
+
+def test_sell_overrides_buy():
+    rules = RuleSet({"both": {"buy": "sharpe_60d > 0", "sell": "cagr_60d > 0"}})
+
+    codes = rules.evaluate(features())["both"]
+
+    assert codes[0] == SELL
+
+
+def test_categorical_comparisons_use_category_order():
+    rules = RuleSet({
+        "calm": {"buy": "vol_regime < 'HIGH'"},
+        "reversed": {"buy": "'MED' <= vol_regime"},
+        "unknown": {"buy": "vol_regime == 'EXTREME'"},
+    })
+
+    signals = rules.evaluate(features())
+
+    # a missing label compares as code -1, below every category
+    np.testing.assert_array_equal(signals["calm"], [BUY, HOLD, BUY, BUY, BUY, BUY])
+    np.testing.assert_array_equal(signals["reversed"], [HOLD, BUY, HOLD, BUY, HOLD, HOLD])
+    assert not signals["unknown"].any()
+
+
+@pytest.mark.parametrize("expression", [
+    "__import__('os')",
+    "sharpe_60d.real > 0",
+    "[x for x in sharpe_60d]",
+    "sharpe_60d ** 2 > 1",
+    "sharpe_60d >",
+])
+def test_unsupported_syntax_is_rejected(expression):
+    with pytest.raises(RuleError):
+        RuleSet({"bad": {"buy": expression}})
+
+
+def test_unknown_column_is_reported():
+    rules = RuleSet({"bad": {"buy": "sortino_60d > 1"}})
+
+    with pytest.raises(RuleError, match="sortino_60d"):
+        rules.evaluate(features())
+
+
+def test_empty_spec_is_rejected():
+    with pytest.raises(RuleError):
+        RuleSet({"strategies": {}})
+
+
+def test_row_evaluator_matches_evaluate():
+    rules = RuleSet(SPEC)
+    df = features()
+    expected = rules.evaluate(df)
+
+    evaluate_row = rules.row_evaluator({"vol_regime": REGIMES})
+    for i, record in enumerate(df.astype(object).where(df.notna(), None).to_dict("records")):
+        row = evaluate_row(record)
+        assert row == {name: codes[i] for name, codes in expected.items()}
+
+
+def test_codes_round_trip_through_labels():
+    codes = np.array([BUY, HOLD, SELL], dtype=np.int8)
+
+    labels = to_categorical(codes)
+
+    assert list(labels) == ["BUY", "HOLD", "SELL"]
+    np.testing.assert_array_equal(to_codes(labels), codes)
+    np.testing.assert_array_equal(to_codes(["BUY", "HOLD", "SELL", None]), [BUY, HOLD, SELL, HOLD])
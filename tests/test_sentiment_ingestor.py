@@ -0,0 +1,69 @@
+import json
+
+import pandas as pd
+import pytest
+
+from src.ingestion.sentiment_ingestor import FileHeadlineFeed, SentimentIngestor
+from src.ingestion.watermark_store import WatermarkStore
+
+
+def write_feed(workspace, records, name: str = "feed.jsonl"):
+    path = workspace / name
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+    return FileHeadlineFeed(path)
+
+
+def ingest(feed, watermarks=None) -> pd.DataFrame:
+    ingestor = SentimentIngestor(feed, watermarks=watermarks, max_batch_latency=0.01)
+    summary = ingestor.run()
+    if not summary["files"]:
+        return pd.DataFrame()
+    return pd.concat((pd.read_parquet(p) for p in summary["files"]), ignore_index=True)
+
+
+def test_fields_mixing_numbers_and_text_are_stored_as_text(workspace):
+    feed = write_feed(workspace, [
+        {"id": 1, "timestamp": "2024-01-02T10:00:00", "headline": "Acme beats estimates", "price": 10.5},
+        {"id": "x2", "timestamp": "2024-01-02T10:01:00", "headline": "Acme misses", "price": "n/a"},
+        {"id": None, "timestamp": "2024-01-02T10:02:00", "headline": "Acme rallies", "price": None},
+    ])
+
+    stored = ingest(feed)
+
+    assert stored["id"].tolist() == ["1", "x2", None]
+    assert stored["price"].tolist() == ["10.5", "n/a", None]
+    assert stored["sentiment"].notna().all()
+
+
+def test_mixed_types_across_batches_of_one_file(workspace):
+    # one batch per line: each frame has its own column type
+    records = [
+        {"id": 1, "timestamp": "2024-01-02T10:00:00", "headline": "Acme gains"},
+        {"id": "x2", "timestamp": "2024-01-02T10:01:00", "headline": "Acme drops"},
+    ]
+    feed = write_feed(workspace, records)
+    feed.chunk_bytes = 1
+
+    stored = ingest(feed)
+
+    assert sorted(stored["id"]) == ["1", "x2"]
+
+
+@pytest.mark.parametrize("watermark", [None, "2024-01-02T09:00:00"])
+def test_unparseable_timestamps_are_kept_with_or_without_a_watermark(workspace, watermark):
+    watermarks = WatermarkStore()
+    if watermark:
+        watermarks.set("sentiment", "headlines", watermark)
+    feed = write_feed(workspace, [
+        {"timestamp": "2024-01-02T08:00:00", "headline": "Stale news"},
+        {"timestamp": "yesterday-ish", "headline": "Acme halts production"},
+        {"timestamp": "2024-01-02T10:00:00", "headline": "Acme surges"},
+    ])
+
+    stored = ingest(feed, watermarks)
+
+    expected = {"Acme halts production", "Acme surges"}
+    if watermark is None:
+        expected.add("Stale news")
+    assert set(stored["headline"]) == expected
+    assert watermarks.get("sentiment", "headlines") == "2024-01-02T10:00:00"
@@ -0,0 +1,172 @@
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import pandas as pd
+import pytest
+import requests
+
+from src.sources import providers
+from src.sources.http_session import RetryPolicy
+from src.sources.providers import BAR_COLUMNS
+
+
+def chart(n_bars: int) -> bytes:
+    stamps = pd.bdate_range("2024-01-02", periods=n_bars) + pd.Timedelta(hours=14, minutes=30)
+    close = [100.0 + i for i in range(n_bars)]
+    result = {"meta": {"exchangeTimezoneName": "America/New_York"}, "indicators": {"quote": [{}]}}
+    if n_bars:
+        result["timestamp"] = (stamps.asi8 // 10 ** 9).tolist()
+        result["indicators"] = {
+            "quote": [{"open": close, "high": close, "low": close, "close": close, "volume": [1_000] * n_bars}],
+            "adjclose": [{"adjclose": close}],
+        }
+    return json.dumps({"chart": {"error": None, "result": [result]}}).encode()
+
+
+class Stub(BaseHTTPRequestHandler):
+    """
+    Yahoo chart, Stooq CSV and FRED CSV endpoints. The first `failures` requests
+    get a 503; every response carries an ETag and honours If-None-Match.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    failures = 0
+    bars = 5
+    hits = []
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, body: bytes = b"", headers: dict = None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        Stub.hits.append(self.path)
+        if Stub.failures > 0:
+            Stub.failures -= 1
+            return self._send(503, headers={"Retry-After": "0"})
+
+        url = urlparse(self.path)
+        if url.path.startswith("/v8/finance/chart/"):
+            body = chart(Stub.bars)
+        elif url.path == "/q/d/l/":
+            body = b"Date,Open,High,Low,Close,Volume\n2024-01-02,1,1,1,1,100\n" if Stub.bars else b"No data"
+        elif url.path == "/graph/fredgraph.csv":
+            body = b"observation_date,DFF\n2024-01-02,5.33\n"
+        else:
+            return self._send(404)
+
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        if self.headers.get("If-None-Match") == etag:
+            return self._send(304, headers={"ETag": etag})
+        self._send(200, body, {"ETag": etag})
+
+
+@pytest.fixture
+def stub(tmp_path):
+    Stub.failures, Stub.bars, Stub.hits = 0, 5, []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Stub)
+    threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    providers.configure(
+        rate_limiters={},
+        ttl=3600,
+        cache_dir=tmp_path / "http",
+        base_urls={name: base_url for name in providers.SOURCE_TYPES},
+        retry=RetryPolicy(max_retries=3, backoff=0.001, seed=7),
+    )
+    yield Stub
+    providers.configure()
+    server.shutdown()
+    server.server_close()
+
+
+def test_transient_errors_are_retried(stub):
+    stub.failures = 2
+    yahoo = providers.get_source("yahoo")
+
+    df = yahoo.fetch("AAPL")
+
+    assert len(df) == 5
+    assert yahoo.session.stats["retries"] == 2
+    assert len(stub.hits) == 3
+
+
+def test_retries_give_up_with_the_last_error(stub):
+    stub.failures = 10
+
+    with pytest.raises(requests.HTTPError):
+        providers.get_source("yahoo").fetch("AAPL")
+    assert len(stub.hits) == 4
+
+
+def test_full_download_is_served_from_cache(stub):
+    yahoo = providers.get_source("yahoo")
+
+    first = yahoo.fetch("AAPL")
+    second = yahoo.fetch("AAPL")
+
+    pd.testing.assert_frame_equal(first, second)
+    assert yahoo.session.stats["cache_hits"] == 1
+    assert len(stub.hits) == 1
+
+
+def test_stale_entry_is_revalidated(stub):
+    yahoo = providers.get_source("yahoo")
+    yahoo.fetch("AAPL")
+    yahoo.session.ttl = 1e-9
+
+    assert len(yahoo.fetch("AAPL")) == 5
+    assert yahoo.session.stats["revalidated"] == 1
+
+
+@pytest.mark.parametrize("name, symbol", [("yahoo", "AAPL"), ("stooq", "AAPL"), ("fred", "DFF")])
+def test_incremental_requests_bypass_the_cache(stub, name, symbol):
+    source = providers.get_source(name)
+
+    source.fetch(symbol, start="2024-01-01")
+    source.fetch(symbol, start="2024-01-01")
+
+    assert source.session.stats["cache_hits"] == 0
+    assert len(stub.hits) == 2
+
+
+@pytest.mark.parametrize("name, symbol", [("stooq", "AAPL"), ("fred", "DFF")])
+def test_full_csv_download_is_served_from_cache(stub, name, symbol):
+    source = providers.get_source(name)
+
+    source.fetch(symbol)
+    source.fetch(symbol)
+
+    assert source.session.stats["cache_hits"] == 1
+    assert len(stub.hits) == 1
+
+
+def test_incremental_window_without_bars_is_empty(stub):
+    stub.bars = 0
+
+    yahoo = providers.get_source("yahoo").fetch("AAPL", start="2024-01-01")
+    stooq = providers.get_source("stooq").fetch("AAPL", start="2024-01-01")
+
+    for df in (yahoo, stooq):
+        assert df.empty
+        assert list(df.columns) == BAR_COLUMNS
+
+
+def test_full_download_without_bars_raises(stub):
+    stub.bars = 0
+
+    with pytest.raises(ValueError):
+        providers.get_source("yahoo").fetch("AAPL")
+    with pytest.raises(ValueError):
+        providers.get_source("stooq").fetch("AAPL")
@@ -0,0 +1,63 @@
+import pytest
+
+from src.pipeline.stage_cache import StageCache
+
+
+@pytest.fixture
+def cache(workspace):
+    return StageCache(db_path=workspace / "metadata" / "stage_cache.db", max_bytes=10)
+
+
+def stage(workspace, name: str, size: int = 8):
+    """
+    compute() writing a `size`-byte output, and the input it reads.
+    """
+    source = workspace / f"{name}.in"
+    source.write_text(name)
+
+    def compute():
+        out = workspace / f"{name}.out"
+        out.write_bytes(b"x" * size)
+        return out
+
+    return compute, [source]
+
+
+def test_put_does_not_evict_while_the_run_is_going(workspace, cache):
+    outputs = []
+    for name in ("a", "b", "c"):
+        compute, inputs = stage(workspace, name)
+        outputs.append(cache.run(name, compute, inputs))
+
+    # 24 bytes over a 10-byte limit, but every entry is still there
+    assert all(path.exists() for path in outputs)
+    for name in ("a", "b", "c"):
+        compute, inputs = stage(workspace, name)
+        assert cache.get(cache.key(name, inputs, None)) is not None
+
+
+def test_evict_spares_entries_the_run_used(workspace, cache):
+    compute, inputs = stage(workspace, "old")
+    cache.run("old", compute, inputs)
+
+    # A later run that only uses "new"
+    later = StageCache(db_path=cache.db_path, max_bytes=10)
+    compute, new_inputs = stage(workspace, "new")
+    served = later.run("new", compute, new_inputs)
+    later.evict()
+
+    assert later.get(later.key("old", inputs, None)) is None
+    assert later.get(later.key("new", new_inputs, None)) is not None
+    assert served.exists()
+
+
+def test_hits_are_pinned_too(workspace, cache):
+    compute, inputs = stage(workspace, "a")
+    cache.run("a", compute, inputs)
+
+    later = StageCache(db_path=cache.db_path, max_bytes=0, max_age_days=0)
+    hit = later.run("a", compute, inputs)
+    later.evict()
+
+    assert hit.exists()
+    assert later.get(later.key("a", inputs, None)) is not None
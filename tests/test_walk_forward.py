@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.walk_forward import WalkForwardBacktester, walk_forward_splits
+
+
+def features(tickers=("AAA", "BBB"), n: int = 400, seed: int = 5) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    frames = []
+    for ticker in tickers:
+        frames.append(pd.DataFrame({
+            "Date": pd.bdate_range("2022-01-03", periods=n),
+            "Ticker": ticker,
+            "Adj Close": 100 * np.cumprod(1 + rng.normal(0, 0.01, n)),
+            "sharpe_60d": rng.normal(0.5, 1.0, n),
+            "cagr_60d": rng.normal(0.05, 0.1, n),
+            "vol_60d": rng.uniform(0.1, 0.4, n),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def backtester(path=None, **kwargs) -> WalkForwardBacktester:
+    options = {"train_bars": 120, "test_bars": 40, "bar_freq": "1d", **kwargs}
+    return WalkForwardBacktester(path or "unused.parquet", **options)
+
+
+def test_rolling_splits():
+    assert walk_forward_splits(10, train_bars=4, test_bars=2) == [
+        (0, 4, 4, 6), (2, 6, 6, 8), (4, 8, 8, 10),
+    ]
+
+
+def test_expanding_splits_with_gap_and_step():
+    assert walk_forward_splits(12, train_bars=4, test_bars=2, mode="expanding", step=3, gap=1) == [
+        (0, 4, 5, 7), (0, 7, 8, 10),
+    ]
+
+
+def test_splits_never_overlap_their_test_window():
+    for train_start, train_end, test_start, test_end in walk_forward_splits(
+        500, train_bars=120, test_bars=40, gap=5
+    ):
+        assert train_start < train_end <= test_start - 5 < test_end
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        walk_forward_splits(10, 4, 2, mode="anchored")
+
+
+def test_history_too_short_is_rejected():
+    wf = backtester(train_bars=500)
+    with pytest.raises(ValueError, match="too short"):
+        wf.evaluate(wf.to_matrices(features()))
+
+
+def test_process_pool_matches_in_process_run():
+    df = features()
+    serial = backtester(max_workers=1)
+    pooled = backtester(max_workers=2, chunk_size=2)
+
+    expected = serial.evaluate(serial.to_matrices(df))
+    result = pooled.evaluate(pooled.to_matrices(df))
+
+    sort = ["fold", "Ticker"]
+    pd.testing.assert_frame_equal(
+        result.sort_values(sort).reset_index(drop=True),
+        expected.sort_values(sort).reset_index(drop=True),
+    )
+    assert set(expected["Ticker"]) == {"AAA", "BBB"}
+
+
+def test_fitted_parameters_ignore_the_test_window():
+    df = features()
+    wf = backtester(max_workers=1)
+    dates = np.sort(df["Date"].unique())
+
+    # Scramble everything from the first test bar on
+    tampered = df.copy()
+    later = tampered["Date"] >= dates[wf.train_bars]
+    for column in ("Adj Close", "sharpe_60d", "cagr_60d", "vol_60d"):
+        tampered.loc[later, column] = tampered.loc[later, column].to_numpy()[::-1] * 3
+
+    clean = wf.evaluate(wf.to_matrices(df))
+    dirty = wf.evaluate(wf.to_matrices(tampered))
+
+    fitted = ["Ticker", "low_edge", "high_edge", "buy_sharpe", "sell_sharpe", "train_Sharpe"]
+    first = lambda folds: folds[folds["fold"] == 0][fitted].reset_index(drop=True)
+    pd.testing.assert_frame_equal(first(dirty), first(clean))
+    assert not np.allclose(
+        dirty.loc[dirty["fold"] == 0, "test_Sharpe"], clean.loc[clean["fold"] == 0, "test_Sharpe"]
+    )
+
+
+def test_fold_dates_follow_the_bar_bounds():
+    df = features()
+    wf = backtester(max_workers=1)
+
+    folds = wf.evaluate(wf.to_matrices(df))
+
+    assert (folds["train_end"] < folds["test_start"]).all()
+    assert (folds["test_start"] <= folds["test_end"]).all()
+    first = folds[folds["fold"] == 0].iloc[0]
+    dates = np.sort(df["Date"].unique())
+    assert first["train_start"] == dates[0]
+    assert first["test_start"] == dates[wf.train_bars]
+
+
+def test_run_writes_every_fold(workspace):
+    path = workspace / "features.parquet"
+    features().to_parquet(path, index=False)
+
+    out = backtester(path, max_workers=1).run()
+
+    folds = pd.read_parquet(out)
+    assert folds["fold"].nunique() == len(walk_forward_splits(400, 120, 40))
+    assert set(folds["Ticker"]) == {"AAA", "BBB"}
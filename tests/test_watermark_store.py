@@ -0,0 +1,22 @@
+from src.ingestion.watermark_store import WatermarkStore
+
+
+def test_watermark_never_moves_backwards(tmp_path):
+    store = WatermarkStore(tmp_path / "watermarks.json")
+    store.set("equities", "AAPL", "2024-01-05T00:00:00")
+    store.set("equities", "AAPL", "2024-01-04T00:00:00")
+
+    assert store.get("equities", "AAPL") == "2024-01-05T00:00:00"
+
+
+def test_watermarks_with_different_offsets_compare_in_utc(tmp_path):
+    store = WatermarkStore(tmp_path / "watermarks.json")
+    store.set("sentiment", "news", "2024-01-05T10:00:00+00:00")
+
+    # Earlier as a string, but 15:00 UTC
+    store.set("sentiment", "news", "2024-01-05T10:00:00-05:00")
+    assert store.get("sentiment", "news") == "2024-01-05T10:00:00-05:00"
+
+    # Later as a string, but 09:00 UTC
+    store.set("sentiment", "news", "2024-01-05T11:00:00+02:00")
+    assert store.get("sentiment", "news") == "2024-01-05T10:00:00-05:00"